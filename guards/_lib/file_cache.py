@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""VibeGuard Guard — persistent per-file result cache
+
+Guards that derive something expensive from a single file (imports, AST
+definitions) store the result here, keyed by the file's content hash. A
+matching mtime/size pair skips even the read; a changed stat with unchanged
+content (checkout, touch) costs one read and hash but no re-parse.
+
+The cache lives next to the file index under .vibeguard/cache/ and is
+versioned, so a guard that changes its derived format just bumps its version.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import sys
+from pathlib import Path
+from typing import Any, Callable
+
+from file_index import cache_file, read_json, write_json_atomic
+
+CACHE_SCHEMA = 1
+
+# Returned by FileCache.lookup() when the caller has to read the file.
+MISS = object()
+
+
+class FileCache:
+    """Content-hash keyed cache of per-file results for one guard and root."""
+
+    def __init__(self, root: str | Path, name: str, version: str, enabled: bool = True):
+        # Results derived from ast depend on the interpreter's grammar.
+        self.version = f"{CACHE_SCHEMA}:{version}:py{sys.version_info[0]}.{sys.version_info[1]}"
+        self.path = cache_file(root, name) if enabled else None
+        self.hits = 0
+        self.misses = 0
+        self._entries: dict[str, dict] = {}
+        self._seen: set[str] = set()
+        self._dirty = False
+        if self.path is not None:
+            data = read_json(self.path)
+            if data and data.get("version") == self.version and isinstance(data.get("entries"), dict):
+                self._entries = data["entries"]
+
+    @property
+    def enabled(self) -> bool:
+        return self.path is not None
+
+    def get(
+        self,
+        key: str,
+        file_path: str | Path,
+        compute: Callable[[bytes], Any],
+        stat: tuple[int, int] | None = None,
+    ) -> Any:
+        """Return compute(content) for file_path, reusing a cached result when possible.
+
+        key is the file's project-relative path; stat is an optional
+        (mtime_ns, size) pair already known to the caller. Returns None when
+        the file cannot be read.
+        """
+        if stat is None:
+            try:
+                st = os.stat(file_path)
+            except OSError:
+                return None
+            stat = (st.st_mtime_ns, st.st_size)
+
+        value = self.lookup(key, stat)
+        if value is not MISS:
+            return value
+        try:
+            with open(file_path, "rb") as fh:
+                content = fh.read()
+        except OSError:
+            return None
+        digest = hashlib.sha256(content).hexdigest()
+        if digest == self.known_digest(key):
+            return self.record(key, stat, digest)
+        return self.record(key, stat, digest, compute(content))
+
+    # The steps of get(), for callers that read and parse in worker processes:
+    # lookup() in the parent, hash (and parse only if the digest differs from
+    # known_digest()) in the worker, then record() back in the parent.
+
+    def lookup(self, key: str, stat: tuple[int, int]) -> Any:
+        """Cached value when the file's (mtime_ns, size) is unchanged, else MISS."""
+        self._seen.add(key)
+        entry = self._entries.get(key)
+        if entry is not None and (entry.get("mtime_ns"), entry.get("size")) == tuple(stat):
+            self.hits += 1
+            return entry.get("value")
+        return MISS
+
+    def peek(self, key: str) -> Any:
+        """Cached value without checking the file at all, else MISS.
+
+        For changed-files mode, where files outside the diff are trusted to
+        match what the last full run recorded.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return MISS
+        self._seen.add(key)
+        self.hits += 1
+        return entry.get("value")
+
+    def known_digest(self, key: str) -> str | None:
+        entry = self._entries.get(key)
+        return entry.get("sha256") if entry is not None else None
+
+    def record(self, key: str, stat: tuple[int, int], digest: str, value: Any = MISS) -> Any:
+        """Store a freshly computed value, or pass MISS when digest matched known_digest()."""
+        self._seen.add(key)
+        entry = self._entries.get(key)
+        if value is MISS:
+            # Content unchanged behind a new stat: refresh the stat, keep the value.
+            self.hits += 1
+            entry["mtime_ns"], entry["size"] = stat
+            self._dirty = True
+            return entry.get("value")
+
+        self.misses += 1
+        if self.enabled:
+            self._entries[key] = {
+                "mtime_ns": stat[0],
+                "size": stat[1],
+                "sha256": digest,
+                "value": value,
+            }
+            self._dirty = True
+        return value
+
+    def save(self, prune: bool = False) -> None:
+        """Persist the cache. prune drops entries not looked up in this run."""
+        if self.path is None:
+            return
+        if prune:
+            stale = self._entries.keys() - self._seen
+            for key in stale:
+                del self._entries[key]
+            self._dirty = self._dirty or bool(stale)
+        if self._dirty:
+            write_json_atomic(self.path, {"version": self.version, "entries": self._entries})
+            self._dirty = False
+
+    def summary(self) -> str:
+        if not self.enabled:
+            return "disabled (--no-cache)"
+        return f"{self.hits} hits, {self.misses} misses"
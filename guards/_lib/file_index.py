@@ -0,0 +1,475 @@
+#!/usr/bin/env python3
+"""VibeGuard Guard — shared repository file index
+
+Walk a project tree once and hand every Python guard the same file list.
+The walk honours one merged skip list plus .gitignore files, is memoized per
+process, and is persisted under .vibeguard/cache/ so the next guard process
+only re-stats directories instead of re-listing and re-matching them.
+
+usage:
+    python3 file_index.py [target_dir]   # report cold and warm walk timings
+
+Guards import it from guards/_lib:
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "_lib"))
+    from file_index import FileIndex
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Iterable, NamedTuple
+
+INDEX_VERSION = 2
+
+# Directories no guard ever wants to read. Guard-specific exclusions such as
+# tests/ or archive/ stay in each guard and are passed as exclude_dirs.
+SKIP_DIRS: frozenset[str] = frozenset(
+    {
+        ".git",
+        ".venv",
+        ".vibeguard",
+        ".mypy_cache",
+        ".pytest_cache",
+        ".ruff_cache",
+        ".tox",
+        "__pycache__",
+        "build",
+        "dist",
+        "node_modules",
+        "target",
+        "vendor",
+    }
+)
+
+
+def project_root(path: str | Path) -> Path:
+    """Nearest ancestor holding .git, so scanning a subdirectory shares one cache."""
+    start = Path(os.path.realpath(path))
+    for candidate in (start, *start.parents):
+        if (candidate / ".git").exists():
+            return candidate
+    return start
+
+
+def cache_dir(root: str | Path) -> Path:
+    """Return the guard cache directory for a project, creating it on demand.
+
+    VIBEGUARD_GUARD_CACHE_DIR overrides the default <project>/.vibeguard/cache.
+    A '*' .gitignore is dropped inside so the cache never shows up as
+    untracked project content.
+    """
+    override = os.environ.get("VIBEGUARD_GUARD_CACHE_DIR", "").strip()
+    path = Path(override) if override else project_root(root) / ".vibeguard" / "cache"
+    try:
+        path.mkdir(parents=True, exist_ok=True)
+        ignore_file = path / ".gitignore"
+        if not ignore_file.exists():
+            ignore_file.write_text("*\n", encoding="utf-8")
+    except OSError:
+        pass
+    return path
+
+
+def write_json_atomic(path: Path, data: object) -> None:
+    """Write JSON via temp file + os.replace(); cache writes are best effort."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}-", suffix=".tmp")
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            json.dump(data, fh, separators=(",", ":"))
+        os.replace(tmp_name, path)
+    except OSError:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+
+
+def cache_file(root: str | Path, name: str) -> Path:
+    """Per-root cache file, so several scanned roots can share one cache dir."""
+    resolved = os.path.realpath(root)
+    digest = hashlib.sha256(resolved.encode("utf-8")).hexdigest()[:12]
+    return cache_dir(resolved) / f"{name}-{digest}.json"
+
+
+def read_json(path: Path) -> dict | None:
+    try:
+        with path.open(encoding="utf-8") as fh:
+            data = json.load(fh)
+    except (OSError, ValueError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+# ---------------------------------------------------------------------------
+# .gitignore matching
+# ---------------------------------------------------------------------------
+
+def _glob_to_regex(pattern: str) -> str:
+    out = []
+    i = 0
+    while i < len(pattern):
+        if pattern.startswith("**/", i):
+            out.append("(?:.*/)?")
+            i += 3
+        elif pattern.startswith("/**", i) and i + 3 == len(pattern):
+            out.append("/.*")
+            i += 3
+        elif pattern.startswith("**", i):
+            out.append(".*")
+            i += 2
+        elif pattern[i] == "*":
+            out.append("[^/]*")
+            i += 1
+        elif pattern[i] == "?":
+            out.append("[^/]")
+            i += 1
+        elif pattern[i] == "[":
+            end = pattern.find("]", i + 1)
+            if end == -1:
+                out.append(re.escape(pattern[i]))
+                i += 1
+            else:
+                body = pattern[i + 1 : end].replace("\\", "\\\\")
+                if body.startswith("!"):
+                    body = "^" + body[1:]
+                out.append(f"[{body}]")
+                i = end + 1
+        else:
+            out.append(re.escape(pattern[i]))
+            i += 1
+    return "".join(out)
+
+
+class IgnoreRule(NamedTuple):
+    regex: re.Pattern[str]
+    negate: bool
+    dir_only: bool
+    anchored: bool
+
+
+def parse_gitignore(path: Path) -> list[IgnoreRule]:
+    rules: list[IgnoreRule] = []
+    try:
+        lines = path.read_text(encoding="utf-8", errors="replace").splitlines()
+    except OSError:
+        return rules
+    for raw in lines:
+        line = raw.rstrip()
+        if not line or line.startswith("#"):
+            continue
+        negate = line.startswith("!")
+        if negate:
+            line = line[1:]
+        if line.startswith("\\"):
+            line = line[1:]
+        dir_only = line.endswith("/")
+        line = line.rstrip("/")
+        if not line:
+            continue
+        anchored = "/" in line
+        line = line.lstrip("/")
+        rules.append(IgnoreRule(re.compile(_glob_to_regex(line) + r"\Z"), negate, dir_only, anchored))
+    return rules
+
+
+def is_ignored(rel_path: str, is_dir: bool, scopes: list[tuple[str, list[IgnoreRule]]]) -> bool:
+    """Apply stacked .gitignore scopes (outermost first); the last match wins."""
+    ignored = False
+    for base, rules in scopes:
+        if base:
+            if not rel_path.startswith(base + "/"):
+                continue
+            local = rel_path[len(base) + 1 :]
+        else:
+            local = rel_path
+        name = local.rsplit("/", 1)[-1]
+        for rule in rules:
+            if rule.dir_only and not is_dir:
+                continue
+            if rule.regex.match(local if rule.anchored else name):
+                ignored = not rule.negate
+    return ignored
+
+
+# ---------------------------------------------------------------------------
+# Index
+# ---------------------------------------------------------------------------
+
+class FileEntry(NamedTuple):
+    rel: str
+    mtime_ns: int
+    size: int
+
+
+class FileIndex:
+    """Sorted file list for one project root, shared by all guards."""
+
+    _memo: dict[str, "FileIndex"] = {}
+
+    def __init__(self, root: Path, entries: list[FileEntry], walk_ms: float, warm: bool) -> None:
+        self.root = root
+        self.entries = entries
+        self.walk_ms = walk_ms
+        self.warm = warm
+
+    @classmethod
+    def load(cls, root: str | Path, use_cache: bool = True) -> "FileIndex":
+        """Return the index for root: in-process memo, then disk cache, then cold walk."""
+        resolved = Path(os.path.realpath(root))
+        key = str(resolved)
+        if use_cache and key in cls._memo:
+            return cls._memo[key]
+        start = time.perf_counter()
+        index_path = cache_file(resolved, "file-index") if use_cache else None
+        cached = read_json(index_path) if index_path is not None else None
+        walker = _Walker(resolved, cached if _cache_usable(cached, key) else None)
+        entries = walker.walk()
+        walk_ms = (time.perf_counter() - start) * 1000
+        index = cls(resolved, entries, walk_ms, walker.warm)
+        if index_path is not None:
+            if walker.changed:
+                write_json_atomic(index_path, walker.snapshot(key))
+            cls._memo[key] = index
+        return index
+
+    @classmethod
+    def load_persisted(cls, root: str | Path) -> "FileIndex | None":
+        """The listing persisted by the last load(), without touching the tree.
+
+        Entries carry no stat (mtime_ns and size are -1). Returns None when
+        root was never indexed. Changed-files mode uses this for cross-file
+        context and stats only the files it re-analyses.
+        """
+        resolved = Path(os.path.realpath(root))
+        key = str(resolved)
+        if key in cls._memo:
+            return cls._memo[key]
+        start = time.perf_counter()
+        cached = read_json(cache_file(resolved, "file-index"))
+        if not _cache_usable(cached, key):
+            return None
+        dirs = cached["dirs"]
+        entries: list[FileEntry] = []
+        pending = [""]
+        while pending:
+            rel_dir = pending.pop()
+            info = dirs.get(rel_dir)
+            if info is None:
+                continue
+            prefix = f"{rel_dir}/" if rel_dir else ""
+            entries.extend(FileEntry(prefix + name, -1, -1) for name in info["files"])
+            pending.extend(prefix + name for name in info["subdirs"])
+        entries.sort()
+        return cls(resolved, entries, (time.perf_counter() - start) * 1000, True)
+
+    def files(
+        self,
+        suffixes: Iterable[str] | None = None,
+        exclude_dirs: Iterable[str] = (),
+    ) -> list[FileEntry]:
+        wanted = set(suffixes) if suffixes is not None else None
+        excluded = set(exclude_dirs)
+        selected = []
+        for entry in self.entries:
+            if wanted is not None and os.path.splitext(entry.rel)[1] not in wanted:
+                continue
+            if excluded and any(part in excluded for part in entry.rel.split("/")[:-1]):
+                continue
+            selected.append(entry)
+        return selected
+
+    def paths(
+        self,
+        suffixes: Iterable[str] | None = None,
+        exclude_dirs: Iterable[str] = (),
+    ) -> list[Path]:
+        return [self.root / entry.rel for entry in self.files(suffixes, exclude_dirs)]
+
+
+def _cache_usable(cached: dict | None, root_key: str) -> bool:
+    return bool(
+        cached
+        and cached.get("version") == INDEX_VERSION
+        and cached.get("root") == root_key
+        and isinstance(cached.get("dirs"), dict)
+    )
+
+
+class _Walker:
+    """One directory walk; reuses a directory's cached listing while its mtime holds.
+
+    Ignore rules are matched on paths relative to project_root(), so a walk of
+    a subdirectory also honours the .gitignore files of its parents.
+    """
+
+    def __init__(self, root: Path, cached: dict | None) -> None:
+        self.root = root
+        rel_root = os.path.relpath(root, project_root(root))
+        self.prefix = "" if rel_root == "." else rel_root.replace(os.sep, "/")
+        self.cached_dirs: dict[str, dict] = cached["dirs"] if cached else {}
+        self.dirs: dict[str, dict] = {}
+        self.entries: list[FileEntry] = []
+        self.warm = cached is not None
+        self.changed = cached is None
+        if cached is not None and not self._gitignores_unchanged(cached.get("gitignores", {})):
+            self.cached_dirs = {}
+            self.warm = False
+            self.changed = True
+
+    def _gitignores_unchanged(self, recorded: dict) -> bool:
+        # A recorded None is a parent .gitignore that did not exist.
+        for rel, mtime_ns in recorded.items():
+            try:
+                if os.stat(self.root / rel).st_mtime_ns != mtime_ns:
+                    return False
+            except OSError:
+                if mtime_ns is not None:
+                    return False
+        return True
+
+    def _ignore_path(self, rel: str) -> str:
+        """rel (relative to the walk root) as a path relative to the project root."""
+        if not self.prefix:
+            return rel
+        return f"{self.prefix}/{rel}" if rel else self.prefix
+
+    def _parent_gitignores(self) -> list[tuple[str, str]]:
+        """(scope base, path relative to the walk root) of each .gitignore above the walk root."""
+        if not self.prefix:
+            return []
+        parts = self.prefix.split("/")
+        return [
+            ("/".join(parts[:depth]), "/".join([".."] * (len(parts) - depth) + [".gitignore"]))
+            for depth in range(len(parts))
+        ]
+
+    def walk(self) -> list[FileEntry]:
+        scopes: list[tuple[str, list[IgnoreRule]]] = []
+        for base, rel in self._parent_gitignores():
+            rules = parse_gitignore(self.root / rel)
+            if rules:
+                scopes.append((base, rules))
+        self._walk_dir("", scopes, True)
+        self.entries.sort()
+        return self.entries
+
+    def _walk_dir(self, rel_dir: str, scopes: list[tuple[str, list[IgnoreRule]]], use_cached: bool) -> None:
+        abs_dir = self.root / rel_dir if rel_dir else self.root
+        try:
+            dir_mtime = os.stat(abs_dir).st_mtime_ns
+        except OSError:
+            self.changed = True
+            return
+        cached = self.cached_dirs.get(rel_dir) if use_cached else None
+        if cached is not None and cached.get("mtime_ns") == dir_mtime:
+            files, subdirs = cached["files"], cached["subdirs"]
+            if cached.get("gitignore"):
+                scopes = scopes + [(self._ignore_path(rel_dir), parse_gitignore(abs_dir / ".gitignore"))]
+        else:
+            self.changed = True
+            files, subdirs, scopes = self._list_dir(abs_dir, rel_dir, scopes)
+        has_gitignore = any(base == self._ignore_path(rel_dir) for base, _ in scopes)
+        # A .gitignore that appeared or vanished re-scopes every cached subtree.
+        if cached is not None and bool(cached.get("gitignore")) != has_gitignore:
+            use_cached = False
+        self.dirs[rel_dir] = {
+            "mtime_ns": dir_mtime,
+            "files": files,
+            "subdirs": subdirs,
+            "gitignore": has_gitignore,
+        }
+        for name in files:
+            rel = f"{rel_dir}/{name}" if rel_dir else name
+            try:
+                st = os.stat(abs_dir / name)
+            except OSError:
+                self.changed = True
+                continue
+            self.entries.append(FileEntry(rel, st.st_mtime_ns, st.st_size))
+        for name in subdirs:
+            self._walk_dir(f"{rel_dir}/{name}" if rel_dir else name, scopes, use_cached)
+
+    def _list_dir(
+        self,
+        abs_dir: Path,
+        rel_dir: str,
+        scopes: list[tuple[str, list[IgnoreRule]]],
+    ) -> tuple[list[str], list[str], list[tuple[str, list[IgnoreRule]]]]:
+        files: list[str] = []
+        subdirs: list[str] = []
+        try:
+            with os.scandir(abs_dir) as it:
+                dir_entries = sorted(it, key=lambda e: e.name)
+        except OSError:
+            return files, subdirs, scopes
+        if any(e.name == ".gitignore" for e in dir_entries):
+            rules = parse_gitignore(abs_dir / ".gitignore")
+            if rules:
+                scopes = scopes + [(self._ignore_path(rel_dir), rules)]
+        for entry in dir_entries:
+            rel = self._ignore_path(f"{rel_dir}/{entry.name}" if rel_dir else entry.name)
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name in SKIP_DIRS or is_ignored(rel, True, scopes):
+                        continue
+                    subdirs.append(entry.name)
+                elif entry.is_file():
+                    if not is_ignored(rel, False, scopes):
+                        files.append(entry.name)
+            except OSError:
+                continue
+        return files, subdirs, scopes
+
+    def snapshot(self, root_key: str) -> dict:
+        gitignores: dict[str, int | None] = {}
+        for _base, rel in self._parent_gitignores():
+            try:
+                gitignores[rel] = os.stat(self.root / rel).st_mtime_ns
+            except OSError:
+                gitignores[rel] = None
+        for rel_dir, info in self.dirs.items():
+            if info["gitignore"]:
+                rel = f"{rel_dir}/.gitignore" if rel_dir else ".gitignore"
+                try:
+                    gitignores[rel] = os.stat(self.root / rel).st_mtime_ns
+                except OSError:
+                    continue
+        return {"version": INDEX_VERSION, "root": root_key, "dirs": self.dirs, "gitignores": gitignores}
+
+
+def main() -> int:
+    target_dir = Path(sys.argv[1] if len(sys.argv) > 1 else ".").resolve()
+    if not target_dir.is_dir():
+        print(f"[ERR] Target directory not found: {target_dir}")
+        return 1
+
+    index_path = cache_file(target_dir, "file-index")
+    try:
+        index_path.unlink()
+    except OSError:
+        pass
+    cold = FileIndex.load(target_dir)
+    FileIndex._memo.clear()
+    warm = FileIndex.load(target_dir)
+
+    print(f"Scan directory: {target_dir}")
+    print(f"Indexed files: {len(cold.entries)}")
+    print(f"Cold walk: {cold.walk_ms:.1f} ms")
+    print(f"Warm walk: {warm.walk_ms:.1f} ms ({'disk cache' if warm.warm else 'no cache'})")
+    print(f"Index file: {index_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""VibeGuard Guard — MinHash signatures and LSH banding
+
+Near-duplicate search over token shingles: each item is reduced to a
+fixed-length MinHash signature whose positional agreement estimates the
+Jaccard similarity of the shingle sets, and LSH banding proposes candidate
+pairs without comparing every item against every other.
+
+Signatures use one-permutation MinHash with rotation densification: a
+single hash per shingle picks a bin and a rank, each bin keeps its minimum
+rank, and empty bins borrow from the next filled bin to the right. That is
+one hash per shingle instead of one per shingle per slot, which keeps pure
+Python fast enough for 100k functions.
+
+Signatures are deterministic across processes and machines (fixed seed,
+crc32 shingle hashes), so guards can cache them.
+"""
+
+from __future__ import annotations
+
+import random
+import zlib
+from collections import defaultdict
+from typing import Iterable, Sequence
+
+NUM_PERM = 64
+SHINGLE_SIZE = 5
+
+# One universal hash h(x) = (a * x + b) mod p over the Mersenne prime 2**61 - 1.
+_PRIME = (1 << 61) - 1
+_rng = random.Random(0x5EED)
+_A = _rng.randrange(1, _PRIME)
+_B = _rng.randrange(0, _PRIME)
+# Borrowed slots add distance * _OFFSET so they never equal a real rank.
+_OFFSET = 1 << 62
+
+
+def shingle_hashes(tokens: Sequence[str], size: int = SHINGLE_SIZE) -> set[int]:
+    """crc32 of every run of `size` consecutive tokens (one shingle if shorter)"""
+    if len(tokens) <= size:
+        return {zlib.crc32(" ".join(tokens).encode("utf-8"))}
+    return {
+        zlib.crc32(" ".join(tokens[i : i + size]).encode("utf-8"))
+        for i in range(len(tokens) - size + 1)
+    }
+
+
+def signature(hashes: Iterable[int], num_perm: int = NUM_PERM) -> list[int]:
+    """One-permutation MinHash signature of a set of 32-bit shingle hashes"""
+    slots: list[int | None] = [None] * num_perm
+    for x in hashes:
+        h = (_A * x + _B) % _PRIME
+        slot, rank = h % num_perm, h // num_perm
+        current = slots[slot]
+        if current is None or rank < current:
+            slots[slot] = rank
+    if all(v is None for v in slots):
+        return [_OFFSET] * num_perm
+    result = list(slots)
+    for i in range(num_perm):
+        if result[i] is None:
+            distance = 1
+            while slots[(i + distance) % num_perm] is None:
+                distance += 1
+            result[i] = slots[(i + distance) % num_perm] + distance * _OFFSET
+    return result
+
+
+def similarity(sig_a: Sequence[int], sig_b: Sequence[int]) -> float:
+    """Estimated Jaccard similarity: the share of agreeing signature slots"""
+    return sum(1 for x, y in zip(sig_a, sig_b) if x == y) / len(sig_a)
+
+
+def lsh_params(threshold: float, num_perm: int = NUM_PERM) -> tuple[int, int]:
+    """(bands, rows) whose S-curve midpoint (1/bands)**(1/rows) is the largest
+    one not above threshold, so pairs at the threshold are rarely missed"""
+    best = (num_perm, 1)
+    for rows in range(1, num_perm + 1):
+        if num_perm % rows:
+            continue
+        bands = num_perm // rows
+        if (1 / bands) ** (1 / rows) <= threshold:
+            best = (bands, rows)
+    return best
+
+
+def candidate_pairs(signatures: Sequence[Sequence[int]], bands: int, rows: int) -> set[tuple[int, int]]:
+    """Index pairs (i < j) that share at least one identical band"""
+    pairs: set[tuple[int, int]] = set()
+    for band in range(bands):
+        buckets: dict[tuple[int, ...], list[int]] = defaultdict(list)
+        lo = band * rows
+        for i, sig in enumerate(signatures):
+            buckets[tuple(sig[lo : lo + rows])].append(i)
+        for members in buckets.values():
+            for n, i in enumerate(members):
+                for j in members[n + 1 :]:
+                    pairs.add((i, j))
+    return pairs
+
+
+def near_duplicate_pairs(
+    signatures: Sequence[Sequence[int]], threshold: float
+) -> list[tuple[int, int, float]]:
+    """(i, j, estimated Jaccard) for every candidate pair at or above threshold"""
+    bands, rows = lsh_params(threshold, len(signatures[0]) if signatures else NUM_PERM)
+    found = []
+    for i, j in sorted(candidate_pairs(signatures, bands, rows)):
+        score = similarity(signatures[i], signatures[j])
+        if score >= threshold:
+            found.append((i, j, score))
+    return found
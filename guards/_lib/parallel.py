@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""VibeGuard Guard — shared process-pool worker for per-file extraction
+
+Guards that read and parse every file fan the work out with map_ordered():
+items are split into chunks across a process pool and the results come back
+in input order, so guard output is identical to a serial run. Small inputs,
+--jobs 1 and hosts where a pool cannot start all run serially in-process.
+
+The function handed to map_ordered() must be defined at module level so it
+can be pickled into the workers.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Iterable, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Below this many items, pool start-up costs more than it saves.
+MIN_PARALLEL_ITEMS = 64
+# Chunks per worker: enough to balance uneven files, few enough to keep IPC low.
+CHUNKS_PER_JOB = 4
+
+
+def default_jobs() -> int:
+    return os.cpu_count() or 1
+
+
+def pop_jobs_arg(argv: list[str]) -> tuple[int, list[str]]:
+    """Strip --jobs N / --jobs=N from argv; return (jobs, remaining args).
+
+    Defaults to the CPU count. Exits with status 2 on a malformed value.
+    """
+    jobs = default_jobs()
+    rest: list[str] = []
+    it = iter(argv)
+    for arg in it:
+        if arg == "--jobs" or arg.startswith("--jobs="):
+            value = arg.split("=", 1)[1] if "=" in arg else next(it, "")
+            if not value.isdigit() or int(value) < 1:
+                print(f"--jobs expects a positive integer, got {value!r}", file=sys.stderr)
+                sys.exit(2)
+            jobs = int(value)
+        else:
+            rest.append(arg)
+    return jobs, rest
+
+
+def map_ordered(func: Callable[[T], R], items: Iterable[T], jobs: int) -> list[R]:
+    """Apply func to every item across up to `jobs` processes, preserving order."""
+    items = list(items)
+    workers = min(jobs, len(items))
+    if workers <= 1 or len(items) < MIN_PARALLEL_ITEMS:
+        return [func(item) for item in items]
+
+    chunksize = max(1, -(-len(items) // (workers * CHUNKS_PER_JOB)))
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(func, items, chunksize=chunksize))
+    except (BrokenProcessPool, OSError):
+        # Sandboxes without working semaphores or fork: fall back to serial.
+        return [func(item) for item in items]
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""VibeGuard Guard — changed-files (pre-commit) mode
+
+hooks/pre-commit-guard.sh exports VIBEGUARD_STAGED_FILES, a file listing the
+absolute path of every staged source file. Guards that judge one file at a
+time just check those files (staged_paths). Guards that need cross-file
+context (duplicate definitions, import cycles) take the rest of the tree
+from what earlier runs persisted — the file index listing and the guard's
+own per-file cache — and re-analyse only the staged files (staged_scope),
+so pre-commit cost follows the size of the diff rather than the repository.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Iterable, NamedTuple
+
+from file_index import SKIP_DIRS, FileEntry, FileIndex
+
+STAGED_FILES_ENV = "VIBEGUARD_STAGED_FILES"
+
+
+def staged_paths(suffixes: Iterable[str] | None = (".py",)) -> list[Path] | None:
+    """Staged files with one of the suffixes (any file for None), or None outside pre-commit mode."""
+    staged_path = os.environ.get(STAGED_FILES_ENV, "")
+    if not staged_path or not Path(staged_path).is_file():
+        return None
+    wanted = tuple(suffixes) if suffixes is not None else ("",)
+    files = []
+    for line in Path(staged_path).read_text().splitlines():
+        line = line.strip()
+        if line and line.endswith(wanted):
+            files.append(Path(line))
+    return files
+
+
+class StagedScope(NamedTuple):
+    """Whole-tree file list for cross-file context plus the staged subset to re-analyse."""
+
+    files: list[FileEntry]
+    staged: set[str]
+
+
+def staged_scope(
+    root: str | Path,
+    suffixes: Iterable[str] | None,
+    exclude_dirs: Iterable[str] = (),
+    context: bool = True,
+) -> StagedScope | None:
+    """Changed-files scope for root, or None outside pre-commit mode.
+
+    With context, the file list is the persisted index listing (no
+    directory walk) with staged files added and deleted staged files
+    dropped; without it, guards that judge files one at a time get just the
+    staged files. Only staged entries carry a fresh stat. Staged files
+    outside root are ignored.
+    """
+    suffixes = tuple(suffixes) if suffixes is not None else None
+    paths = staged_paths(suffixes)
+    if paths is None:
+        return None
+
+    real_root = os.path.realpath(root)
+    excluded = set(exclude_dirs)
+    entries: dict[str, FileEntry] = {}
+    if context:
+        index = FileIndex.load_persisted(root) or FileIndex.load(root)
+        entries = {entry.rel: entry for entry in index.files(suffixes, excluded)}
+
+    staged: set[str] = set()
+    for path in paths:
+        rel = os.path.relpath(os.path.realpath(path), real_root).replace(os.sep, "/")
+        if rel.startswith("../") or rel == "..":
+            continue
+        if any(part in excluded or part in SKIP_DIRS for part in rel.split("/")[:-1]):
+            continue
+        try:
+            st = os.stat(path)
+        except OSError:
+            entries.pop(rel, None)
+            continue
+        entries[rel] = FileEntry(rel, st.st_mtime_ns, st.st_size)
+        staged.add(rel)
+
+    return StagedScope(sorted(entries.values()), staged)
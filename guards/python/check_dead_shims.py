@@ -7,16 +7,27 @@ These files are usually backward-compatible shells and should be deleted directl
 How to use:
     python3 check_dead_shims.py [target_dir]
     python3 check_dead_shims.py [target_dir] --strict # Exit code 1 if there is a dead shell
+    python3 check_dead_shims.py [target_dir] --format json  # findings for scripts/learn/analyze.py
+
+A tokenize pre-screen reads each file only up to its first top-level
+statement that is not an import, docstring or __all__ assignment; only the
+files that survive it are fully parsed.
 """
 
 import ast
-import os
+import json
 import sys
+import tokenize
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "_lib"))
+from file_index import FileIndex  # noqa: E402
+from staged import staged_paths  # noqa: E402
+
 DEFAULT_TARGET_DIR = Path(__file__).resolve().parent.parent / "app"
 
-SKIP_DIRS: set[str] = {"__pycache__", ".git", "tests", "node_modules", ".venv"}
+# Skipped on top of file_index.SKIP_DIRS
+SKIP_DIRS: set[str] = {"tests"}
 SKIP_FILES: set[str] = {"__init__.py"}
 
 ALLOWLIST_FILENAME = ".vibeguard-dead-shims-allowlist"
@@ -52,8 +63,50 @@ def _is_all_assignment(node: ast.stmt) -> bool:
     return False
 
 
+# First tokens of top-level statements a shim may contain; a string token
+# may open a docstring. The full parse makes the final call.
+_SHIM_STATEMENT_NAMES = frozenset({"import", "from", "__all__"})
+_TRIVIA_TOKENS = frozenset({tokenize.NL, tokenize.COMMENT, tokenize.ENCODING})
+
+
+def may_be_dead_shim(filepath: Path) -> bool:
+    """Tokenize pre-screen: False once a statement cannot belong to a shim.
+
+    Reads lazily and stops at the first top-level statement that does not
+    start with import, from, __all__ or a string literal, so a typical
+    module costs a few lines rather than a full parse. Files that survive,
+    or that tokenize cannot judge, go on to is_dead_shim's ast check.
+    """
+    try:
+        with open(filepath, encoding="utf-8") as fh:
+            at_statement_start = True
+            statements = 0
+            for token in tokenize.generate_tokens(fh.readline):
+                if token.type in _TRIVIA_TOKENS:
+                    continue
+                if token.type == tokenize.ENDMARKER:
+                    break
+                if token.type == tokenize.NEWLINE or (token.type == tokenize.OP and token.string == ";"):
+                    at_statement_start = True
+                    continue
+                if not at_statement_start:
+                    continue
+                at_statement_start = False
+                statements += 1
+                if token.type == tokenize.STRING:
+                    continue
+                if token.type == tokenize.NAME and token.string in _SHIM_STATEMENT_NAMES:
+                    continue
+                return False
+            return statements > 0
+    except (tokenize.TokenError, SyntaxError, UnicodeDecodeError):
+        return True
+
+
 def is_dead_shim(filepath: Path) -> bool:
     """True when module body only contains imports/docstring/__all__."""
+    if not may_be_dead_shim(filepath):
+        return False
     try:
         tree = ast.parse(filepath.read_text(encoding="utf-8"), filename=str(filepath))
     except (SyntaxError, UnicodeDecodeError):
@@ -73,26 +126,23 @@ def is_dead_shim(filepath: Path) -> bool:
     return True
 
 
-def _staged_py_files() -> list[Path] | None:
-    """If VIBEGUARD_STAGED_FILES is set, return only staged .py files."""
-    staged_path = os.environ.get("VIBEGUARD_STAGED_FILES", "")
-    if not staged_path or not Path(staged_path).is_file():
-        return None
-    files = []
-    for line in Path(staged_path).read_text().splitlines():
-        line = line.strip()
-        if line and line.endswith(".py"):
-            files.append(Path(line))
-    return files
-
-
 def main() -> int:
     strict = "--strict" in sys.argv
-    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    output_format = "text"
+    args = []
+    it = iter(sys.argv[1:])
+    for arg in it:
+        if arg == "--format" or arg.startswith("--format="):
+            output_format = arg.split("=", 1)[1] if "=" in arg else next(it, "")
+            if output_format not in ("text", "json"):
+                print(f"--format expects text|json, got {output_format!r}", file=sys.stderr)
+                return 2
+        elif not arg.startswith("--"):
+            args.append(arg)
     target_dir = Path(args[0]) if args else DEFAULT_TARGET_DIR
 
     # Pre-commit mode: only check staged files
-    staged = _staged_py_files()
+    staged = staged_paths()
     if staged is not None:
         py_files_to_check = [f for f in staged if f.is_file() and f.name not in SKIP_FILES]
     else:
@@ -100,9 +150,9 @@ def main() -> int:
             print(f"[ERR] Target directory not found: {target_dir}")
             return 1
         py_files_to_check = [
-            f for f in sorted(target_dir.rglob("*.py"))
-            if not any(d in SKIP_DIRS for d in f.relative_to(target_dir).parts)
-            and f.name not in SKIP_FILES
+            target_dir / entry.rel
+            for entry in FileIndex.load(target_dir).files(suffixes=[".py"], exclude_dirs=SKIP_DIRS)
+            if Path(entry.rel).name not in SKIP_FILES
         ]
 
     allowlist = load_allowlist(target_dir) if target_dir.exists() else set()
@@ -119,6 +169,23 @@ def main() -> int:
         if is_dead_shim(py_file):
             shims.append(rel_path)
 
+    if output_format == "json":
+        report = {
+            "tool": "check_dead_shims",
+            "version": 1,
+            "target_dir": str(target_dir),
+            "findings": [
+                {
+                    "rule": "PY-13",
+                    "path": s,
+                    "message": "dead shell file (only re-export, no original definition)",
+                }
+                for s in shims
+            ],
+        }
+        print(json.dumps(report, indent=2))
+        return 1 if strict and shims else 0
+
     if not shims:
         print("No dead shims found")
         return 0
@@ -5,6 +5,13 @@ Generalizing from the VibeGuard framework, scan the project directory to find:
 1. Duplicate Protocol definitions (interfaces with the same name across files)
 2. Duplicate class names (classes with the same name across files)
 3. Duplicate module-level functions (top-level functions with the same name across modules)
+4. Structurally identical bodies (same code under any name, by AST body hash)
+5. Near-duplicate function bodies (--near-duplicates): functions and methods
+   whose normalized AST token shingles reach a Jaccard threshold, found with
+   MinHash signatures and LSH banding instead of comparing every pair
+
+Definitions come from the AST, so decorated and async definitions count, and
+are cached per file under .vibeguard/cache/: warm runs parse changed files only.
 
 Configuration method:
   Modify the directory and exemption list in the CONFIG section below.
@@ -12,13 +19,31 @@ Configuration method:
 How to use:
     python check_duplicates.py [target_dir]
     python check_duplicates.py --strict # If there are duplicate protocols, exit code 1
+    python check_duplicates.py --no-cache [target_dir]  # re-parse every file
+    python check_duplicates.py --near-duplicates [target_dir]
+    python check_duplicates.py --threshold 0.9 [target_dir]  # implies --near-duplicates (default: 0.8)
+    python check_duplicates.py --format json [target_dir]  # findings for findings_to_plan.py
+
+With VIBEGUARD_STAGED_FILES set (pre-commit), only staged files are
+re-parsed; the rest of the tree comes from the persisted file index and
+definition cache, and only duplicates involving a staged file are reported.
 """
 
-import re
+from __future__ import annotations
+
+import ast
+import hashlib
+import json
 import sys
 from collections import defaultdict
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "_lib"))
+import minhash  # noqa: E402
+from file_cache import MISS, FileCache  # noqa: E402
+from file_index import FileIndex  # noqa: E402
+from staged import StagedScope, staged_scope  # noqa: E402
+
 # ---------------------------------------------------------------------------
 # CONFIG — Modify the following configuration according to project needs
 # ---------------------------------------------------------------------------
@@ -26,8 +51,8 @@ from pathlib import Path
 #Default scan directory (obtained from command line parameters, or use default value)
 DEFAULT_TARGET_DIR = Path(__file__).resolve().parent.parent / "app"
 
-# Directories and files to skip
-SKIP_DIRS: set[str] = {"__pycache__", ".git", "archive", "tests"}
+# Directories and files to skip (on top of file_index.SKIP_DIRS)
+SKIP_DIRS: set[str] = {"archive", "tests"}
 SKIP_FILES: set[str] = {"__init__.py"}
 
 # Protocol allows exemption lists with the same name
@@ -45,62 +70,265 @@ FUNC_ALLOWLIST: set[str] = {
 }
 
 
+# Bodies smaller than this many AST nodes (stubs, `pass`, one-line returns)
+# are too common to be evidence of copy-paste.
+MIN_BODY_NODES = 12
+
+# Near-duplicate search (--near-duplicates): functions with fewer normalized
+# AST tokens are skipped, and pairs at or above this estimated Jaccard
+# similarity of their token shingles are reported.
+MIN_NEAR_DUPLICATE_TOKENS = 40
+DEFAULT_SIMILARITY_THRESHOLD = 0.8
+
+
 # ---------------------------------------------------------------------------
 # Detection logic
 # ---------------------------------------------------------------------------
 
-MODULE_CLASS_RE = re.compile(r"^class\s+(\w+)\s*[\(:]")
-MODULE_FUNC_RE = re.compile(r"^def\s+(\w+)\s*\(")
-PROTOCOL_RE = re.compile(r"^class\s+(\w+)\s*\(\s*(?:typing(?:_extensions)?\.)?Protocol\s*\)")
-
+# Bump when analyse_source output changes shape.
+DEFINITION_CACHE_VERSION = "2"
+
+
+def _is_protocol_base(base: ast.expr) -> bool:
+    if isinstance(base, ast.Subscript):  # Protocol[T]
+        base = base.value
+    if isinstance(base, ast.Name):
+        return base.id == "Protocol"
+    return (
+        isinstance(base, ast.Attribute)
+        and base.attr == "Protocol"
+        and isinstance(base.value, ast.Name)
+        and base.value.id in ("typing", "typing_extensions")
+    )
+
+
+def _body_parts(node: ast.AST) -> list[ast.AST]:
+    """A definition's structure without its name, decorators and docstring"""
+    body = list(node.body)
+    if body and isinstance(body[0], ast.Expr) and isinstance(body[0].value, ast.Constant):
+        if isinstance(body[0].value.value, str):
+            body = body[1:]
+    parts: list[ast.AST] = [ast.Module(body=body, type_ignores=[])]
+    if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+        parts.append(node.args)
+    return parts
+
+
+def _body_hash(node: ast.AST) -> str | None:
+    """Hash of a definition's structure; None for trivial bodies"""
+    parts = _body_parts(node)
+    if sum(1 for part in parts for _ in ast.walk(part)) < MIN_BODY_NODES:
+        return None
+    dumped = "\n".join(ast.dump(part, include_attributes=False) for part in parts)
+    return hashlib.sha256(dumped.encode("utf-8")).hexdigest()[:16]
+
+
+def normalized_tokens(node: ast.AST) -> list[str]:
+    """Pre-order AST node types with identifiers and literal values stripped
+
+    Renaming variables, attributes or arguments and changing constants leave
+    the token stream unchanged, so renamed copies shingle identically.
+    """
+    tokens: list[str] = []
+    stack = list(reversed(_body_parts(node)))
+    while stack:
+        current = stack.pop()
+        if isinstance(current, ast.expr_context):
+            continue
+        tokens.append(type(current).__name__)
+        stack.extend(reversed(list(ast.iter_child_nodes(current))))
+    return tokens
+
+
+def _fingerprint(node: ast.AST, qualname: str) -> list | None:
+    tokens = normalized_tokens(node)
+    if len(tokens) < MIN_NEAR_DUPLICATE_TOKENS:
+        return None
+    return [qualname, node.lineno, _body_hash(node), minhash.signature(minhash.shingle_hashes(tokens))]
+
+
+def analyse_source(source: bytes, filename: str = "<unknown>", fingerprints: bool = False) -> dict:
+    """Definitions of one file, from a single parse
+
+    "definitions" holds module-level [kind, name, line, body_hash] rows;
+    kind is protocol, class, function or async_function, and decorated
+    definitions count like any other. With fingerprints, "fingerprints"
+    holds [qualname, line, body_hash, minhash] rows for every module-level
+    function and method. Unparseable files yield nothing.
+    """
+    result: dict = {"definitions": [], "fingerprints": []}
+    try:
+        tree = ast.parse(source, filename=filename)
+    except (SyntaxError, ValueError):
+        return result
+
+    function_types = (ast.FunctionDef, ast.AsyncFunctionDef)
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef):
+            kind = "protocol" if any(_is_protocol_base(b) for b in node.bases) else "class"
+        elif isinstance(node, ast.AsyncFunctionDef):
+            kind = "async_function"
+        elif isinstance(node, ast.FunctionDef):
+            kind = "function"
+        else:
+            continue
+        result["definitions"].append([kind, node.name, node.lineno, _body_hash(node)])
 
-def collect_definitions(target_dir: Path) -> tuple[
+        if not fingerprints:
+            continue
+        if isinstance(node, function_types):
+            candidates = [(node, node.name)]
+        else:
+            candidates = [
+                (child, f"{node.name}.{child.name}")
+                for child in node.body
+                if isinstance(child, function_types)
+            ]
+        for child, qualname in candidates:
+            row = _fingerprint(child, qualname)
+            if row is not None:
+                result["fingerprints"].append(row)
+    return result
+
+
+def collect_definitions(
+    target_dir: Path,
+    cache: FileCache | None = None,
+    fingerprints: bool = False,
+    scope: StagedScope | None = None,
+) -> tuple[
     dict[str, list[str]],
     dict[str, list[str]],
     dict[str, list[str]],
+    dict[str, list[tuple[str, int, str]]],
+    list[tuple[str, int, str, str | None, list[int]]],
 ]:
+    """Index module-level definitions.
+
+    Returns classes, protocols and functions (name → paths), bodies (body
+    hash → (path, line, name) locations) and, with fingerprints, one
+    (path, line, qualname, body_hash, minhash) row per function or method.
+    With a cache, only files whose content changed since the last run are
+    parsed. With a changed-files scope, files outside the diff are taken
+    from the cache unchecked and only staged files are re-analysed.
+    """
     classes: dict[str, list[str]] = defaultdict(list)
     protocols: dict[str, list[str]] = defaultdict(list)
     functions: dict[str, list[str]] = defaultdict(list)
-
-    for py_file in sorted(target_dir.rglob("*.py")):
-        parts = py_file.relative_to(target_dir).parts
-        if any(d in SKIP_DIRS for d in parts):
-            continue
+    bodies: dict[str, list[tuple[str, int, str]]] = defaultdict(list)
+    function_prints: list[tuple[str, int, str, str | None, list[int]]] = []
+
+    if scope is not None:
+        entries = scope.files
+    else:
+        entries = FileIndex.load(target_dir).files(suffixes=[".py"], exclude_dirs=SKIP_DIRS)
+    for entry in entries:
+        py_file = target_dir / entry.rel
         if py_file.name in SKIP_FILES:
             continue
 
-        rel_path = str(py_file.relative_to(target_dir))
-
-        try:
-            text = py_file.read_text(encoding="utf-8")
-        except (OSError, UnicodeDecodeError):
+        rel_path = entry.rel
+        if cache is not None and scope is not None and rel_path not in scope.staged:
+            # Outside the diff: trust the last run's result when there is one.
+            analysis = cache.peek(rel_path)
+        else:
+            analysis = MISS
+        if analysis is MISS and cache is not None:
+            analysis = cache.get(
+                rel_path,
+                py_file,
+                lambda source: analyse_source(source, rel_path, fingerprints),
+                stat=(entry.mtime_ns, entry.size) if entry.size >= 0 else None,
+            )
+        elif analysis is MISS:
+            try:
+                analysis = analyse_source(py_file.read_bytes(), rel_path, fingerprints)
+            except OSError:
+                analysis = None
+        if not analysis:
             continue
 
-        for line in text.splitlines():
-            if line.startswith((" ", "\t")):
-                continue
-
-            proto_match = PROTOCOL_RE.match(line)
-            if proto_match:
-                name = proto_match.group(1)
+        for kind, name, line, body_hash in analysis["definitions"]:
+            if kind == "protocol":
                 protocols[name].append(rel_path)
+            if kind in ("protocol", "class"):
                 classes[name].append(rel_path)
-                continue
-
-            cls_match = MODULE_CLASS_RE.match(line)
-            if cls_match:
-                name = cls_match.group(1)
-                classes[name].append(rel_path)
-                continue
-
-            func_match = MODULE_FUNC_RE.match(line)
-            if func_match:
-                name = func_match.group(1)
-                if not name.startswith("_"):
-                    functions[name].append(rel_path)
-
-    return classes, protocols, functions
+            elif not name.startswith("_"):
+                functions[name].append(rel_path)
+            if body_hash is not None:
+                bodies[body_hash].append((rel_path, line, name))
+        for qualname, line, body_hash, signature in analysis["fingerprints"]:
+            function_prints.append((rel_path, line, qualname, body_hash, signature))
+
+    return classes, protocols, functions, bodies, function_prints
+
+
+def find_near_duplicates(
+    function_prints: list[tuple[str, int, str, str | None, list[int]]], threshold: float
+) -> list[dict]:
+    """Clusters of functions whose normalized bodies reach the Jaccard threshold
+
+    Functions sharing a signature are collapsed first (generated or
+    copy-pasted code would otherwise flood the LSH buckets), then candidate
+    pairs among the distinct signatures come from MinHash LSH banding, so
+    the search is sub-quadratic. Copies with identical body hashes are left
+    to the identical-bodies report. Each cluster carries the lowest
+    similarity that joined it.
+    """
+    by_signature: dict[tuple[int, ...], list[int]] = defaultdict(list)
+    for i, row in enumerate(function_prints):
+        by_signature[tuple(row[4])].append(i)
+    groups = list(by_signature.values())
+
+    parent = list(range(len(function_prints)))
+    linked: dict[int, float] = {}
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def link(i: int, j: int, score: float) -> None:
+        root_i, root_j = find(i), find(j)
+        low = min(score, linked.get(root_i, 1.0), linked.get(root_j, 1.0))
+        if root_i != root_j:
+            parent[root_j] = root_i
+            linked.pop(root_j, None)
+        linked[root_i] = low
+
+    def distinct_hashes(members: list[int]) -> set:
+        # None (a body too small to hash) never matches another body.
+        return {function_prints[i][3] or ("unhashed", i) for i in members}
+
+    for members in groups:
+        if len(distinct_hashes(members)) > 1:
+            for other in members[1:]:
+                link(members[0], other, 1.0)
+
+    signatures = [function_prints[members[0]][4] for members in groups]
+    for a, b, score in minhash.near_duplicate_pairs(signatures, threshold):
+        if len(distinct_hashes(groups[a]) | distinct_hashes(groups[b])) > 1:
+            link(groups[a][0], groups[b][0], score)
+            for members in (groups[a], groups[b]):
+                for other in members[1:]:
+                    link(members[0], other, 1.0)
+
+    clusters: dict[int, list[int]] = defaultdict(list)
+    for i in range(len(function_prints)):
+        root = find(i)
+        if root in linked:
+            clusters[root].append(i)
+    result = [
+        {
+            "similarity": round(linked[root], 2),
+            "locations": sorted(function_prints[i][:3] for i in members),
+        }
+        for root, members in clusters.items()
+        if len(members) > 1
+    ]
+    result.sort(key=lambda group: (-group["similarity"], group["locations"]))
+    return result
 
 
 def find_duplicates(
@@ -117,22 +345,151 @@ def find_duplicates(
     return dupes
 
 
+def parse_args(argv: list[str]) -> dict:
+    options = {
+        "strict": False,
+        "use_cache": True,
+        "near_duplicates": False,
+        "threshold": DEFAULT_SIMILARITY_THRESHOLD,
+        "format": "text",
+        "target_dir": DEFAULT_TARGET_DIR,
+    }
+    it = iter(argv)
+    for arg in it:
+        if arg == "--strict":
+            options["strict"] = True
+        elif arg == "--no-cache":
+            options["use_cache"] = False
+        elif arg == "--near-duplicates":
+            options["near_duplicates"] = True
+        elif arg == "--threshold" or arg.startswith("--threshold="):
+            value = arg.split("=", 1)[1] if "=" in arg else next(it, "")
+            try:
+                threshold = float(value)
+            except ValueError:
+                threshold = -1.0
+            if not 0 < threshold <= 1:
+                print(f"--threshold expects a number in (0, 1], got {value!r}", file=sys.stderr)
+                sys.exit(2)
+            options["threshold"] = threshold
+            options["near_duplicates"] = True
+        elif arg == "--format" or arg.startswith("--format="):
+            value = arg.split("=", 1)[1] if "=" in arg else next(it, "")
+            if value not in ("text", "json"):
+                print(f"--format expects text|json, got {value!r}", file=sys.stderr)
+                sys.exit(2)
+            options["format"] = value
+        elif not arg.startswith("--"):
+            options["target_dir"] = Path(arg)
+    return options
+
+
+def _location(path: str, line: int | None, name: str) -> dict:
+    return {"path": path, "line": line, "name": name}
+
+
+def json_report(
+    target_dir: Path,
+    threshold: float | None,
+    dup_protocols: dict[str, list[str]],
+    dup_classes: dict[str, list[str]],
+    dup_functions: dict[str, list[str]],
+    dup_bodies: list[list[tuple[str, int, str]]],
+    near_duplicates: list[dict],
+) -> dict:
+    """Findings as JSON for workflows/plan-flow/scripts/findings_to_plan.py"""
+    findings = []
+    for category, groups in (
+        ("duplicate-protocol", dup_protocols),
+        ("duplicate-class", dup_classes),
+        ("duplicate-function", dup_functions),
+    ):
+        for name, paths in groups.items():
+            findings.append(
+                {
+                    "category": category,
+                    "symbol": name,
+                    "similarity": 1.0,
+                    "locations": [_location(path, None, name) for path in paths],
+                }
+            )
+    for locations in sorted(dup_bodies):
+        findings.append(
+            {
+                "category": "identical-body",
+                "symbol": locations[0][2],
+                "similarity": 1.0,
+                "locations": [_location(*location) for location in locations],
+            }
+        )
+    for group in near_duplicates:
+        findings.append(
+            {
+                "category": "near-duplicate-body",
+                "symbol": group["locations"][0][2],
+                "similarity": group["similarity"],
+                "locations": [_location(*location) for location in group["locations"]],
+            }
+        )
+    return {
+        "tool": "check_duplicates",
+        "version": 1,
+        "target_dir": str(target_dir),
+        "threshold": threshold,
+        "findings": findings,
+    }
+
+
 def main() -> int:
-    strict = "--strict" in sys.argv
-    args = [a for a in sys.argv[1:] if not a.startswith("--")]
-    target_dir = Path(args[0]) if args else DEFAULT_TARGET_DIR
+    options = parse_args(sys.argv[1:])
+    target_dir = options["target_dir"]
+    as_json = options["format"] == "json"
 
     if not target_dir.exists():
         print(f"[ERR] Target directory not found: {target_dir}")
         return 1
 
-    classes, protocols, functions = collect_definitions(target_dir)
+    near = options["near_duplicates"]
+    cache_name = "definitions-minhash" if near else "definitions"
+    cache = FileCache(target_dir, cache_name, DEFINITION_CACHE_VERSION, enabled=options["use_cache"])
+    scope = staged_scope(target_dir, [".py"], SKIP_DIRS)
+    classes, protocols, functions, bodies, function_prints = collect_definitions(
+        target_dir, cache, near, scope
+    )
+    cache.save(prune=True)
 
     dup_protocols = find_duplicates(protocols, PROTOCOL_ALLOWLIST)
     dup_classes = find_duplicates(classes, CLASS_ALLOWLIST)
     dup_functions = find_duplicates(functions, FUNC_ALLOWLIST)
+    dup_bodies = [sorted(locations) for _, locations in sorted(bodies.items()) if len(locations) > 1]
+    near_duplicates = find_near_duplicates(function_prints, options["threshold"]) if near else []
+
+    if scope is not None:
+        # Report only duplicates that involve a staged file.
+        staged = scope.staged
+        dup_protocols = {n: ps for n, ps in dup_protocols.items() if staged.intersection(ps)}
+        dup_classes = {n: ps for n, ps in dup_classes.items() if staged.intersection(ps)}
+        dup_functions = {n: ps for n, ps in dup_functions.items() if staged.intersection(ps)}
+        dup_bodies = [locs for locs in dup_bodies if any(loc[0] in staged for loc in locs)]
+        near_duplicates = [
+            group for group in near_duplicates if any(loc[0] in staged for loc in group["locations"])
+        ]
 
     has_protocol_issues = bool(dup_protocols)
+    strict_failure = options["strict"] and has_protocol_issues
+
+    if as_json:
+        report = json_report(
+            target_dir,
+            options["threshold"] if near else None,
+            dup_protocols,
+            dup_classes,
+            dup_functions,
+            dup_bodies,
+            near_duplicates,
+        )
+        print(json.dumps(report, indent=2))
+        return 1 if strict_failure else 0
 
     if dup_protocols:
         print("\n=== Duplicate Protocol Definitions ===")
@@ -158,14 +515,37 @@ def main() -> int:
             for p in paths:
                 print(f"    - {p}")
 
-    if not dup_protocols and not dup_classes and not dup_functions:
+    if dup_bodies:
+        print("\n=== Structurally Identical Bodies ===")
+        print("(Same code under different names or files; extract one shared definition)\n")
+        for locations in sorted(dup_bodies):
+            print(f"  {len(locations)} definitions:")
+            for path, line, name in locations:
+                print(f"    - {path}:{line} {name}")
+
+    if near_duplicates:
+        print(f"\n=== Near-Duplicate Bodies (Jaccard ≥ {options['threshold']:.2f}) ===")
+        print("(Same shape with small edits; consider one parameterized definition)\n")
+        for group in near_duplicates:
+            print(f"  {len(group['locations'])} definitions, similarity {group['similarity']:.2f}:")
+            for path, line, name in group["locations"]:
+                print(f"    - {path}:{line} {name}")
+
+    cache_line = f"\nDefinition cache: {cache.summary()}"
+    if scope is not None:
+        cache_line += f"\nChanged-files mode: {len(scope.staged)} staged of {len(scope.files)} indexed files"
+    if not dup_protocols and not dup_classes and not dup_functions and not dup_bodies and not near_duplicates:
         print("No duplicate definitions found")
+        print(cache_line)
         return 0
 
-    total = len(dup_protocols) + len(dup_classes) + len(dup_functions)
+    total = (
+        len(dup_protocols) + len(dup_classes) + len(dup_functions) + len(dup_bodies) + len(near_duplicates)
+    )
     print(f"\nTotal: {total} groups of duplicates")
+    print(cache_line)
 
-    if strict and has_protocol_issues:
+    if strict_failure:
         print("\n--strict mode: duplicate Protocols found, exit code 1")
         return 1
 
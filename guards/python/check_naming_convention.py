@@ -12,11 +12,14 @@ How to use:
     python check_naming_convention.py # Check app/ directory by default
 """
 
-import os
 import re
 import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "_lib"))
+from file_index import FileIndex  # noqa: E402
+from staged import staged_paths  # noqa: E402
+
 # ---------------------------------------------------------------------------
 # CONFIG — Modify the following configuration according to project needs
 # ---------------------------------------------------------------------------
@@ -68,8 +71,82 @@ def is_allowed_file(filepath: Path) -> bool:
     return any(allowed in filepath_str for allowed in ALLOWED_PATHS)
 
 
+def _literal_alternation(words: list[str]) -> str:
+    """Regex alternation of literal words, factored into a prefix trie
+
+    re tries alternatives one by one, so a flat "a|b|c" over hundreds of keys
+    costs one attempt per key at every position; the trie form rejects a
+    position after reading its first character.
+    """
+    trie: dict = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def emit(node: dict) -> str:
+        optional = "" in node
+        branches = [re.escape(char) + emit(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if optional:
+            body = body + "?" if len(branches) == 1 and len(branches[0]) == 1 else f"(?:{body})?"
+        return body
+
+    return emit(trie)
+
+
+class CamelKeyScanner:
+    """All KNOWN_CAMEL_KEYS lookups and ALLOWED_PATTERNS for one line, in two regex passes
+
+    The key table is compiled once into a single lookahead alternation, so
+    each start position is tried once for every key and usage shape
+    (`.get("key"`, `["key"]`, `"key":`). A plain key search screens whole
+    files and lines first: most lines mention no key at all.
+    """
+
+    def __init__(self, keys: dict[str, str], allowed_patterns: list[str]):
+        self.keys = keys
+        self._order = {key: i for i, key in enumerate(keys)}
+        alternation = _literal_alternation(list(keys))
+        self._prefilter = re.compile(alternation) if keys else None
+        self._usage = re.compile(
+            rf"""(?=\.get\(\s*["'](?P<get>{alternation})["']"""
+            rf"""|\[\s*["'](?P<index>{alternation})["']\s*\]"""
+            rf"""|["'](?P<mapping>{alternation})["']\s*:)"""
+        )
+        self._allowed = re.compile("|".join(f"(?:{p})" for p in allowed_patterns)) if allowed_patterns else None
+
+    def may_match(self, text: str) -> bool:
+        """False when text contains no known key, so nothing in it can be reported"""
+        return self._prefilter is not None and self._prefilter.search(text) is not None
+
+    def is_allowed_context(self, line: str) -> bool:
+        return self._allowed is not None and self._allowed.search(line) is not None
+
+    def keys_used(self, line: str) -> list[str]:
+        """Known keys used as dict keys on this line, in KNOWN_CAMEL_KEYS order"""
+        found = {match.group(match.lastgroup) for match in self._usage.finditer(line)}
+        return sorted(found, key=self._order.__getitem__)
+
+
+_scanner_cache: dict[tuple, CamelKeyScanner] = {}
+
+
+def get_scanner() -> CamelKeyScanner:
+    """Scanner for the current CONFIG, compiled once per distinct configuration"""
+    config = (tuple(KNOWN_CAMEL_KEYS.items()), tuple(ALLOWED_PATTERNS))
+    scanner = _scanner_cache.get(config)
+    if scanner is None:
+        _scanner_cache.clear()
+        scanner = _scanner_cache[config] = CamelKeyScanner(dict(KNOWN_CAMEL_KEYS), list(ALLOWED_PATTERNS))
+    return scanner
+
+
 def is_allowed_context(line: str) -> bool:
-    return any(re.search(pattern, line) for pattern in ALLOWED_PATTERNS)
+    return get_scanner().is_allowed_context(line)
 
 
 def check_file(filepath: Path) -> list[tuple[int, str, str, str]]:
@@ -88,6 +165,10 @@ def check_file(filepath: Path) -> list[tuple[int, str, str, str]]:
         print(f"  Warning: Failed to read {filepath}: {e}", file=sys.stderr)
         return []
 
+    scanner = get_scanner()
+    if not scanner.may_match(content):
+        return []
+
     in_docstring = False
     docstring_delimiter = None
 
@@ -111,38 +192,17 @@ def check_file(filepath: Path) -> list[tuple[int, str, str, str]]:
         if stripped.startswith("#"):
             continue
 
-        if is_allowed_context(line):
+        if not scanner.may_match(line) or scanner.is_allowed_context(line):
             continue
 
-        for camel_key, snake_key in KNOWN_CAMEL_KEYS.items():
-            patterns = [
-                rf'\.get\(\s*["\']{ camel_key }["\']',
-                rf'\[\s*["\']{ camel_key }["\']\s*\]',
-                rf'["\']{ camel_key }["\']\s*:',
-            ]
-            for pattern in patterns:
-                if re.search(pattern, line):
-                    issues.append((line_num, line.strip(), camel_key, snake_key))
-                    break
+        for camel_key in scanner.keys_used(line):
+            issues.append((line_num, line.strip(), camel_key, scanner.keys[camel_key]))
 
     return issues
 
 
-def _staged_py_files() -> list[Path] | None:
-    """If VIBEGUARD_STAGED_FILES is set, return only staged .py files."""
-    staged_path = os.environ.get("VIBEGUARD_STAGED_FILES", "")
-    if not staged_path or not Path(staged_path).is_file():
-        return None
-    files = []
-    for line in Path(staged_path).read_text().splitlines():
-        line = line.strip()
-        if line and line.endswith(".py"):
-            files.append(Path(line))
-    return files
-
-
 def main() -> None:
-    staged = _staged_py_files()
+    staged = staged_paths()
     if staged is not None:
         py_files = [f for f in staged if f.is_file()]
     elif len(sys.argv) > 1:
@@ -153,12 +213,15 @@ def main() -> None:
                 py_files.append(path)
             elif path.is_dir():
                 py_files.extend(
-                    f for f in path.rglob("*.py") if "__pycache__" not in str(f)
+                    path / entry.rel for entry in FileIndex.load(path).files(suffixes=[".py"])
                 )
     else:
-        py_files = [
-            f for f in Path("app").rglob("*.py") if "__pycache__" not in str(f)
-        ]
+        app_dir = Path("app")
+        py_files = (
+            [app_dir / entry.rel for entry in FileIndex.load(app_dir).files(suffixes=[".py"])]
+            if app_dir.is_dir()
+            else []
+        )
 
     all_issues: dict[Path, list] = {}
 
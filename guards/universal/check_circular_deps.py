@@ -6,28 +6,63 @@ Distinguish between hard loops (direct import) and soft loops (can be decoupled
 
 usage:
     python3 check_circular_deps.py [target_dir]
+    python3 check_circular_deps.py --jobs 4 [target_dir]   # worker processes (default: CPU count)
+    python3 check_circular_deps.py --max-cycles 50 [target_dir]  # cycles listed per SCC (default: 20)
+    python3 check_circular_deps.py --granularity file|package|top [target_dir]
+    python3 check_circular_deps.py --no-cache [target_dir]  # re-read every file
+
+Granularity picks the graph node: top (default) is the first-level directory,
+or the second level under src/; package is the nearest directory holding a
+package manifest; file is each source file. file and package resolve Python
+dotted and relative imports, TS/JS relative paths and Rust crate::/mod paths
+to project files and drop imports that leave the project.
+
+Cycles are grouped by strongly connected component (iterative Tarjan); each
+component lists a bounded set of elementary cycles (Johnson) and the weakest
+edge to cut: the one with the fewest imports behind it, breaking the most
+listed cycles on ties.
+
+Raw imports are cached per file under .vibeguard/cache/, keyed by content
+hash. With VIBEGUARD_STAGED_FILES set (pre-commit), only staged files are
+re-read; the rest of the graph comes from the persisted file index and
+import cache, and only components touching a staged file are reported.
 
 Exit code:
     0 — no cyclic dependencies
     1 — Circular dependencies found
 """
 
+import hashlib
 import os
 import re
 import sys
-from collections import defaultdict
+from array import array
+from bisect import bisect_left
+from collections import Counter, defaultdict
 from pathlib import Path
+from typing import Callable, Iterable, Iterator
 
-SKIP_DIRS = {
-    "node_modules",
-    ".git",
-    "target",
-    "dist",
-    "build",
-    "__pycache__",
-    ".venv",
-    "vendor",
-}
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "_lib"))
+from file_cache import MISS, FileCache  # noqa: E402
+from file_index import FileIndex  # noqa: E402
+from parallel import map_ordered, pop_jobs_arg  # noqa: E402
+from staged import StagedScope, staged_scope  # noqa: E402
+
+# Bump when _file_imports output changes shape.
+IMPORT_CACHE_VERSION = "1"
+
+# Elementary cycles listed per strongly connected component; a dense SCC can
+# hold exponentially many, and a handful is enough to show how it is tangled.
+DEFAULT_MAX_CYCLES = 20
+
+GRANULARITIES = ("top", "package", "file")
+
+# A directory holding one of these is a package for --granularity package.
+PACKAGE_MANIFESTS = frozenset(
+    {"package.json", "pyproject.toml", "setup.py", "setup.cfg", "Cargo.toml", "go.mod"}
+)
+JS_SUFFIXES = (".ts", ".tsx", ".js", ".jsx", ".mjs", ".cjs")
+RESOLVABLE_SUFFIXES = frozenset({".py", ".rs", *JS_SUFFIXES})
 
 IMPORT_PATTERNS = {
     ".py": [
@@ -83,120 +118,549 @@ def resolve_import_module(
         return parts[0] if parts else None
 
 
-def build_dependency_graph(target_dir: str) -> dict[str, set[str]]:
-    """Building a module-level dependency graph"""
-    graph: dict[str, set[str]] = defaultdict(set)
-
-    for root, dirs, files in os.walk(target_dir):
-        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
-
-        for fname in files:
-            ext = os.path.splitext(fname)[1]
-            patterns = IMPORT_PATTERNS.get(ext, [])
-            if not patterns:
+class ModuleResolver:
+    """Map source files and their import strings to graph nodes
+
+    top     — first-level directory (second level under src/), external
+              packages included; resolved with get_module_name above.
+    file    — project-relative file path; imports that do not land on a
+              project file (stdlib, third-party) are dropped.
+    package — nearest directory holding a package manifest, else the file's
+              own directory; same resolution as file.
+    """
+
+    def __init__(self, target_dir: str, rel_paths: Iterable[str], granularity: str):
+        self.target_dir = target_dir
+        self.granularity = granularity
+        self.files: set[str] = set()
+        manifest_dirs = []
+        for rel_path in rel_paths:
+            name = os.path.basename(rel_path)
+            if name in PACKAGE_MANIFESTS:
+                manifest_dirs.append(os.path.dirname(rel_path))
+            elif os.path.splitext(name)[1] in RESOLVABLE_SUFFIXES:
+                self.files.add(rel_path)
+        self.manifest_dirs = sorted(set(manifest_dirs), key=len, reverse=True)
+        self._python_modules = self._index_python_modules() if granularity != "top" else {}
+
+    def node(self, rel_path: str) -> str:
+        if self.granularity == "top":
+            return get_module_name(os.path.join(self.target_dir, rel_path), self.target_dir)
+        if self.granularity == "file":
+            return rel_path
+        return self._package_of(rel_path)
+
+    def resolve(self, import_path: str, rel_path: str) -> str | None:
+        if self.granularity == "top":
+            module = resolve_import_module(
+                import_path, os.path.join(self.target_dir, rel_path), self.target_dir
+            )
+            # Relative imports that climb out of the scanned directory.
+            return None if module is None or module.startswith(".") else module
+        target = self.resolve_file(import_path, rel_path)
+        if target is None:
+            return None
+        return target if self.granularity == "file" else self._package_of(target)
+
+    def resolve_file(self, import_path: str, rel_path: str) -> str | None:
+        """Project file an import lands on, or None when it leaves the project"""
+        ext = os.path.splitext(rel_path)[1]
+        if ext == ".py":
+            return self._resolve_python(import_path, rel_path)
+        if ext == ".rs":
+            return self._resolve_rust(import_path, rel_path)
+        if import_path.startswith("."):
+            base = self._join(os.path.dirname(rel_path), import_path)
+            for candidate in (base, *(base + s for s in JS_SUFFIXES), *(f"{base}/index{s}" for s in JS_SUFFIXES)):
+                if candidate in self.files:
+                    return candidate
+        return None
+
+    # -- helpers ---------------------------------------------------------
+
+    @staticmethod
+    def _join(*parts: str) -> str:
+        path = os.path.normpath(os.path.join(*parts)).replace("\\", "/")
+        return "" if path == "." else path
+
+    def _package_of(self, rel_path: str) -> str:
+        directory = os.path.dirname(rel_path)
+        for root in self.manifest_dirs:
+            if root == "" or directory == root or directory.startswith(root + "/"):
+                return root or "."
+        return directory or "."
+
+    def _python_roots(self) -> list[str]:
+        roots = {"", "src"}
+        for root in self.manifest_dirs:
+            roots.add(root)
+            roots.add(self._join(root, "src"))
+        # The parent of every top-level package (a package whose parent is not one).
+        for rel_path in self.files:
+            if os.path.basename(rel_path) == "__init__.py":
+                package = os.path.dirname(rel_path)
+                parent = os.path.dirname(package)
+                if package and self._join(parent, "__init__.py") not in self.files:
+                    roots.add(parent)
+        return sorted(roots)
+
+    def _index_python_modules(self) -> dict[str, list[str]]:
+        """Dotted module name → candidate files, under every plausible import root"""
+        modules: dict[str, list[str]] = defaultdict(list)
+        roots = self._python_roots()
+        for rel_path in sorted(self.files):
+            if not rel_path.endswith(".py"):
                 continue
+            stem = rel_path[:-3]
+            if stem.endswith("/__init__") or stem == "__init__":
+                stem = stem[: -len("__init__")].rstrip("/")
+            for root in roots:
+                if root and not stem.startswith(root + "/"):
+                    continue
+                dotted = stem[len(root) + 1 if root else 0 :].replace("/", ".")
+                if dotted:
+                    modules[dotted].append(rel_path)
+        return modules
+
+    def _resolve_python(self, import_path: str, rel_path: str) -> str | None:
+        if import_path.startswith("."):
+            dots = len(import_path) - len(import_path.lstrip("."))
+            base = os.path.dirname(rel_path)
+            for _ in range(dots - 1):
+                base = os.path.dirname(base)
+            rest = import_path[dots:].replace(".", "/")
+            stem = self._join(base, rest) if rest else base
+            for candidate in (f"{stem}.py", self._join(stem, "__init__.py")):
+                if candidate in self.files:
+                    return candidate
+            return None
 
-            file_path = os.path.join(root, fname)
-            source_module = get_module_name(file_path, target_dir)
-
-            try:
-                with open(file_path) as f:
-                    content = f.read()
-            except (OSError, UnicodeDecodeError):
+        parts = import_path.split(".")
+        while parts:
+            candidates = self._python_modules.get(".".join(parts))
+            if candidates:
+                # Several roots can claim a name; prefer the importer's neighbourhood.
+                return max(candidates, key=lambda c: (len(os.path.commonprefix([c, rel_path])), c))
+            parts.pop()
+        return None
+
+    def _resolve_rust(self, import_path: str, rel_path: str) -> str | None:
+        directory = os.path.dirname(rel_path)
+        if import_path.startswith("crate::"):
+            base = self._rust_crate_src(directory)
+            parts = import_path[len("crate::") :].split("::")
+        else:
+            # `mod name;` declares a child of this file's module.
+            stem = os.path.splitext(os.path.basename(rel_path))[0]
+            base = directory if stem in ("mod", "lib", "main") else self._join(directory, stem)
+            parts = [import_path]
+        while parts:
+            stem = self._join(base, *parts)
+            for candidate in (f"{stem}.rs", f"{stem}/mod.rs"):
+                if candidate in self.files:
+                    return candidate
+            parts.pop()
+        return None
+
+    def _rust_crate_src(self, directory: str) -> str:
+        for root in self.manifest_dirs:
+            if root == "" or directory == root or directory.startswith(root + "/"):
+                return self._join(root, "src")
+        parts = directory.split("/")
+        if "src" in parts:
+            return "/".join(parts[: len(parts) - parts[::-1].index("src")])
+        return ""
+
+
+class DependencyGraph:
+    """Dependency graph in compressed sparse row form
+
+    Node ids follow sorted node names, so iterating ids is iterating names
+    in order. The targets of node i are targets[offsets[i]:offsets[i + 1]],
+    ascending, with the matching import counts in weights. Three flat int
+    arrays keep file-level graphs with 100k+ edges small and cache-friendly.
+    """
+
+    def __init__(self, names: list[str], offsets: array, targets: array, weights: array):
+        self.names = names
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+
+    @classmethod
+    def from_edges(cls, edges: Iterable[tuple[str, str]]) -> "DependencyGraph":
+        """Build from (source, target) pairs; repeated pairs add to the edge weight"""
+        ids: dict[str, int] = {}
+        counts: Counter = Counter()
+        for source, target in edges:
+            s = ids.setdefault(source, len(ids))
+            t = ids.setdefault(target, len(ids))
+            counts[s << 32 | t] += 1
+
+        names = sorted(ids)
+        remap = array("i", [0]) * len(names)
+        for new_id, name in enumerate(names):
+            remap[ids[name]] = new_id
+        edge_list = sorted(
+            (remap[key >> 32], remap[key & 0xFFFFFFFF], count) for key, count in counts.items()
+        )
+
+        offsets = array("i", [0]) * (len(names) + 1)
+        targets = array("i", [t for _, t, _ in edge_list])
+        weights = array("i", [w for _, _, w in edge_list])
+        for s, _, _ in edge_list:
+            offsets[s + 1] += 1
+        for i in range(len(names)):
+            offsets[i + 1] += offsets[i]
+        return cls(names, offsets, targets, weights)
+
+    @property
+    def edge_count(self) -> int:
+        return len(self.targets)
+
+    @property
+    def source_count(self) -> int:
+        """Nodes with at least one outgoing dependency"""
+        return sum(1 for i in range(len(self.names)) if self.offsets[i + 1] > self.offsets[i])
+
+    def successors(self, node: int) -> array:
+        return self.targets[self.offsets[node] : self.offsets[node + 1]]
+
+    def weight(self, source: int, target: int) -> int:
+        lo, hi = self.offsets[source], self.offsets[source + 1]
+        pos = bisect_left(self.targets, target, lo, hi)
+        return self.weights[pos] if pos < hi and self.targets[pos] == target else 0
+
+    def __bool__(self) -> bool:
+        return self.edge_count > 0
+
+
+def _file_imports(task: tuple[str, str | None]) -> tuple[str, list[str] | None]:
+    """Pool worker: read one file and return its content hash and raw import strings
+
+    Imports are None when the hash equals the one already cached.
+    """
+    file_path, known_digest = task
+    try:
+        with open(file_path, "rb") as f:
+            source = f.read()
+    except OSError:
+        return "", []
+    digest = hashlib.sha256(source).hexdigest()
+    if digest == known_digest:
+        return digest, None
+    try:
+        content = source.decode("utf-8")
+    except UnicodeDecodeError:
+        return digest, []
+    return digest, [
+        match.group(1)
+        for pattern in IMPORT_PATTERNS[os.path.splitext(file_path)[1]]
+        for match in pattern.finditer(content)
+    ]
+
+
+def build_dependency_graph(
+    target_dir: str,
+    jobs: int = 1,
+    granularity: str = "top",
+    cache: FileCache | None = None,
+    scope: StagedScope | None = None,
+) -> tuple[DependencyGraph, set[str]]:
+    """Building a dependency graph at the given granularity, reading files across `jobs` processes
+
+    Edge weights are the number of import statements behind the edge. With a
+    changed-files scope, files outside the diff come from the cache unread.
+    Also returns the graph nodes that hold a staged file (empty outside
+    changed-files mode).
+    """
+    if scope is not None:
+        all_paths = [entry.rel for entry in scope.files]
+        stats = {entry.rel: (entry.mtime_ns, entry.size) for entry in scope.files}
+    else:
+        entries = FileIndex.load(target_dir).files()
+        all_paths = [entry.rel for entry in entries]
+        stats = {entry.rel: (entry.mtime_ns, entry.size) for entry in entries}
+    resolver = ModuleResolver(target_dir, all_paths, granularity)
+    suffixes = {ext for ext, patterns in IMPORT_PATTERNS.items() if patterns}
+    rel_paths = [rel_path for rel_path in all_paths if os.path.splitext(rel_path)[1] in suffixes]
+
+    imports_by_file: dict[str, list[str]] = {}
+    pending = []
+    tasks = []
+    for rel_path in rel_paths:
+        stat = stats[rel_path]
+        if cache is not None:
+            if scope is not None and rel_path not in scope.staged:
+                cached = cache.peek(rel_path)
+            elif stat[1] >= 0:
+                cached = cache.lookup(rel_path, stat)
+            else:
+                cached = MISS
+            if cached is not MISS:
+                imports_by_file[rel_path] = cached
                 continue
-
-            for pattern in patterns:
-                for match in pattern.finditer(content):
-                    import_path = match.group(1)
-                    target_module = resolve_import_module(
-                        import_path, file_path, target_dir
-                    )
-                    if (
-                        target_module
-                        and target_module != source_module
-                        and not target_module.startswith(".")
-                    ):
-                        graph[source_module].add(target_module)
-
-    return dict(graph)
-
-
-def find_cycles(graph: dict[str, set[str]]) -> list[list[str]]:
-    """DFS detects all loops"""
-    cycles = []
-    visited = set()
-    path = []
-    path_set = set()
-
-    def dfs(node: str):
-        if node in path_set:
-            cycle_start = path.index(node)
-            cycle = path[cycle_start:] + [node]
-            #Normalization: Start with the smallest element
-            min_idx = cycle[:-1].index(min(cycle[:-1]))
-            normalized = cycle[min_idx:-1] + cycle[min_idx : min_idx + 1]
-            if normalized not in cycles:
-                cycles.append(normalized)
-            return
-
-        if node in visited:
-            return
-
-        visited.add(node)
-        path.append(node)
-        path_set.add(node)
-
-        for neighbor in graph.get(node, set()):
-            if neighbor in graph or neighbor in path_set:
-                dfs(neighbor)
-
-        path.pop()
-        path_set.discard(node)
-
-    for node in graph:
-        dfs(node)
-
-    return cycles
+        known = cache.known_digest(rel_path) if cache is not None else None
+        pending.append((rel_path, stat))
+        tasks.append((os.path.join(target_dir, rel_path), known))
+
+    for (rel_path, stat), (digest, imports) in zip(pending, map_ordered(_file_imports, tasks, jobs)):
+        if cache is not None and digest:
+            if stat[1] < 0:
+                try:
+                    st = os.stat(os.path.join(target_dir, rel_path))
+                    stat = (st.st_mtime_ns, st.st_size)
+                except OSError:
+                    pass
+            if imports is None:
+                imports = cache.record(rel_path, stat, digest)
+            else:
+                imports = cache.record(rel_path, stat, digest, imports)
+        imports_by_file[rel_path] = imports or []
+
+    def edges() -> Iterator[tuple[str, str]]:
+        for rel_path in rel_paths:
+            source = resolver.node(rel_path)
+            for import_path in imports_by_file[rel_path]:
+                target = resolver.resolve(import_path, rel_path)
+                if target and target != source:
+                    yield source, target
+
+    staged_nodes = {resolver.node(rel_path) for rel_path in scope.staged} if scope is not None else set()
+    return DependencyGraph.from_edges(edges()), staged_nodes
+
+
+def strongly_connected_components(
+    nodes: Iterable[int], successors: Callable[[int], Iterable[int]]
+) -> list[list[int]]:
+    """Iterative Tarjan: every SCC as a sorted node list, in discovery order"""
+    index: dict[int, int] = {}
+    low: dict[int, int] = {}
+    stack: list[int] = []
+    on_stack: set[int] = set()
+    sccs: list[list[int]] = []
+
+    def visit(node: int) -> None:
+        index[node] = low[node] = len(index)
+        stack.append(node)
+        on_stack.add(node)
+        work.append((node, iter(successors(node))))
+
+    for root in nodes:
+        if root in index:
+            continue
+        work: list[tuple[int, Iterator[int]]] = []
+        visit(root)
+        while work:
+            node, neighbors = work[-1]
+            for neighbor in neighbors:
+                if neighbor not in index:
+                    visit(neighbor)
+                    break
+                if neighbor in on_stack:
+                    low[node] = min(low[node], index[neighbor])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+                if low[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    sccs.append(sorted(component))
+    return sccs
+
+
+def elementary_cycles(
+    graph: DependencyGraph, nodes: list[int], limit: int
+) -> tuple[list[list[int]], bool]:
+    """Iterative Johnson search for elementary cycles inside one SCC
+
+    Each cycle starts at its smallest node and repeats it at the end.
+    Stops after `limit` cycles; the flag says whether it was cut short.
+    """
+    cycles: list[list[int]] = []
+    members = set(nodes)
+    while members:
+        # Johnson's outer loop: the smallest node still on a cycle starts
+        # the next search, confined to its SCC among the remaining nodes.
+        succ = {node: [t for t in graph.successors(node) if t in members] for node in members}
+        components = [
+            c for c in strongly_connected_components(sorted(members), succ.__getitem__) if len(c) > 1
+        ]
+        if not components:
+            break
+        component = min(components)
+        start = component[0]
+        members = set(component)
+        succ = {node: [t for t in succ[node] if t in members] for node in members}
+        blocked = {start}
+        blocked_by: dict[int, set[int]] = defaultdict(set)
+        path = [start]
+        closed = [False]
+        work = [iter(succ[start])]
+        while work:
+            for neighbor in work[-1]:
+                if neighbor == start:
+                    cycles.append(path + [start])
+                    closed[-1] = True
+                    if len(cycles) >= limit:
+                        return cycles, True
+                elif neighbor not in blocked:
+                    path.append(neighbor)
+                    closed.append(False)
+                    blocked.add(neighbor)
+                    work.append(iter(succ[neighbor]))
+                    break
+            else:
+                work.pop()
+                node = path.pop()
+                if closed.pop():
+                    if closed:
+                        closed[-1] = True
+                    pending = [node]
+                    while pending:
+                        unblocked = pending.pop()
+                        if unblocked in blocked:
+                            blocked.discard(unblocked)
+                            pending.extend(blocked_by.pop(unblocked, ()))
+                else:
+                    for neighbor in succ[node]:
+                        blocked_by[neighbor].add(node)
+        # Nodes in other components can still form cycles of their own.
+        members = {m for c in components for m in c} - {start}
+    return cycles, False
+
+
+def weakest_edge(graph: DependencyGraph, cycles: list[list[int]]) -> tuple[int, int, int, int]:
+    """Edge with the fewest imports behind it, preferring one that breaks most cycles
+
+    Returns (source, target, imports, cycles it appears in).
+    """
+    covered: Counter = Counter()
+    for cycle in cycles:
+        covered.update(zip(cycle, cycle[1:]))
+    (source, target), count = min(
+        covered.items(), key=lambda item: (graph.weight(*item[0]), -item[1], item[0])
+    )
+    return source, target, graph.weight(source, target), count
+
+
+def find_cycle_groups(graph: DependencyGraph, max_cycles: int = DEFAULT_MAX_CYCLES) -> list[dict]:
+    """Every cyclic SCC with a bounded set of its elementary cycles and the edge to cut
+
+    Node ids are translated back to names in the returned groups.
+    """
+    names = graph.names
+    groups = []
+    for component in strongly_connected_components(range(len(names)), graph.successors):
+        if len(component) < 2:
+            continue
+        members = set(component)
+        cycles, truncated = elementary_cycles(graph, component, max_cycles)
+        source, target, imports, count = weakest_edge(graph, cycles)
+        groups.append(
+            {
+                "modules": [names[i] for i in component],
+                "edges": sum(1 for i in component for t in graph.successors(i) if t in members),
+                "cycles": [[names[i] for i in cycle] for cycle in cycles],
+                "truncated": truncated,
+                "weakest_edge": (names[source], names[target], imports, count),
+            }
+        )
+    return groups
+
+
+def find_cycles(graph: DependencyGraph) -> list[list[str]]:
+    """All reported elementary cycles, flattened across SCCs"""
+    return [cycle for group in find_cycle_groups(graph) for cycle in group["cycles"]]
 
 
 def main():
-    target_dir = sys.argv[1] if len(sys.argv) > 1 else "."
+    jobs, argv = pop_jobs_arg(sys.argv[1:])
+    max_cycles = DEFAULT_MAX_CYCLES
+    granularity = "top"
+    use_cache = "--no-cache" not in argv
+    args = []
+    it = iter(argv)
+    for arg in it:
+        if arg == "--max-cycles" or arg.startswith("--max-cycles="):
+            value = arg.split("=", 1)[1] if "=" in arg else next(it, "")
+            if not value.isdigit() or int(value) < 1:
+                print(f"--max-cycles expects a positive integer, got {value!r}", file=sys.stderr)
+                sys.exit(2)
+            max_cycles = int(value)
+        elif arg == "--granularity" or arg.startswith("--granularity="):
+            granularity = arg.split("=", 1)[1] if "=" in arg else next(it, "")
+            if granularity not in GRANULARITIES:
+                print(
+                    f"--granularity expects one of {'|'.join(GRANULARITIES)}, got {granularity!r}",
+                    file=sys.stderr,
+                )
+                sys.exit(2)
+        elif arg != "--no-cache":
+            args.append(arg)
+    target_dir = args[0] if args else "."
     target_dir = os.path.abspath(target_dir)
 
     print(f"Scan directory: {target_dir}")
+    print(f"Granularity: {granularity}")
 
-    graph = build_dependency_graph(target_dir)
+    cache = FileCache(target_dir, "cycle-imports", IMPORT_CACHE_VERSION, enabled=use_cache)
+    scope = staged_scope(target_dir, None)
+    if scope is not None:
+        print(f"Changed-files mode: {len(scope.staged)} staged of {len(scope.files)} indexed files")
+    graph, staged_nodes = build_dependency_graph(target_dir, jobs, granularity, cache, scope)
+    cache.save(prune=True)
 
     if not graph:
         print("\033[33mNo inter-module dependencies detected\033[0m")
         sys.exit(0)
 
     # Output dependency graph summary
-    print(f"Number of modules: {len(graph)}")
-    print(f"Depending on the number of edges: {sum(len(v) for v in graph.values())}")
+    print(f"Number of modules: {graph.source_count}")
+    print(f"Depending on the number of edges: {graph.edge_count}")
     print()
 
-    cycles = find_cycles(graph)
+    groups = find_cycle_groups(graph, max_cycles)
+    if scope is not None:
+        # Report only components the staged files take part in.
+        groups = [group for group in groups if staged_nodes.intersection(group["modules"])]
 
-    if not cycles:
+    if not groups:
         print("\033[32m circular dependency check passed - no loop\033[0m")
         sys.exit(0)
 
-    print(f"\033[31m Found {len(cycles)} cyclic dependencies:\033[0m\n")
-    for i, cycle in enumerate(cycles, 1):
-        chain = " → ".join(cycle)
-        print(f"  [{i}] {chain}")
-
-        # Determine whether it can be decoupled through the interface
-        if len(cycle) == 2:
-            print(
-                f" Fix: Extract shared interfaces of {cycle[0]} and {cycle[1]} to independent modules"
-                f"(such as core/interfaces/)"
-            )
-        else:
-            print(
-                f" Fix: Analyze the weakest dependency edge in the loop, via dependency injection or event-driven decoupling"
-            )
+    total = sum(len(group["cycles"]) for group in groups)
+    print(
+        f"\033[31m Found {total} cyclic dependencies in {len(groups)} "
+        f"strongly connected components:\033[0m\n"
+    )
+    i = 0
+    for n, group in enumerate(groups, 1):
+        modules = group["modules"]
+        print(f"  SCC {n}: {', '.join(modules)} ({len(modules)} modules, {group['edges']} edges)")
+        for cycle in group["cycles"]:
+            i += 1
+            print(f"  [{i}] {' → '.join(cycle)}")
+        if group["truncated"]:
+            print(f"  ... more cycles not listed (--max-cycles {max_cycles})")
+
+        source, target, imports, count = group["weakest_edge"]
+        plural = "import" if imports == 1 else "imports"
+        print(
+            f" Weakest edge: {source} → {target} ({imports} {plural}, "
+            f"in {count} of {len(group['cycles'])} listed cycles)"
+        )
+        print(
+            f" Fix: Cut {source} → {target} via dependency injection or event-driven decoupling, "
+            f"or extract the shared interface to an independent module (such as core/interfaces/)"
+        )
         print()
 
     sys.exit(1)
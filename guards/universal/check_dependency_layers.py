@@ -7,6 +7,12 @@ Outputs an error message containing repair instructions when a violation occurs
 usage:
     python3 check_dependency_layers.py [target_dir]
     python3 check_dependency_layers.py --config path/to/.vibeguard-architecture.yaml
+    python3 check_dependency_layers.py --no-cache [target_dir]  # re-parse every file
+    python3 check_dependency_layers.py --jobs 4 [target_dir]    # worker processes (default: CPU count)
+
+Python imports are cached per file under .vibeguard/cache/, keyed by content
+hash, so warm runs only parse files that changed. With VIBEGUARD_STAGED_FILES
+set (pre-commit), only staged files are checked.
 
 Exit code:
     0 — No violation
@@ -15,6 +21,7 @@ Exit code:
 """
 
 import ast
+import hashlib
 import os
 import re
 import sys
@@ -25,6 +32,15 @@ try:
 except ImportError:
     yaml = None
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "_lib"))
+from file_cache import MISS, FileCache  # noqa: E402
+from file_index import FileIndex  # noqa: E402
+from parallel import map_ordered, pop_jobs_arg  # noqa: E402
+from staged import StagedScope, staged_scope  # noqa: E402
+
+# Bump when extract_imports_python output changes shape.
+IMPORT_CACHE_VERSION = "1"
+
 
 def load_config(target_dir: str) -> dict:
     """Load architecture configuration file"""
@@ -65,25 +81,109 @@ def _parse_yaml_simple(path: str) -> dict:
     return {"layers": layers} if layers else {}
 
 
+class LayerMatcher:
+    """Layers from .vibeguard-architecture.yaml compiled into prefix tries.
+
+    The answer is the first (layer, pattern) in config order whose pattern
+    matches, as if every pattern were tried in turn, but each lookup walks a
+    trie instead of every pattern and is memoized. Priority is the pattern's
+    position in config order; lowest match wins.
+    """
+
+    def __init__(self, layers: list[dict]):
+        # Path containment: f"/{pattern}/" in f"/{path}", over path components.
+        self._component_trie: dict = {}
+        # Raw string prefixes: path.startswith(pattern) and the import-name forms.
+        self._path_prefix_trie: dict = {}
+        self._import_prefix_trie: dict = {}
+        self._names: list[str] = []
+        self._path_memo: dict[str, str | None] = {}
+        self._import_memo: dict[str, str | None] = {}
+
+        for layer in layers:
+            for pattern in layer.get("paths", []):
+                priority = len(self._names)
+                self._names.append(layer["name"])
+                pattern_clean = pattern.rstrip("/")
+                self._insert(self._component_trie, pattern_clean.split("/"), priority)
+                self._insert(self._path_prefix_trie, pattern_clean, priority)
+                self._insert(self._import_prefix_trie, pattern_clean.replace("/", "."), priority)
+                self._insert(self._import_prefix_trie, pattern_clean.split("/")[-1], priority)
+
+    @staticmethod
+    def _insert(trie: dict, keys, priority: int) -> None:
+        node = trie
+        for key in keys:
+            node = node.setdefault(key, {})
+        # None never collides with a str key; keep the earliest pattern only.
+        node[None] = min(node.get(None, priority), priority)
+
+    @staticmethod
+    def _best_prefix(trie: dict, keys, best: int | None) -> int | None:
+        node = trie
+        if None in node and (best is None or node[None] < best):
+            best = node[None]
+        for key in keys:
+            node = node.get(key)
+            if node is None:
+                break
+            if None in node and (best is None or node[None] < best):
+                best = node[None]
+        return best
+
+    def resolve(self, file_path: str) -> str | None:
+        """Determine the layer to which the file belongs"""
+        normalized = file_path.replace("\\", "/")
+        if normalized in self._path_memo:
+            return self._path_memo[normalized]
+
+        best = self._best_prefix(self._path_prefix_trie, normalized, None)
+        parts = normalized.split("/")
+        # A pattern must be followed by "/", so it never ends on the last part.
+        dirs = parts[:-1]
+        for start in range(len(dirs)):
+            best = self._best_prefix(self._component_trie, dirs[start:], best)
+            if best == 0:
+                break
+
+        layer = None if best is None else self._names[best]
+        self._path_memo[normalized] = layer
+        return layer
+
+    def import_layer(self, import_path: str, file_path: str) -> str | None:
+        """Map import paths to layers"""
+        # Relative path import (TypeScript/Python)
+        if import_path.startswith("."):
+            dir_path = os.path.dirname(file_path)
+            return self.resolve(os.path.normpath(os.path.join(dir_path, import_path)))
+
+        if import_path in self._import_memo:
+            return self._import_memo[import_path]
+        best = self._best_prefix(self._import_prefix_trie, import_path, None)
+        layer = None if best is None else self._names[best]
+        self._import_memo[import_path] = layer
+        return layer
+
+
 def resolve_layer(file_path: str, layers: list[dict]) -> str | None:
-    """Determine the layer to which the file belongs"""
-    normalized = file_path.replace("\\", "/")
-    for layer in layers:
-        for pattern in layer.get("paths", []):
-            pattern_clean = pattern.rstrip("/")
-            if f"/{pattern_clean}/" in f"/{normalized}" or normalized.startswith(
-                pattern_clean
-            ):
-                return layer["name"]
-    return None
+    """Determine the layer to which the file belongs (one-off; reuse a LayerMatcher in loops)"""
+    return LayerMatcher(layers).resolve(file_path)
 
 
 def extract_imports_python(file_path: str) -> list[str]:
     """Extract Python import path"""
     try:
-        with open(file_path) as f:
-            tree = ast.parse(f.read(), filename=file_path)
-    except SyntaxError:
+        with open(file_path, "rb") as f:
+            source = f.read()
+    except OSError:
+        return []
+    return _python_imports(source, file_path)
+
+
+def _python_imports(source: bytes, file_path: str) -> list[str]:
+    try:
+        tree = ast.parse(source, filename=file_path)
+    except (SyntaxError, ValueError):
         return []
 
     imports = []
@@ -148,23 +248,8 @@ def extract_imports_rust(file_path: str) -> list[str]:
 def import_to_layer(
     import_path: str, file_path: str, layers: list[dict]
 ) -> str | None:
-    """Map import paths to layers"""
-    # Relative path import (TypeScript/Python)
-    if import_path.startswith("."):
-        dir_path = os.path.dirname(file_path)
-        resolved = os.path.normpath(os.path.join(dir_path, import_path))
-        return resolve_layer(resolved, layers)
-
-    #Module name matching
-    for layer in layers:
-        for pattern in layer.get("paths", []):
-            pattern_clean = pattern.rstrip("/").replace("/", ".")
-            dir_name = pattern.rstrip("/").split("/")[-1]
-            if import_path.startswith(dir_name) or import_path.startswith(
-                pattern_clean
-            ):
-                return layer["name"]
-    return None
+    """Map import paths to layers (one-off; reuse a LayerMatcher in loops)"""
+    return LayerMatcher(layers).import_layer(import_path, file_path)
 
 
 EXTRACTORS = {
@@ -177,22 +262,44 @@ EXTRACTORS = {
     ".rs": extract_imports_rust,
 }
 
-SKIP_DIRS = {
-    "node_modules",
-    ".git",
-    "target",
-    "dist",
-    "build",
-    "__pycache__",
-    ".venv",
-    "vendor",
-    "tests",
-    "test",
-}
+# Skipped on top of file_index.SKIP_DIRS: test code may cross layers freely.
+SKIP_DIRS = {"tests", "test"}
 
 
-def check_directory(target_dir: str) -> list[dict]:
-    """Scan directories to detect dependency violations"""
+def _extract_file(task: tuple[str, str, bool, str | None]) -> tuple[str | None, list[str] | None]:
+    """Pool worker: read one file and extract its imports.
+
+    For cached Python files the content hash is returned too, and parsing is
+    skipped (imports None) when it equals the hash already in the cache.
+    """
+    file_path, ext, hashed, known_digest = task
+    if ext != ".py" or not hashed:
+        return None, EXTRACTORS[ext](file_path)
+    try:
+        with open(file_path, "rb") as f:
+            source = f.read()
+    except OSError:
+        return None, []
+    digest = hashlib.sha256(source).hexdigest()
+    if digest == known_digest:
+        return digest, None
+    return digest, _python_imports(source, file_path)
+
+
+def check_directory(
+    target_dir: str,
+    cache: FileCache | None = None,
+    jobs: int = 1,
+    scope: StagedScope | None = None,
+) -> list[dict]:
+    """Scan directories to detect dependency violations
+
+    cache, when given, is reused for Python import extraction; the caller
+    saves it and reports its hit/miss counters. Files are read and parsed
+    across `jobs` processes; violations keep file order either way. A
+    violation depends on one file alone, so a changed-files scope limits
+    the scan to its staged files.
+    """
     config = load_config(target_dir)
     layers = config.get("layers", [])
     if not layers:
@@ -204,46 +311,71 @@ def check_directory(target_dir: str) -> list[dict]:
         name = layer["name"]
         allowed[name] = set(layer.get("allowed_deps", []))
 
-    violations = []
-
-    for root, dirs, files in os.walk(target_dir):
-        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
-
-        for fname in files:
-            ext = os.path.splitext(fname)[1]
-            if ext not in EXTRACTORS:
+    matcher = LayerMatcher(layers)
+    if scope is not None:
+        entries = [entry for entry in scope.files if entry.rel in scope.staged]  # staged only
+    else:
+        entries = FileIndex.load(target_dir).files(suffixes=EXTRACTORS, exclude_dirs=SKIP_DIRS)
+
+    files = []  # (rel_path, source_layer) in index order
+    imports_by_file: dict[str, list[str]] = {}
+    pending = []  # (rel_path, stat) for each task
+    tasks = []
+    for entry in entries:
+        rel_path = entry.rel
+        source_layer = matcher.resolve(rel_path)
+        if source_layer is None:
+            continue
+        files.append((rel_path, source_layer))
+
+        ext = os.path.splitext(rel_path)[1]
+        stat = (entry.mtime_ns, entry.size)
+        hashed = ext == ".py" and cache is not None
+        known = None
+        if hashed:
+            cached = cache.lookup(rel_path, stat)
+            if cached is not MISS:
+                imports_by_file[rel_path] = cached or []
                 continue
+            known = cache.known_digest(rel_path)
+        pending.append((rel_path, stat))
+        tasks.append((os.path.join(target_dir, rel_path), ext, hashed, known))
+
+    results = map_ordered(_extract_file, tasks, jobs)
+    for (rel_path, stat), (digest, imports) in zip(pending, results):
+        if digest is not None:
+            if imports is None:
+                imports = cache.record(rel_path, stat, digest)
+            else:
+                imports = cache.record(rel_path, stat, digest, imports)
+        imports_by_file[rel_path] = imports or []
 
-            file_path = os.path.join(root, fname)
-            rel_path = os.path.relpath(file_path, target_dir)
-            source_layer = resolve_layer(rel_path, layers)
-            if source_layer is None:
+    violations = []
+    for rel_path, source_layer in files:
+        for imp in imports_by_file[rel_path]:
+            target_layer = matcher.import_layer(imp, rel_path)
+            if target_layer is None or target_layer == source_layer:
                 continue
 
-            extractor = EXTRACTORS[ext]
-            imports = extractor(file_path)
-
-            for imp in imports:
-                target_layer = import_to_layer(imp, rel_path, layers)
-                if target_layer is None or target_layer == source_layer:
-                    continue
-
-                if target_layer not in allowed.get(source_layer, set()):
-                    violations.append(
-                        {
-                            "file": rel_path,
-                            "source_layer": source_layer,
-                            "target_layer": target_layer,
-                            "import": imp,
-                            "allowed": sorted(allowed.get(source_layer, set())),
-                        }
-                    )
+            if target_layer not in allowed.get(source_layer, set()):
+                violations.append(
+                    {
+                        "file": rel_path,
+                        "source_layer": source_layer,
+                        "target_layer": target_layer,
+                        "import": imp,
+                        "allowed": sorted(allowed.get(source_layer, set())),
+                    }
+                )
 
     return violations
 
 
 def main():
-    target_dir = sys.argv[1] if len(sys.argv) > 1 else "."
+    jobs, argv = pop_jobs_arg(sys.argv[1:])
+    use_cache = "--no-cache" not in argv
+    args = [a for a in argv if not a.startswith("--")]
+    target_dir = args[0] if args else "."
     target_dir = os.path.abspath(target_dir)
 
     config = load_config(target_dir)
@@ -257,10 +389,18 @@ def main():
         )
         sys.exit(0)
 
-    violations = check_directory(target_dir)
+    cache = FileCache(target_dir, "imports", IMPORT_CACHE_VERSION, enabled=use_cache)
+    scope = staged_scope(target_dir, EXTRACTORS, SKIP_DIRS, context=False)
+    violations = check_directory(target_dir, cache, jobs, scope)
+    # A changed-files run looks at a few files; keep the other entries.
+    cache.save(prune=scope is None)
+    cache_line = f"Import cache: {cache.summary()}"
+    if scope is not None:
+        cache_line += f"\nChanged-files mode: {len(scope.staged)} staged files checked"
 
     if not violations:
         print("\033[32m dependency layer check passed - no cross-layer violation\033[0m")
+        print(cache_line)
         sys.exit(0)
 
     print(f"\033[31m Found {len(violations)} dependency layer violations:\033[0m\n")
@@ -274,6 +414,7 @@ def main():
         )
         print()
 
+    print(cache_line)
     sys.exit(1)
 
 
@@ -105,6 +105,19 @@ for script in "${REPO_DIR}"/guards/python/*.py; do
   fi
 done
 
+# Check the shared Python guard library
+for script in "${REPO_DIR}"/guards/_lib/*.py; do
+  [[ -f "$script" ]] || continue
+  name=$(basename "$script")
+
+  if ! python3 -m py_compile "$script" 2>/dev/null; then
+    echo "FAIL: _lib/${name} has syntax errors"
+    ((errors++))
+  else
+    echo "OK: _lib/${name}"
+  fi
+done
+
 echo
 if [[ ${errors} -eq 0 ]]; then
   echo "All guard scripts valid."
@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""Refresh per-project events.snapshot files for gc-scheduled.sh."""
+
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "lib"))
+import event_snapshot  # noqa: E402
+
+
+def main() -> int:
+    log_dir = Path(os.environ["_GC_LOG_DIR"])
+    rebuilt = 0
+    failed = 0
+
+    for events_file in sorted(log_dir.glob("projects/*/events.jsonl")):
+        try:
+            if event_snapshot.refresh(events_file):
+                rebuilt += 1
+        except OSError as exc:
+            print(f"[ERROR] {events_file}: {exc}")
+            failed += 1
+
+    print(f"Rebuilt {rebuilt} event snapshots")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
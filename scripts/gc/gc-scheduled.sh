@@ -1,8 +1,9 @@
 #!/usr/bin/env bash
 # VibeGuard periodic GC — scheduled by launchd
 #
-# Execute log archiving + worktree cleaning, metrics pruning, learning digest,
-# and reflection reporting. Triggered by com.vibeguard.gc every Sunday at 3am.
+# Execute log archiving + worktree cleaning, metrics pruning, event snapshot
+# compaction, learning digest, and reflection reporting. Triggered by
+# com.vibeguard.gc every Sunday at 3am.
 #
 # Manually run: bash gc-scheduled.sh
 
@@ -157,6 +158,15 @@ run_session_metrics_cleanup() {
   echo
 }
 
+run_event_compaction() {
+  echo "--- Event Snapshot Compaction ---"
+  if ! _GC_LOG_DIR="${LOG_DIR}" python3 "${SCRIPT_DIR}/compact_events.py" 2>&1; then
+    echo "[ERROR] event compaction failed"
+    GC_FAILED=1
+  fi
+  echo
+}
+
 run_learning_digest() {
   echo "--- Regular learning (event log + code scanning unified signal source) ---"
   if ! _GC_LOG_DIR="${LOG_DIR}" \
@@ -200,6 +210,7 @@ trim_gc_log() {
   run_worktree_cleanup
   run_rule_budget_gc
   run_session_metrics_cleanup
+  run_event_compaction
   run_learning_digest
   run_reflection_digest
 
@@ -3,11 +3,14 @@
 
 from __future__ import annotations
 
-import json
 import os
 import sys
 from collections import Counter
 from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "lib"))
+from jsonl_reader import iter_jsonl  # noqa: E402
 
 
 log_dir = os.environ["_GC_LOG_DIR"]
@@ -36,18 +39,12 @@ for proj in os.listdir(projects_dir):
     metrics_file = os.path.join(proj_dir, "session-metrics.jsonl")
     if not os.path.exists(metrics_file):
         continue
-    with open(metrics_file, encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                metric = json.loads(line)
-                if metric.get("ts", "")[:10] >= cutoff_7d[:10]:
-                    metric["_project"] = proj
-                    all_sessions.append(metric)
-            except json.JSONDecodeError:
-                continue
+    for _lineno, metric, error in iter_jsonl(metrics_file, since=cutoff_7d[:10]):
+        if error is not None:
+            continue
+        if metric.get("ts", "")[:10] >= cutoff_7d[:10]:
+            metric["_project"] = proj
+            all_sessions.append(metric)
 
 if not all_sessions:
     print("No session data in the past 7 days, skip")
@@ -4,20 +4,29 @@ VibeGuard Weekly Health Report
 ==============================
 A thin aggregator over existing structured sources — it adds no new data
 layer. It reads:
-  - `vibeguard-runtime observe summary --json --days N` for trigger counts and
-    the pass/warn/block decision distribution
-  - `vibeguard-runtime observe health --json` for recent diagnostics
+  - `vibeguard-runtime observe batch --days N`, one read of the event log that
+    returns both the summary (trigger counts, pass/warn/block distribution)
+    and the health view (recent diagnostics); runtimes without `batch` are
+    asked for `observe summary` and `observe health` separately
   - triage.jsonl + rule-scorecard.json (via scripts/precision-tracker.py) for
     per-rule precision / FP risk and lifecycle stage
   - ~/.vibeguard/learn-adoptions.jsonl for skill adoption / zero-use evidence
 
 It normalizes everything into one small JSON schema (see below) and renders
-markdown from that same schema, so the two formats never drift.
+markdown from that same schema, so the two formats never drift. The JSON
+report also carries `timings_ms`, the wall time spent on each section.
+
+`--scope global --per-project` lists the project logs under the log root once,
+reads the triage, scorecard and adoption sources once, and builds each
+project's observe sections on a thread pool (`--jobs`). The result is one
+document: a `projects` list with a section per project, a `rollup` across
+them, and the shared precision and adoption sections.
 
 Usage:
   python3 scripts/health-report.py                       # 30-day project report, markdown
   python3 scripts/health-report.py --days 7 --format json
   python3 scripts/health-report.py --scope global
+  python3 scripts/health-report.py --scope global --per-project --format json
   python3 scripts/health-report.py --log-file /path/events.jsonl --output report.md
 
 Data rules (see docs/specs/GH556):
@@ -39,10 +48,15 @@ import json
 import os
 import subprocess
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+sys.path.insert(0, str(Path(__file__).resolve().parent / "lib"))
+from jsonl_reader import iter_jsonl  # noqa: E402
+
 SCHEMA_VERSION = 1
 
 # ---------------------------------------------------------------------------
@@ -129,6 +143,10 @@ def _run_observe(runtime: str, args: list[str]) -> tuple[int, str, str]:
     return proc.returncode, proc.stdout, proc.stderr
 
 
+def _looks_like_unknown_command(stderr: str) -> bool:
+    return "unknown observe command" in stderr.lower()
+
+
 def _looks_like_missing_log(stderr: str) -> bool:
     lowered = stderr.lower()
     return "does not exist" in lowered or "no such file" in lowered
@@ -193,6 +211,59 @@ def load_observe_health(
     return health, "ok"
 
 
+def load_observe(
+    runtime: str,
+    days: int,
+    scope: str,
+    project: str | None,
+    log_file: str | None,
+) -> tuple[dict[str, Any] | None, str, dict[str, Any] | None, str]:
+    """Return (summary, summary_status, health, health_status) from one log read.
+
+    A runtime that predates `observe batch` is asked for each view separately.
+    """
+    if log_file is not None and not Path(log_file).exists():
+        return None, "no_data", None, "no_data"
+
+    args = ["observe", "batch", "--days", str(days), "--scope", scope]
+    if project is not None:
+        args += ["--project", project]
+    if log_file is not None:
+        args += ["--log-file", log_file]
+
+    code, out, err = _run_observe(runtime, args)
+    if code != 0:
+        if _looks_like_unknown_command(err):
+            summary, summary_status = load_observe_summary(runtime, days, scope, project, log_file)
+            health, health_status = load_observe_health(runtime, scope, project, log_file)
+            return summary, summary_status, health, health_status
+        if _looks_like_missing_log(err):
+            return None, "no_data", None, "no_data"
+        raise HealthReportError(f"observe batch failed (exit {code}): {err.strip()}")
+    try:
+        batch = json.loads(out)
+    except json.JSONDecodeError as exc:
+        raise HealthReportError(f"observe batch emitted invalid JSON: {exc}") from exc
+    if not isinstance(batch, dict) or not all(
+        isinstance(batch.get(key), dict) for key in ("summary", "health")
+    ):
+        raise HealthReportError("observe batch must contain summary and health objects")
+    return batch["summary"], "ok", batch["health"], "ok"
+
+
+class SectionTimer:
+    """Wall time per report section, each measured from the end of the previous one."""
+
+    def __init__(self) -> None:
+        self.timings_ms: dict[str, float] = {}
+        self._last = time.perf_counter()
+
+    def lap(self, section: str) -> None:
+        now = time.perf_counter()
+        self.timings_ms[section] = round((now - self._last) * 1000, 1)
+        self._last = now
+
+
 # ---------------------------------------------------------------------------
 # Triage / precision adapter
 # ---------------------------------------------------------------------------
@@ -213,46 +284,40 @@ def load_triage_partitioned(
     backlog: list[dict[str, Any]] = []
     if not path.exists():
         return classified, backlog
-    with path.open(encoding="utf-8") as fh:
-        for lineno, raw in enumerate(fh, 1):
-            line = raw.strip()
-            if not line or line.startswith("#"):
-                continue
-            try:
-                rec = json.loads(line)
-            except json.JSONDecodeError as exc:
-                raise HealthReportError(
-                    f"triage.jsonl line {lineno}: malformed JSON ({exc})"
-                )
-            if not isinstance(rec, dict):
-                raise HealthReportError(
-                    f"triage.jsonl line {lineno}: expected object, got {type(rec).__name__}"
-                )
-            rule = rec.get("rule")
-            verdict = rec.get("verdict")
-            if not isinstance(rule, str) or not rule.strip():
-                backlog.append(
-                    {
-                        "line": lineno,
-                        "reason": "missing rule id",
-                        "verdict": verdict if isinstance(verdict, str) else None,
-                        "ts": rec.get("ts"),
-                        "context": rec.get("context") or rec.get("reason"),
-                    }
-                )
-                continue
-            if verdict == "unclassified":
-                backlog.append(
-                    {
-                        "line": lineno,
-                        "reason": "unclassified verdict",
-                        "rule": rule,
-                        "ts": rec.get("ts"),
-                        "context": rec.get("context") or rec.get("reason"),
-                    }
-                )
-                continue
-            classified.append(rec)
+    for lineno, rec, exc in iter_jsonl(path, comments=True):
+        if exc is not None:
+            raise HealthReportError(
+                f"triage.jsonl line {lineno}: malformed JSON ({exc})"
+            )
+        if not isinstance(rec, dict):
+            raise HealthReportError(
+                f"triage.jsonl line {lineno}: expected object, got {type(rec).__name__}"
+            )
+        rule = rec.get("rule")
+        verdict = rec.get("verdict")
+        if not isinstance(rule, str) or not rule.strip():
+            backlog.append(
+                {
+                    "line": lineno,
+                    "reason": "missing rule id",
+                    "verdict": verdict if isinstance(verdict, str) else None,
+                    "ts": rec.get("ts"),
+                    "context": rec.get("context") or rec.get("reason"),
+                }
+            )
+            continue
+        if verdict == "unclassified":
+            backlog.append(
+                {
+                    "line": lineno,
+                    "reason": "unclassified verdict",
+                    "rule": rule,
+                    "ts": rec.get("ts"),
+                    "context": rec.get("context") or rec.get("reason"),
+                }
+            )
+            continue
+        classified.append(rec)
     return classified, backlog
 
 
@@ -324,19 +389,13 @@ def load_adoptions(path: Path) -> list[dict[str, Any]]:
     records: list[dict[str, Any]] = []
     if not path.exists():
         return records
-    with path.open(encoding="utf-8") as fh:
-        for lineno, raw in enumerate(fh, 1):
-            line = raw.strip()
-            if not line:
-                continue
-            try:
-                rec = json.loads(line)
-            except json.JSONDecodeError as exc:
-                raise HealthReportError(
-                    f"learn-adoptions.jsonl line {lineno}: malformed JSON ({exc})"
-                )
-            if isinstance(rec, dict):
-                records.append(rec)
+    for lineno, rec, exc in iter_jsonl(path):
+        if exc is not None:
+            raise HealthReportError(
+                f"learn-adoptions.jsonl line {lineno}: malformed JSON ({exc})"
+            )
+        if isinstance(rec, dict):
+            records.append(rec)
     return records
 
 
@@ -374,17 +433,6 @@ def build_skill_usage(adoptions: list[dict[str, Any]]) -> list[dict[str, Any]]:
 # Report assembly
 # ---------------------------------------------------------------------------
 
-def _observed_rule_ids(summary: dict[str, Any] | None) -> set[str]:
-    if not summary:
-        return set()
-    ids = set()
-    for entry in summary.get("top_rule_ids", []) or []:
-        value = entry.get("value")
-        if isinstance(value, str) and value:
-            ids.add(value)
-    return ids
-
-
 def validated_block_counts(
     summary: dict[str, Any] | None,
     decision_counts: dict[str, Any],
@@ -431,36 +479,39 @@ def validated_block_counts(
     return counts, "available"
 
 
-def build_report(args: argparse.Namespace) -> dict[str, Any]:
-    runtime = resolve_runtime()
+def load_shared_sources(args: argparse.Namespace, timer: SectionTimer) -> dict[str, Any]:
+    """Read the triage, scorecard and adoption sources that do not depend on the event log."""
     triage_path = Path(args.triage_file)
     scorecard_path = Path(args.scorecard_file)
     adoptions_path = Path(args.adoptions_file)
 
-    data_sources: list[dict[str, Any]] = []
-
-    summary, summary_status = load_observe_summary(
-        runtime, args.days, args.scope, args.project, args.log_file
-    )
-    data_sources.append({"name": "observe.summary", "status": summary_status})
-
-    health, health_status = load_observe_health(
-        runtime, args.scope, args.project, args.log_file
-    )
-    data_sources.append({"name": "observe.health", "status": health_status})
-
     classified, backlog = load_triage_partitioned(triage_path)
+    timer.lap("triage")
     scorecard = load_scorecard(scorecard_path, DEFAULT_SCORECARD_SEED_FILE)
+    timer.lap("scorecard")
     triage_present = triage_path.exists() or scorecard_path.exists()
-    data_sources.append(
-        {"name": "precision.triage", "status": "ok" if triage_present else "no_data"}
-    )
-
     adoptions = load_adoptions(adoptions_path)
-    data_sources.append(
-        {"name": "learn.adoptions", "status": "ok" if adoptions_path.exists() else "no_data"}
-    )
+    timer.lap("adoptions")
+    return {
+        "classified": classified,
+        "backlog": backlog,
+        "scorecard": scorecard,
+        "adoptions": adoptions,
+        "data_sources": [
+            {"name": "precision.triage", "status": "ok" if triage_present else "no_data"},
+            {"name": "learn.adoptions", "status": "ok" if adoptions_path.exists() else "no_data"},
+        ],
+    }
 
+
+def build_observe_sections(
+    summary: dict[str, Any] | None,
+    days: int,
+    scope: str,
+    scorecard: dict[str, Any],
+    timer: SectionTimer,
+) -> dict[str, Any]:
+    """overview, rule_triggers and zero_trigger_rules for one observe summary."""
     # Overview -----------------------------------------------------------
     event_count = int(summary.get("event_count", 0)) if summary else 0
     no_data = summary is None or event_count == 0
@@ -471,8 +522,8 @@ def build_report(args: argparse.Namespace) -> dict[str, Any]:
     time_range = summary.get("time_range", {}) if summary else {}
     attention = summary.get("attention", {}) if summary else {}
     overview = {
-        "scope": args.scope,
-        "window_days": args.days,
+        "scope": scope,
+        "window_days": days,
         "no_data": no_data,
         "total_triggers": event_count,
         "decision_distribution": decision_counts,
@@ -482,6 +533,7 @@ def build_report(args: argparse.Namespace) -> dict[str, Any]:
         "first_ts": time_range.get("first_ts") or None,
         "last_ts": time_range.get("last_ts") or None,
     }
+    timer.lap("overview")
 
     # Rule triggers (rule id is the primary key) -------------------------
     rule_triggers: list[dict[str, Any]] = []
@@ -491,14 +543,12 @@ def build_report(args: argparse.Namespace) -> dict[str, Any]:
             if isinstance(value, str) and value:
                 rule_triggers.append({"rule": value, "count": int(entry.get("count", 0))})
     rule_triggers.sort(key=lambda item: (-item["count"], item["rule"]))
+    timer.lap("rule_triggers")
 
-    # Precision risks ----------------------------------------------------
-    precision_risks = build_precision_risks(classified, scorecard)
-
-    # Idle assets / downgrade candidates ---------------------------------
-    observed = _observed_rule_ids(summary)
+    # Zero-trigger rules -------------------------------------------------
+    observed = {item["rule"] for item in rule_triggers}
     zero_trigger_rules: list[dict[str, Any]] = []
-    if args.days >= ZERO_TRIGGER_MIN_DAYS and not no_data:
+    if days >= ZERO_TRIGGER_MIN_DAYS and not no_data:
         for rule in sorted(scorecard.get("rules", {})):
             if rule not in observed:
                 entry = scorecard["rules"][rule]
@@ -506,10 +556,45 @@ def build_report(args: argparse.Namespace) -> dict[str, Any]:
                     {
                         "rule": rule,
                         "stage": entry.get("stage", "experimental"),
-                        "evidence": f"no trigger in last {args.days} days",
+                        "evidence": f"no trigger in last {days} days",
                     }
                 )
-    zero_use_skills = build_skill_usage(adoptions)
+    return {
+        "overview": overview,
+        "rule_triggers": rule_triggers,
+        "zero_trigger_rules": zero_trigger_rules,
+    }
+
+
+def build_report(args: argparse.Namespace) -> dict[str, Any]:
+    runtime = resolve_runtime()
+
+    data_sources: list[dict[str, Any]] = []
+    timer = SectionTimer()
+
+    summary, summary_status, health, health_status = load_observe(
+        runtime, args.days, args.scope, args.project, args.log_file
+    )
+    data_sources.append({"name": "observe.summary", "status": summary_status})
+    data_sources.append({"name": "observe.health", "status": health_status})
+    timer.lap("observe")
+
+    shared = load_shared_sources(args, timer)
+    data_sources += shared["data_sources"]
+    classified = shared["classified"]
+    backlog = shared["backlog"]
+    scorecard = shared["scorecard"]
+
+    sections = build_observe_sections(summary, args.days, args.scope, scorecard, timer)
+    no_data = sections["overview"]["no_data"]
+
+    # Precision risks ----------------------------------------------------
+    precision_risks = build_precision_risks(classified, scorecard)
+    timer.lap("precision_risks")
+
+    # Idle assets / downgrade candidates ---------------------------------
+    zero_trigger_rules = sections["zero_trigger_rules"]
+    zero_use_skills = build_skill_usage(shared["adoptions"])
 
     downgrade_candidates: list[dict[str, Any]] = []
     for item in zero_trigger_rules:
@@ -530,6 +615,7 @@ def build_report(args: argparse.Namespace) -> dict[str, Any]:
                 "recommendation": "candidate for on-demand doc; keep pending human review",
             }
         )
+    timer.lap("idle_assets")
 
     # Follow-up actions --------------------------------------------------
     follow_up_actions: list[str] = []
@@ -549,6 +635,7 @@ def build_report(args: argparse.Namespace) -> dict[str, Any]:
         follow_up_actions.append(
             f"Evaluate {len(downgrade_candidates)} downgrade candidate(s) against the U-32 constraint budget."
         )
+    timer.lap("follow_up_actions")
 
     return {
         "schema_version": SCHEMA_VERSION,
@@ -556,8 +643,8 @@ def build_report(args: argparse.Namespace) -> dict[str, Any]:
         "scope": args.scope,
         "generated_ts": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
         "data_sources": data_sources,
-        "overview": overview,
-        "rule_triggers": rule_triggers,
+        "overview": sections["overview"],
+        "rule_triggers": sections["rule_triggers"],
         "precision_risks": precision_risks,
         "unclassified_backlog": backlog,
         "idle_assets": {
@@ -566,6 +653,219 @@ def build_report(args: argparse.Namespace) -> dict[str, Any]:
         },
         "downgrade_candidates": downgrade_candidates,
         "follow_up_actions": follow_up_actions,
+        "timings_ms": timer.timings_ms,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Per-project fan-out (--scope global --per-project)
+# ---------------------------------------------------------------------------
+
+def default_log_dir() -> Path:
+    """The runtime's log root: $VIBEGUARD_LOG_DIR, else ~/.vibeguard."""
+    explicit = os.environ.get("VIBEGUARD_LOG_DIR", "")
+    if explicit.strip():
+        return Path(explicit)
+    return Path.home() / ".vibeguard"
+
+
+def list_projects(log_dir: Path) -> list[dict[str, Any]]:
+    """Every projects/<hash>/ log directory, with the root recorded in .project-root."""
+    projects_dir = log_dir / "projects"
+    if not projects_dir.is_dir():
+        return []
+    projects: list[dict[str, Any]] = []
+    for entry in sorted(projects_dir.iterdir()):
+        if not entry.is_dir():
+            continue
+        try:
+            root = (entry / ".project-root").read_text(encoding="utf-8", errors="replace").strip()
+        except OSError:
+            root = ""
+        projects.append(
+            {
+                "project": entry.name,
+                "project_root": root or None,
+                "log_file": str(entry / "events.jsonl"),
+            }
+        )
+    return projects
+
+
+def build_project_section(
+    runtime: str,
+    project: dict[str, Any],
+    days: int,
+    scorecard: dict[str, Any],
+) -> dict[str, Any]:
+    """One project's observe-derived sections; runs on a worker thread.
+
+    A project whose log cannot be read keeps its section, with the error in
+    data_sources and an empty no-data view, so the other projects still report.
+    """
+    timer = SectionTimer()
+    try:
+        summary, summary_status = load_observe_summary(
+            runtime, days, "project", None, project["log_file"]
+        )
+        timer.lap("observe")
+        sections = build_observe_sections(summary, days, "project", scorecard, timer)
+        data_sources = [{"name": "observe.summary", "status": summary_status}]
+    except HealthReportError as exc:
+        timer.lap("observe")
+        sections = build_observe_sections(None, days, "project", scorecard, timer)
+        data_sources = [{"name": "observe.summary", "status": "error", "error": str(exc)}]
+    return {
+        "project": project["project"],
+        "project_root": project["project_root"],
+        "data_sources": data_sources,
+        **sections,
+        "timings_ms": timer.timings_ms,
+    }
+
+
+def build_rollup(
+    sections: list[dict[str, Any]],
+    days: int,
+    scorecard: dict[str, Any],
+) -> dict[str, Any]:
+    """Totals across project sections.
+
+    The block split is only summed when every project with data reports one;
+    a rule is idle only when it triggered in none of the projects, so no rule
+    is called idle while a project's log could not be read.
+    """
+    errored = [
+        section
+        for section in sections
+        if any(source["status"] == "error" for source in section["data_sources"])
+    ]
+    with_data = [section for section in sections if not section["overview"]["no_data"]]
+    decisions: dict[str, int] = {}
+    triggers: dict[str, int] = {}
+    for section in with_data:
+        for decision, count in section["overview"]["decision_distribution"].items():
+            decisions[decision] = decisions.get(decision, 0) + int(count)
+        for item in section["rule_triggers"]:
+            triggers[item["rule"]] = triggers.get(item["rule"], 0) + item["count"]
+
+    block_counts: dict[str, int] | None = None
+    if not with_data:
+        block_counts_status = "no_data"
+    elif all(section["overview"]["block_counts_status"] == "available" for section in with_data):
+        block_counts_status = "available"
+        block_counts = {}
+        for section in with_data:
+            for key, value in section["overview"]["block_counts"].items():
+                block_counts[key] = block_counts.get(key, 0) + value
+    else:
+        block_counts_status = "unavailable"
+
+    zero_trigger_rules: list[dict[str, Any]] = []
+    if days >= ZERO_TRIGGER_MIN_DAYS and with_data and not errored:
+        for rule in sorted(scorecard.get("rules", {})):
+            if rule not in triggers:
+                zero_trigger_rules.append(
+                    {
+                        "rule": rule,
+                        "stage": scorecard["rules"][rule].get("stage", "experimental"),
+                        "evidence": f"no trigger in any project in last {days} days",
+                    }
+                )
+
+    return {
+        "projects": len(sections),
+        "projects_with_data": len(with_data),
+        "projects_with_errors": len(errored),
+        "total_triggers": sum(section["overview"]["total_triggers"] for section in with_data),
+        "decision_distribution": decisions,
+        "block_counts": block_counts,
+        "block_counts_status": block_counts_status,
+        "rule_triggers": [
+            {"rule": rule, "count": count}
+            for rule, count in sorted(triggers.items(), key=lambda item: (-item[1], item[0]))
+        ],
+        "zero_trigger_rules": zero_trigger_rules,
+    }
+
+
+def build_per_project_report(args: argparse.Namespace) -> dict[str, Any]:
+    """One document with a section per project plus a rollup.
+
+    Projects are listed once, the triage, scorecard and adoption sources are
+    read once and shared, and each project's observe read runs on a pool of
+    args.jobs threads. Sections keep the listing order.
+    """
+    runtime = resolve_runtime()
+    timer = SectionTimer()
+
+    projects = list_projects(default_log_dir())
+    timer.lap("projects")
+    shared = load_shared_sources(args, timer)
+    scorecard = shared["scorecard"]
+
+    sections: list[dict[str, Any]] = []
+    if projects:
+        with ThreadPoolExecutor(max_workers=min(args.jobs, len(projects))) as pool:
+            sections = list(
+                pool.map(
+                    lambda project: build_project_section(runtime, project, args.days, scorecard),
+                    projects,
+                )
+            )
+    timer.lap("observe")
+
+    rollup = build_rollup(sections, args.days, scorecard)
+    timer.lap("rollup")
+    precision_risks = build_precision_risks(shared["classified"], scorecard)
+    timer.lap("precision_risks")
+    zero_use_skills = build_skill_usage(shared["adoptions"])
+
+    follow_up_actions: list[str] = []
+    no_data_projects = (
+        rollup["projects"] - rollup["projects_with_data"] - rollup["projects_with_errors"]
+    )
+    if rollup["projects_with_errors"]:
+        follow_up_actions.append(
+            f"{rollup['projects_with_errors']} project log(s) could not be read: see their data_sources errors."
+        )
+    if not projects:
+        follow_up_actions.append(
+            "No project logs found: confirm logging is enabled before trusting risk sections."
+        )
+    elif no_data_projects:
+        follow_up_actions.append(
+            f"{no_data_projects} project(s) have no event data in window: confirm logging is enabled there."
+        )
+    if shared["backlog"]:
+        follow_up_actions.append(
+            f"Triage {len(shared['backlog'])} unclassified / schema-gap candidate(s) so precision stays accurate."
+        )
+    if any(risk["at_risk"] for risk in precision_risks):
+        follow_up_actions.append(
+            "Review low-precision rules flagged under precision_risks before promotion."
+        )
+    idle_count = len(rollup["zero_trigger_rules"]) + len(zero_use_skills)
+    if idle_count:
+        follow_up_actions.append(
+            f"Evaluate {idle_count} downgrade candidate(s) against the U-32 constraint budget."
+        )
+    timer.lap("follow_up_actions")
+
+    return {
+        "schema_version": SCHEMA_VERSION,
+        "window_days": args.days,
+        "scope": "global",
+        "per_project": True,
+        "generated_ts": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "data_sources": shared["data_sources"],
+        "projects": sections,
+        "rollup": rollup,
+        "precision_risks": precision_risks,
+        "unclassified_backlog": shared["backlog"],
+        "zero_use_skills": zero_use_skills,
+        "follow_up_actions": follow_up_actions,
+        "timings_ms": timer.timings_ms,
     }
 
 
@@ -683,6 +983,89 @@ def render_markdown(report: dict[str, Any]) -> str:
     return "\n".join(lines)
 
 
+def render_per_project_markdown(report: dict[str, Any]) -> str:
+    lines: list[str] = []
+    rollup = report["rollup"]
+    lines.append("# VibeGuard Health Report")
+    lines.append("")
+    lines.append("- Scope: **global**, per project")
+    lines.append(f"- Window: last **{report['window_days']}** days")
+    lines.append(f"- Generated: {report['generated_ts']}")
+    sources = ", ".join(f"{s['name']}={s['status']}" for s in report["data_sources"])
+    lines.append(f"- Data sources: {sources}")
+    lines.append("")
+
+    lines.append("## Rollup")
+    lines.append("")
+    lines.append(
+        f"- Projects: {rollup['projects']} ({rollup['projects_with_data']} with data, "
+        f"{rollup['projects_with_errors']} unreadable)"
+    )
+    lines.append(f"- Total triggers: {rollup['total_triggers']}")
+    dist = rollup["decision_distribution"]
+    dist_str = ", ".join(f"{k}={dist[k]}" for k in sorted(dist)) if dist else "(none)"
+    lines.append(f"- Decision distribution: {dist_str}")
+    lines.append(f"- Block split: **{rollup['block_counts_status']}**")
+    if rollup["block_counts_status"] == "available":
+        block_counts = rollup["block_counts"]
+        lines.append(f"  - Total blocks: {block_counts['total_blocks']}")
+        lines.append(f"  - Protocol errors: {block_counts['protocol_errors']}")
+        lines.append(f"  - Non-protocol blocks: {block_counts['non_protocol_blocks']}")
+    lines.append("")
+
+    lines.append("## Projects")
+    lines.append("")
+    if report["projects"]:
+        lines.append("| Project | Root | Triggers | Decisions | Top rule |")
+        lines.append("| --- | --- | --- | --- | --- |")
+        for section in report["projects"]:
+            overview = section["overview"]
+            if any(source["status"] == "error" for source in section["data_sources"]):
+                triggers, decisions = "ERROR", "-"
+            elif overview["no_data"]:
+                triggers, decisions = "NO DATA", "-"
+            else:
+                triggers = str(overview["total_triggers"])
+                dist = overview["decision_distribution"]
+                decisions = ", ".join(f"{k}={dist[k]}" for k in sorted(dist)) or "-"
+            top = section["rule_triggers"][0]["rule"] if section["rule_triggers"] else "-"
+            lines.append(
+                f"| {section['project']} | {section['project_root'] or '-'} | {triggers} | {decisions} | {top} |"
+            )
+    else:
+        lines.append("(no project logs)")
+    lines.append("")
+
+    lines.append("## Precision Risk")
+    lines.append("")
+    at_risk = [risk["rule"] for risk in report["precision_risks"] if risk["at_risk"]]
+    lines.append(f"- Rules tracked: {len(report['precision_risks'])}")
+    lines.append(f"- At risk: {', '.join(at_risk) if at_risk else '(none)'}")
+    lines.append(f"- Unclassified backlog: {len(report['unclassified_backlog'])}")
+    lines.append("")
+
+    lines.append("## Idle Assets")
+    lines.append("")
+    lines.append(f"- Zero-trigger rules in every project ({len(rollup['zero_trigger_rules'])}):")
+    for item in rollup["zero_trigger_rules"]:
+        lines.append(f"  - {item['rule']} ({item['stage']}) — {item['evidence']}")
+    lines.append(f"- Zero-use skills ({len(report['zero_use_skills'])}):")
+    for item in report["zero_use_skills"]:
+        lines.append(f"  - {item['skill']} — {item['evidence']}")
+    lines.append("")
+
+    lines.append("## Follow-up Actions")
+    lines.append("")
+    if report["follow_up_actions"]:
+        for action in report["follow_up_actions"]:
+            lines.append(f"- {action}")
+    else:
+        lines.append("(none)")
+    lines.append("")
+
+    return "\n".join(lines)
+
+
 # ---------------------------------------------------------------------------
 # CLI
 # ---------------------------------------------------------------------------
@@ -709,6 +1092,17 @@ def build_parser() -> argparse.ArgumentParser:
         help="output format (default: markdown)",
     )
     p.add_argument("--output", metavar="PATH", help="write to PATH instead of stdout")
+    p.add_argument(
+        "--per-project",
+        action="store_true",
+        help="with --scope global, one section per project plus a rollup",
+    )
+    p.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="projects read at once with --per-project (default: CPU count)",
+    )
     p.add_argument(
         "--triage-file",
         metavar="PATH",
@@ -735,14 +1129,22 @@ def main(argv: list[str] | None = None) -> int:
     if args.days <= 0:
         print("[ERROR] --days must be a positive integer", file=sys.stderr)
         return 2
+    if args.jobs <= 0:
+        print("[ERROR] --jobs must be a positive integer", file=sys.stderr)
+        return 2
+    if args.per_project and (args.scope != "global" or args.project or args.log_file):
+        print("[ERROR] --per-project needs --scope global and no --project / --log-file", file=sys.stderr)
+        return 2
     try:
-        report = build_report(args)
+        report = build_per_project_report(args) if args.per_project else build_report(args)
     except HealthReportError as exc:
         print(f"[ERROR] {exc}", file=sys.stderr)
         return 1
 
     if args.format == "json":
         rendered = json.dumps(report, indent=2, ensure_ascii=False, sort_keys=True) + "\n"
+    elif args.per_project:
+        rendered = render_per_project_markdown(report) + "\n"
     else:
         rendered = render_markdown(report) + "\n"
 
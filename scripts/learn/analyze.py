@@ -4,22 +4,53 @@
 from __future__ import annotations
 
 import argparse
+import bisect
+import glob
 import hashlib
 import json
+import math
 import os
 import subprocess
 import sys
+import threading
 import time
 from collections import Counter, defaultdict
-from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import nullcontext
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "lib"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+import event_snapshot  # noqa: E402
+from jsonl_reader import loads, ts_before  # noqa: E402
+from trends import TrendDetector  # noqa: E402
 
 DEFAULT_GUARD_TIMEOUT_SECONDS = 30.0
+DEFAULT_GUARD_JOBS = 4
 DEFAULT_LEARNING_WINDOW_DAYS = 7
 DEFAULT_PREVIEW_BUDGET_MS = 2000
+PYTHON_PROJECT_MARKERS = ("pyproject.toml", "setup.py", "setup.cfg", "requirements.txt")
+# Python guards that emit `--format json`; parsed instead of scraping stdout.
+JSON_PYTHON_GUARDS = ("check_dead_shims.py",)
+LEARN_CHECKPOINT_FILE = "learn-checkpoint.json"
+LEARN_CHECKPOINT_VERSION = 1
+# Bytes before a checkpoint offset that must be unchanged for the log to count as appended to.
+CHECKPOINT_TAIL_BYTES = 256
+GUARD_CACHE_FILE = "learn-guard-cache.json"
+GUARD_CACHE_VERSION = 2
+# Long enough to outlive the gap between daily scheduled runs.
+GUARD_CACHE_TTL_SECONDS = 3 * 24 * 3600
+GUARD_CACHE_MAX_ENTRIES = 2048
+PROJECT_INDEX_FILE = "learn-project-index.json"
+PROJECT_INDEX_VERSION = 1
+# Not walked when fingerprinting a project tree outside git.
+TREE_FINGERPRINT_SKIP_DIRS = frozenset(
+    {".git", ".hg", ".svn", "node_modules", "target", ".venv", "venv", "__pycache__", ".vibeguard"}
+)
 
 
 @dataclass
@@ -28,6 +59,10 @@ class AnalyzerOptions:
     guard_timeout_seconds: float
     max_events: int | None
     skip_stale_code_scan: bool
+    resume_checkpoints: bool = True
+    save_checkpoints: bool = False
+    use_snapshots: bool = True
+    guard_jobs: int = DEFAULT_GUARD_JOBS
 
 
 class RunState:
@@ -45,24 +80,86 @@ class RunState:
     def budget_exceeded(self) -> bool:
         if self.budget_ms is None:
             return False
-        elapsed_ms = (time.monotonic() - self.start) * 1000
-        if elapsed_ms >= self.budget_ms:
+        if self.elapsed_ms() >= self.budget_ms:
             self.mark_partial("budget_ms")
             return True
         return False
 
-    def remaining_seconds(self, default_timeout: float) -> float:
+    def elapsed_ms(self) -> float:
+        return (time.monotonic() - self.start) * 1000
+
+    def remaining_ms(self) -> float | None:
         if self.budget_ms is None:
-            return default_timeout
-        elapsed_ms = (time.monotonic() - self.start) * 1000
-        remaining_ms = max(self.budget_ms - elapsed_ms, 0)
-        return max(min(default_timeout, remaining_ms / 1000), 0.001)
+            return None
+        return max(self.budget_ms - self.elapsed_ms(), 0)
 
+    def project_state(self) -> RunState:
+        """A fresh state for one project, bounded by what is left of this run's budget."""
+        return RunState(self.remaining_ms())
+
+
+# Below this many bytes between the bisection bounds, lines are stepped through.
+WINDOW_SEEK_MIN_SPAN = 64 * 1024
+# Lines read past a bisection point looking for one with a usable "ts".
+WINDOW_SEEK_PROBE_LINES = 32
+# Session sets hold this many keys exactly before folding into a HyperLogLog.
+SESSION_SKETCH_EXACT_LIMIT = 64
+# 2**10 one-byte registers: 1 KiB per sketch, 1.04 / sqrt(1024) ≈ 3.25% relative standard error.
+SESSION_SKETCH_PRECISION = 10
+SESSION_SKETCH_ERROR = round(1.04 / math.sqrt(1 << SESSION_SKETCH_PRECISION), 4)
+
+
+def _line_day(raw: bytes) -> str | None:
+    try:
+        timestamp = loads(raw, "replace").get("ts")
+    except (ValueError, AttributeError):
+        return None
+    return timestamp[:10] if isinstance(timestamp, str) and timestamp else None
 
-def iter_text_lines_lossy(path: str):
-    """Yield UTF-8 text lines without letting malformed bytes abort learning."""
-    with open(path, encoding="utf-8", errors="replace") as handle:
-        yield from handle
+
+def _probe_day(handle, offset: int) -> tuple[str | None, int]:
+    """Day of the first dated line starting after offset, and the offset just past that line.
+
+    Returns (None, offset) when no dated line turns up within the probe limit.
+    """
+    handle.seek(offset)
+    if offset:
+        handle.readline()  # finish the line offset landed in
+    for _ in range(WINDOW_SEEK_PROBE_LINES):
+        raw = handle.readline()
+        if not raw:
+            break
+        day = _line_day(raw)
+        if day is not None:
+            return day, handle.tell()
+    return None, offset
+
+
+def seek_window_start(path: str, cutoff_day: str) -> int:
+    """Byte offset at or before the first line dated cutoff_day or later.
+
+    events.jsonl is appended in timestamp order, so the window is a suffix
+    of the file: bisect on byte offsets, moving the lower bound past lines
+    known to be older, then step through the last small span line by line.
+    Undated or malformed lines stop the search and are left to the caller.
+    """
+    with open(path, "rb") as handle:
+        handle.seek(0, os.SEEK_END)
+        lo, hi = 0, handle.tell()
+        while hi - lo > WINDOW_SEEK_MIN_SPAN:
+            mid = (lo + hi) // 2
+            day, line_end = _probe_day(handle, mid)
+            if day is not None and day < cutoff_day:
+                lo = line_end
+            else:
+                hi = mid
+        handle.seek(lo)
+        for raw in iter(handle.readline, b""):
+            day = _line_day(raw)
+            if day is None or day >= cutoff_day:
+                break
+            lo += len(raw)
+    return lo
 
 
 def read_text_lossy(path: str) -> str:
@@ -127,7 +224,69 @@ def read_project_root(project_dir: str) -> str | None:
     return root or None
 
 
-def resolve_current_project(log_dir: str, project_root: str | None, project_hash: str | None) -> dict[str, Any]:
+def projects_mtime_ns(projects_dir: str) -> int | None:
+    try:
+        return os.stat(projects_dir).st_mtime_ns
+    except OSError:
+        return None
+
+
+def load_project_index(log_dir: str) -> dict[str, Any]:
+    """The saved root -> project id index, or an empty one when missing or unreadable."""
+    try:
+        with open(os.path.join(log_dir, PROJECT_INDEX_FILE), encoding="utf-8") as handle:
+            data = json.load(handle)
+    except (OSError, ValueError):
+        return {"roots": {}, "projects_mtime_ns": None}
+    if (
+        not isinstance(data, dict)
+        or data.get("version") != PROJECT_INDEX_VERSION
+        or not isinstance(data.get("roots"), dict)
+    ):
+        return {"roots": {}, "projects_mtime_ns": None}
+    return data
+
+
+def save_project_index(log_dir: str, projects: list[dict[str, Any]], mtime_ns: int | None) -> None:
+    """Replace the index with the roots of projects.
+
+    mtime_ns is the projects/ directory's mtime when they were listed, or None
+    when the list is incomplete; only a complete index answers "not indexed".
+    """
+    roots: dict[str, str] = {}
+    for project in projects:
+        if project.get("project_root"):
+            # The first directory in name order wins, as in the full scan.
+            roots.setdefault(resolve_path_lossy(project["project_root"]), project["project"])
+    path = os.path.join(log_dir, PROJECT_INDEX_FILE)
+    tmp_path = f"{path}.tmp.{os.getpid()}"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as handle:
+            json.dump({"version": PROJECT_INDEX_VERSION, "projects_mtime_ns": mtime_ns, "roots": roots}, handle)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+
+def indexed_git_root(path: str, roots: dict[str, str]) -> str:
+    """Git root of path without running git, when the nearest .git is an indexed root.
+
+    Indexed roots came from `git rev-parse --show-toplevel` in the hooks, so a
+    directory that holds .git and is one of them is that repository's root.
+    """
+    current = resolve_path_lossy(path)
+    while True:
+        if os.path.exists(os.path.join(current, ".git")):
+            return current if current in roots else ""
+        parent = os.path.dirname(current)
+        if parent == current:
+            return ""
+        current = parent
+
+
+def resolve_current_project(
+    log_dir: str, project_root: str | None, project_hash: str | None, save_index: bool = False
+) -> dict[str, Any]:
     projects_dir = os.path.join(log_dir, "projects")
     if project_hash:
         project_id = project_id_from_hash(project_hash)
@@ -138,20 +297,26 @@ def resolve_current_project(log_dir: str, project_root: str | None, project_hash
             "project_root": read_project_root(project_dir) or project_root,
         }
 
-    root = (git_root(project_root) or project_root) if project_root else (git_root(os.getcwd()) or os.getcwd())
-    root = resolve_path_lossy(root)
-    if os.path.isdir(projects_dir):
-        for name in sorted(os.listdir(projects_dir)):
-            candidate_dir = os.path.join(projects_dir, name)
-            if not os.path.isdir(candidate_dir):
-                continue
-            mapped_root = read_project_root(candidate_dir)
-            if mapped_root and roots_match(mapped_root, root):
-                return {
-                    "project": name,
-                    "project_dir": candidate_dir,
-                    "project_root": resolve_path_lossy(mapped_root),
-                }
+    index = load_project_index(log_dir)
+    roots: dict[str, str] = index["roots"]
+    start = project_root or os.getcwd()
+    root = resolve_path_lossy(indexed_git_root(start, roots) or git_root(start) or start)
+
+    # An indexed id and the hooks' own hash of the root are checked before any scan.
+    for name in (roots.get(root), sha256_short(root)):
+        if not name:
+            continue
+        candidate_dir = os.path.join(projects_dir, name)
+        mapped_root = read_project_root(candidate_dir)
+        if mapped_root and roots_match(mapped_root, root):
+            return {"project": name, "project_dir": candidate_dir, "project_root": resolve_path_lossy(mapped_root)}
+
+    mtime_ns = projects_mtime_ns(projects_dir)
+    # No project directory was added since the index listed them all, so the root has none.
+    if mtime_ns is not None and (mtime_ns != index.get("projects_mtime_ns") or root in roots):
+        found = scan_project_roots(log_dir, root, mtime_ns, save_index)
+        if found is not None:
+            return found
 
     project_id = sha256_short(root)
     return {
@@ -161,6 +326,28 @@ def resolve_current_project(log_dir: str, project_root: str | None, project_hash
     }
 
 
+def scan_project_roots(log_dir: str, root: str, mtime_ns: int, save_index: bool) -> dict[str, Any] | None:
+    """Read every project's root file for root, optionally saving them all as the index."""
+    projects_dir = os.path.join(log_dir, "projects")
+    found: dict[str, Any] | None = None
+    listed: list[dict[str, Any]] = []
+    for name in sorted(os.listdir(projects_dir)):
+        candidate_dir = os.path.join(projects_dir, name)
+        if not os.path.isdir(candidate_dir):
+            continue
+        mapped_root = read_project_root(candidate_dir)
+        listed.append({"project": name, "project_root": mapped_root})
+        if found is None and mapped_root and roots_match(mapped_root, root):
+            found = {
+                "project": name,
+                "project_dir": candidate_dir,
+                "project_root": resolve_path_lossy(mapped_root),
+            }
+    if save_index:
+        save_project_index(log_dir, listed, mtime_ns)
+    return found
+
+
 def resolve_global_projects(log_dir: str, max_projects: int | None, state: RunState) -> list[dict[str, Any]]:
     projects_dir = os.path.join(log_dir, "projects")
     if not os.path.isdir(projects_dir):
@@ -210,14 +397,41 @@ def detect_guards(project_root: str, vibeguard_dir: str) -> list[tuple[str, str]
         for filename in os.listdir(go_dir) if os.path.isdir(go_dir) else []:
             if filename.startswith("check_") and filename.endswith(".sh"):
                 guards.append((os.path.join(go_dir, filename), "GO"))
+    if any(os.path.exists(os.path.join(project_root, marker)) for marker in PYTHON_PROJECT_MARKERS):
+        for filename in JSON_PYTHON_GUARDS:
+            script = os.path.join(guards_dir, "python", filename)
+            if os.path.exists(script):
+                guards.append((script, "PY"))
     return guards
 
 
+def parse_json_guard_output(stdout: str) -> list[str] | None:
+    """Findings of a `--format json` guard as "[RULE] path — message" lines; None if unparseable."""
+    try:
+        report = json.loads(stdout)
+    except ValueError:
+        return None
+    findings = report.get("findings") if isinstance(report, dict) else None
+    if not isinstance(findings, list):
+        return None
+    lines = []
+    for finding in findings:
+        if not isinstance(finding, dict):
+            continue
+        rule = finding.get("rule", "")
+        lines.append(f"[{rule}] {finding.get('path', '')} — {finding.get('message', '')}".strip())
+    return lines
+
+
 def run_guard(script: str, project_root: str, timeout_seconds: float) -> tuple[int, list[str], str | None]:
     """Run a guard script and return (violation_count, examples, diagnostic_error)."""
+    json_output = script.endswith(".py")
+    command = (
+        [sys.executable, script, project_root, "--format", "json"] if json_output else ["bash", script, project_root]
+    )
     try:
         result = subprocess.run(
-            ["bash", script, project_root],
+            command,
             capture_output=True,
             text=True,
             timeout=timeout_seconds,
@@ -229,8 +443,15 @@ def run_guard(script: str, project_root: str, timeout_seconds: float) -> tuple[i
         return 0, [], f"os_error:{exc.__class__.__name__}"
 
     output = result.stdout.strip()
-    violations = [line.lstrip("\0330123456789;m").strip() for line in output.splitlines()]
-    violations = [line for line in violations if line.startswith("[")]
+    if json_output:
+        violations = parse_json_guard_output(output)
+        if violations is None:
+            sample = result.stderr.strip() or output
+            examples = [sample.splitlines()[0][:200]] if sample else []
+            return 0, examples, f"guard_output:{result.returncode}"
+    else:
+        violations = [line.lstrip("\0330123456789;m").strip() for line in output.splitlines()]
+        violations = [line for line in violations if line.startswith("[")]
     if violations:
         return len(violations), violations[:3], None
     if result.returncode != 0:
@@ -240,6 +461,160 @@ def run_guard(script: str, project_root: str, timeout_seconds: float) -> tuple[i
     return 0, [], None
 
 
+def tree_fingerprint(project_root: str) -> str | None:
+    """Digest of a project tree's current state, or None when it cannot be taken.
+
+    In a git checkout this is HEAD plus the content of every modified or
+    untracked file; elsewhere it is the path, mtime and size of every file.
+    """
+    digest = hashlib.sha256()
+    try:
+        head = subprocess.run(
+            ["git", "-C", project_root, "rev-parse", "--show-toplevel", "HEAD"],
+            capture_output=True,
+            text=True,
+            timeout=5,
+            check=False,
+        )
+        status = subprocess.run(
+            ["git", "-C", project_root, "status", "--porcelain", "-z", "--untracked-files=all"],
+            capture_output=True,
+            timeout=30,
+            check=False,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        head = status = None
+
+    if head is not None and status is not None and head.returncode == 0 and status.returncode == 0:
+        toplevel, commit = head.stdout.splitlines()[:2]
+        digest.update(f"git:{commit}\0".encode("utf-8"))
+        digest.update(status.stdout)
+        for entry in status.stdout.split(b"\0"):
+            # "XY path", except the bare source path that follows a rename.
+            path = os.path.join(toplevel, os.fsdecode(entry[3:] if entry[2:3] == b" " else entry))
+            if os.path.isfile(path):
+                try:
+                    with open(path, "rb") as handle:
+                        digest.update(hashlib.sha256(handle.read()).digest())
+                except OSError:
+                    return None
+        return digest.hexdigest()
+
+    digest.update(b"stat\0")
+    try:
+        for dirpath, dirnames, filenames in os.walk(project_root):
+            dirnames[:] = sorted(name for name in dirnames if name not in TREE_FINGERPRINT_SKIP_DIRS)
+            for filename in sorted(filenames):
+                path = os.path.join(dirpath, filename)
+                st = os.lstat(path)
+                digest.update(f"{os.path.relpath(path, project_root)}\0{st.st_mtime_ns}\0{st.st_size}\0".encode())
+    except OSError:
+        return None
+    return digest.hexdigest()
+
+
+class GuardResultCache:
+    """run_guard() results keyed by guard code hash and project tree fingerprint.
+
+    The code hash covers the guard script and the helpers it loads: its
+    directory's common.sh and guards/_lib/*.py.
+
+    Stored as one JSON file under the log directory and shared by every
+    project. Entries expire after ttl_seconds and the least recently used
+    are evicted past max_entries. Only clean runs are cached: timeouts and
+    guard failures are retried on the next run. Safe to use from the code
+    scan thread pool.
+    """
+
+    def __init__(self, path: str, ttl_seconds: float, max_entries: int) -> None:
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._now = time.time()
+        self._lock = threading.Lock()
+        self._file_hashes: dict[str, str | None] = {}
+        self._dirty = False
+        self._entries: dict[str, dict[str, Any]] = {}
+        if os.path.exists(path):
+            try:
+                data = json.loads(read_text_lossy(path))
+            except ValueError:
+                data = None
+            if isinstance(data, dict) and data.get("version") == GUARD_CACHE_VERSION:
+                entries = data.get("entries")
+                self._entries = entries if isinstance(entries, dict) else {}
+
+    def key(self, guard_script: str, project_root: str, fingerprint: str) -> str | None:
+        guard_dir = os.path.dirname(guard_script)
+        # Shell guards source their directory's common.sh; Python guards import guards/_lib.
+        helpers = sorted(
+            [
+                os.path.join(guard_dir, "common.sh"),
+                *glob.glob(os.path.join(os.path.dirname(guard_dir), "_lib", "*.py")),
+            ]
+        )
+        with self._lock:
+            script_hash = self._file_hash(guard_script)
+            helper_hashes = [f"{os.path.basename(path)}:{self._file_hash(path)}" for path in helpers]
+        if script_hash is None:
+            return None
+        code_hash = "\0".join([script_hash, *helper_hashes])
+        return sha256_short(f"{code_hash}\0{resolve_path_lossy(project_root)}\0{fingerprint}", 32)
+
+    def _file_hash(self, path: str) -> str | None:
+        """sha256 of path's contents, read once per run; None when unreadable. Caller holds the lock."""
+        if path not in self._file_hashes:
+            try:
+                with open(path, "rb") as handle:
+                    self._file_hashes[path] = hashlib.sha256(handle.read()).hexdigest()
+            except OSError:
+                self._file_hashes[path] = None
+        return self._file_hashes[path]
+
+    def get(self, key: str) -> tuple[int, list[str], None] | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or self._now - entry.get("stored", 0) > self.ttl_seconds:
+                self.misses += 1
+                return None
+            self.hits += 1
+            entry["used"] = self._now
+            self._dirty = True
+            return int(entry["count"]), list(entry["examples"]), None
+
+    def put(self, key: str, violation_count: int, examples: list[str]) -> None:
+        with self._lock:
+            self._entries[key] = {
+                "stored": self._now,
+                "used": self._now,
+                "count": violation_count,
+                "examples": examples,
+            }
+            self._dirty = True
+
+    def save(self) -> None:
+        with self._lock:
+            live = {
+                key: entry
+                for key, entry in self._entries.items()
+                if self._now - entry.get("stored", 0) <= self.ttl_seconds
+            }
+            if len(live) > self.max_entries:
+                recent = sorted(live, key=lambda key: live[key].get("used", 0), reverse=True)
+                live = {key: live[key] for key in recent[: self.max_entries]}
+            if not self._dirty and len(live) == len(self._entries):
+                return
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            tmp_path = f"{self.path}.tmp.{os.getpid()}"
+            with open(tmp_path, "w", encoding="utf-8") as handle:
+                json.dump({"version": GUARD_CACHE_VERSION, "entries": live}, handle, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+            self._entries = live
+            self._dirty = False
+
+
 def extract_edit_path(detail: str) -> str:
     parts = detail.strip().split()
     if not parts:
@@ -257,6 +632,27 @@ def event_edit_path(event: dict[str, Any]) -> str:
     return ""
 
 
+def classify_edit(event: dict[str, Any], project_root: str | None) -> tuple[str, str, str] | None:
+    """(path_relation, tally_key, normalized_path) for an Edit event, or None."""
+    if event.get("tool") != "Edit":
+        return None
+    raw_path = event_edit_path(event)
+    relation, normalized, display = classify_project_path(raw_path, project_root)
+    if relation == "in_project":
+        return relation, display, normalized
+    if relation == "external":
+        return relation, normalized, normalized
+    if raw_path:
+        return relation, display or normalized or raw_path, normalized or raw_path
+    return None
+
+
+def trend_edit_key(event: dict[str, Any], project_root: str | None) -> str | None:
+    """The hot_files key an event counts towards: its edited path unless outside the project."""
+    edit = classify_edit(event, project_root)
+    return edit[1] if edit is not None and edit[0] != "external" else None
+
+
 def classify_project_path(raw_path: str, project_root: str | None) -> tuple[str, str, str]:
     """Return (path_relation, normalized_path, display_path)."""
     if not raw_path:
@@ -280,10 +676,6 @@ def classify_project_path(raw_path: str, project_root: str | None) -> tuple[str,
     return relation, normalized, display
 
 
-def session_count(sessions: set[str]) -> int:
-    return len({session for session in sessions if session})
-
-
 def signal_identity(project_id: str, signal: dict[str, Any]) -> str:
     if signal["type"] in {"repeated_warn", "chronic_block"}:
         normalized_key = f'reason:{signal.get("reason", "")}'
@@ -308,18 +700,427 @@ def signal_identity(project_id: str, signal: dict[str, Any]) -> str:
     return "learn:" + sha256_short(encoded, 16)
 
 
-def make_signal(project_id: str, signal: dict[str, Any], sessions: set[str]) -> dict[str, Any]:
-    affected_sessions = session_count(sessions)
-    signal["affected_sessions"] = affected_sessions
-    signal["sessions"] = affected_sessions
+def session_fields(sessions: SessionSketch) -> dict[str, Any]:
+    """affected_sessions, plus its relative standard error once the count is an estimate."""
+    fields: dict[str, Any] = {"affected_sessions": sessions.count()}
+    if not sessions.exact:
+        fields["affected_sessions_error"] = SESSION_SKETCH_ERROR
+    return fields
+
+
+def make_signal(project_id: str, signal: dict[str, Any], sessions: SessionSketch) -> dict[str, Any]:
+    signal.update(session_fields(sessions))
+    signal["sessions"] = signal["affected_sessions"]
     signal["signal_id"] = signal_identity(project_id, signal)
     return signal
 
 
+def sketch_session(session: str) -> str:
+    """Short stable stand-in for a session ID in persisted rollups."""
+    return sha256_short(session)
+
+
+class SessionSketch:
+    """Distinct sessions seen: sketch_session() keys, exact while few, then a HyperLogLog.
+
+    Up to SESSION_SKETCH_EXACT_LIMIT keys are kept as a set and counted
+    exactly. Past that they are folded into 2**SESSION_SKETCH_PRECISION
+    registers, so a sketch never grows beyond 1 KiB however many sessions a
+    log holds, and count() becomes an estimate with relative standard error
+    SESSION_SKETCH_ERROR. Sketches merge without losing accuracy.
+    """
+
+    __slots__ = ("keys", "registers")
+
+    def __init__(self) -> None:
+        self.keys: set[str] | None = set()
+        self.registers: bytearray | None = None
+
+    @property
+    def exact(self) -> bool:
+        return self.registers is None
+
+    def add(self, key: str) -> None:
+        if self.keys is None:
+            self._fold(key)
+            return
+        self.keys.add(key)
+        if len(self.keys) > SESSION_SKETCH_EXACT_LIMIT:
+            self._to_registers()
+
+    def update(self, other: SessionSketch) -> None:
+        if other.registers is None:
+            for key in other.keys:
+                self.add(key)
+            return
+        if self.registers is None:
+            self._to_registers()
+        self.registers[:] = bytes(map(max, self.registers, other.registers))
+
+    def count(self) -> int:
+        if self.registers is None:
+            return len(self.keys)
+        m = len(self.registers)
+        estimate = 0.7213 / (1 + 1.079 / m) * m * m / sum(2.0 ** -rank for rank in self.registers)
+        zeros = self.registers.count(0)
+        if estimate <= 2.5 * m and zeros:
+            estimate = m * math.log(m / zeros)  # linear counting for small cardinalities
+        return round(estimate)
+
+    def _to_registers(self) -> None:
+        keys, self.keys = self.keys, None
+        self.registers = bytearray(1 << SESSION_SKETCH_PRECISION)
+        for key in keys:
+            self._fold(key)
+
+    def _fold(self, key: str) -> None:
+        # Keys are 32-bit hash prefixes: the top bits pick a register, the rest give the rank.
+        value = int(key, 16)
+        rest_bits = 32 - SESSION_SKETCH_PRECISION
+        index = value >> rest_bits
+        rank = rest_bits - (value & ((1 << rest_bits) - 1)).bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def to_json(self) -> list[str] | str:
+        return sorted(self.keys) if self.registers is None else self.registers.hex()
+
+    @classmethod
+    def from_json(cls, data: list[str] | str) -> SessionSketch:
+        sketch = cls()
+        if isinstance(data, str):
+            registers = bytearray.fromhex(data)
+            if len(registers) != 1 << SESSION_SKETCH_PRECISION:
+                raise ValueError("session sketch has the wrong register count")
+            sketch.keys, sketch.registers = None, registers
+        else:
+            for key in data:
+                int(key, 16)
+                sketch.add(key)
+        return sketch
+
+
+def tally_add(tally: dict[str, list], key: str, session: str) -> None:
+    """Count one occurrence of key in a {key: [count, SessionSketch]} tally."""
+    entry = tally.get(key)
+    if entry is None:
+        entry = tally[key] = [0, SessionSketch()]
+    entry[0] += 1
+    if session:
+        entry[1].add(sketch_session(session))
+
+
+def encode_tally(tally: dict[str, list]) -> dict[str, list]:
+    return {key: [count, sessions.to_json()] for key, (count, sessions) in tally.items()}
+
+
+def decode_tally(raw: dict[str, list]) -> dict[str, list]:
+    return {key: [int(count), SessionSketch.from_json(sessions)] for key, (count, sessions) in raw.items()}
+
+
+def merge_tally(tally: dict[str, list], counts: Counter[str], sessions: defaultdict[str, SessionSketch]) -> None:
+    for key, (count, day_sessions) in tally.items():
+        counts[key] += count
+        sessions[key].update(day_sessions)
+
+
+@dataclass
+class EventDay:
+    """One day of events.jsonl, rolled up; sessions are counted with SessionSketch."""
+
+    events: int = 0
+    malformed: int = 0
+    sessions: SessionSketch = field(default_factory=SessionSketch)
+    warn: dict[str, list] = field(default_factory=dict)
+    block: dict[str, list] = field(default_factory=dict)
+    edit: dict[str, list] = field(default_factory=dict)
+    edit_paths: dict[str, list[str]] = field(default_factory=dict)
+    external_edit: dict[str, list] = field(default_factory=dict)
+    slow: dict[str, list] = field(default_factory=dict)
+
+    TALLIES = ("warn", "block", "edit", "external_edit", "slow")
+
+    def add(self, event: dict[str, Any], project_root: str | None) -> str | None:
+        """Count one event; returns its hot_files key, as trend_edit_key() would."""
+        self.events += 1
+        session = event.get("session", "")
+        if session:
+            self.sessions.add(sketch_session(session))
+        decision = event.get("decision", "")
+        reason = event.get("reason", "")
+        if decision == "warn" and reason:
+            tally_add(self.warn, reason, session)
+        elif decision == "block" and reason:
+            tally_add(self.block, reason, session)
+        edit_key = None
+        edit = classify_edit(event, project_root)
+        if edit is not None:
+            relation, key, normalized = edit
+            if relation == "external":
+                tally_add(self.external_edit, key, session)
+            else:
+                tally_add(self.edit, key, session)
+                self.edit_paths[key] = [normalized, relation]
+                edit_key = key
+        if event.get("duration_ms", 0) > 5000:
+            tally_add(self.slow, "", session)
+        return edit_key
+
+    def to_json(self) -> dict[str, Any]:
+        data: dict[str, Any] = {
+            "events": self.events,
+            "malformed": self.malformed,
+            "sessions": self.sessions.to_json(),
+            "edit_paths": self.edit_paths,
+        }
+        for name in self.TALLIES:
+            data[name] = encode_tally(getattr(self, name))
+        return data
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any]) -> EventDay:
+        return cls(
+            events=int(data["events"]),
+            malformed=int(data["malformed"]),
+            sessions=SessionSketch.from_json(data["sessions"]),
+            edit_paths=dict(data["edit_paths"]),
+            **{name: decode_tally(data[name]) for name in cls.TALLIES},
+        )
+
+
+@dataclass
+class MetricsDay:
+    """One day of session-metrics.jsonl, rolled up."""
+
+    records: int = 0
+    malformed: int = 0
+    warns: int = 0
+    warn_sessions: SessionSketch = field(default_factory=SessionSketch)
+
+    def add(self, metric: dict[str, Any]) -> None:
+        self.records += 1
+        warns = metric.get("decisions", {}).get("warn", 0)
+        if warns:
+            self.warns += warns
+            session = metric.get("session", "")
+            if session:
+                self.warn_sessions.add(sketch_session(session))
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "records": self.records,
+            "malformed": self.malformed,
+            "warns": self.warns,
+            "warn_sessions": self.warn_sessions.to_json(),
+        }
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any]) -> MetricsDay:
+        return cls(
+            records=int(data["records"]),
+            malformed=int(data["malformed"]),
+            warns=data["warns"],
+            warn_sessions=SessionSketch.from_json(data["warn_sessions"]),
+        )
+
+
+def tail_digest(path: str, offset: int) -> str:
+    """Hash of the bytes just before offset, to tell an appended log from a rewritten one."""
+    start = max(offset - CHECKPOINT_TAIL_BYTES, 0)
+    with open(path, "rb") as handle:
+        handle.seek(start)
+        return hashlib.sha256(handle.read(offset - start)).hexdigest()[:16]
+
+
+class LogRollup:
+    """Daily aggregates of one append-only log and the byte offset they cover.
+
+    A run resumes at the offset and reads only what was appended since. A
+    new inode, a file shorter than the offset, changed bytes just before it,
+    a wider window or a different project root mean the aggregates no longer
+    describe the file, and the rollup restarts from a scan of the window.
+    """
+
+    def __init__(self, day_type: type, saved: dict[str, Any] | None) -> None:
+        self.day_type = day_type
+        self.path = ""
+        self.inode: int | None = None
+        self.offset = 0
+        self.tail = ""
+        self.window_start = ""
+        self.context = ""
+        self.days: dict[str, Any] = {}
+        if saved:
+            try:
+                self.inode = int(saved["inode"])
+                self.offset = int(saved["offset"])
+                self.tail = str(saved["tail"])
+                self.window_start = str(saved["window_start"])
+                self.context = str(saved["context"])
+                self.days = {day: day_type.from_json(data) for day, data in saved["days"].items()}
+            except (KeyError, TypeError, ValueError, AttributeError):
+                self.inode, self.offset, self.days = None, 0, {}
+
+    def resume(self, path: str, cutoff_day: str, context: str, seek: bool) -> bool:
+        """Position at the first unread byte; False when the window is rescanned.
+
+        seek bisects to the window on a full scan, for logs appended in
+        timestamp order.
+        """
+        self.path = path
+        st = os.stat(path)
+        if (
+            self.inode == st.st_ino
+            and self.offset <= st.st_size
+            and self.window_start <= cutoff_day
+            and self.context == context
+            and self.tail == tail_digest(path, self.offset)
+        ):
+            self.days = {day: bucket for day, bucket in self.days.items() if day >= cutoff_day}
+            return True
+        self.inode = st.st_ino
+        self.window_start = cutoff_day
+        self.context = context
+        self.days = {}
+        self.offset = seek_window_start(path, cutoff_day) if seek else 0
+        return False
+
+    def iter_new_lines(self):
+        """Yield (raw_line, end_offset) for each line from the current offset on.
+
+        The caller advances self.offset to end_offset once a line is counted.
+        """
+        with open(self.path, "rb") as handle:
+            handle.seek(self.offset)
+            end = self.offset
+            for raw in handle:
+                end += len(raw)
+                yield raw, end
+
+    def day(self, day: str) -> Any:
+        bucket = self.days.get(day)
+        if bucket is None:
+            bucket = self.days[day] = self.day_type()
+        return bucket
+
+    def window(self) -> list[Any]:
+        return [self.days[day] for day in sorted(self.days)]
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "inode": self.inode,
+            "offset": self.offset,
+            "tail": tail_digest(self.path, self.offset),
+            "window_start": self.window_start,
+            "context": self.context,
+            "days": {day: bucket.to_json() for day, bucket in sorted(self.days.items())},
+        }
+
+
+class LearnCheckpoint:
+    """Per-project learn-checkpoint.json: one LogRollup per log file."""
+
+    def __init__(self, project_dir: str, resume: bool) -> None:
+        self.path = os.path.join(project_dir, LEARN_CHECKPOINT_FILE)
+        self.saved: dict[str, Any] = {}
+        self.saved_trends: Any = None
+        self.rollups: dict[str, LogRollup] = {}
+        self.trends: TrendDetector | None = None
+        if resume and os.path.exists(self.path):
+            try:
+                data = json.loads(read_text_lossy(self.path))
+            except ValueError:
+                data = None
+            if isinstance(data, dict) and data.get("version") == LEARN_CHECKPOINT_VERSION:
+                self.saved = data.get("logs") or {}
+                self.saved_trends = data.get("trends")
+
+    def rollup(self, log_name: str, day_type: type) -> LogRollup:
+        saved = self.saved.get(log_name)
+        rollup = LogRollup(day_type, saved if isinstance(saved, dict) else None)
+        self.rollups[log_name] = rollup
+        return rollup
+
+    def trend_detector(self, resumed: bool) -> TrendDetector:
+        """The saved detector when events.jsonl resumed from its offset, else an empty one to refeed."""
+        self.trends = TrendDetector()
+        if resumed and isinstance(self.saved_trends, dict):
+            try:
+                self.trends = TrendDetector.from_json(self.saved_trends)
+            except (KeyError, TypeError, ValueError, AttributeError):
+                pass
+        return self.trends
+
+    def save(self) -> None:
+        if not self.rollups or not os.path.isdir(os.path.dirname(self.path)):
+            return
+        try:
+            logs = {name: rollup.to_json() for name, rollup in self.rollups.items()}
+        except OSError:
+            return
+        tmp_path = f"{self.path}.tmp.{os.getpid()}"
+        with open(tmp_path, "w", encoding="utf-8") as handle:
+            data: dict[str, Any] = {"version": LEARN_CHECKPOINT_VERSION, "logs": logs}
+            if self.trends is not None:
+                data["trends"] = self.trends.to_json()
+            json.dump(data, handle, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+
 def recent_prefix(now: datetime, learning_window_days: int) -> str:
     return (now - timedelta(days=learning_window_days)).strftime("%Y-%m-%dT")
 
 
+def fold_snapshot(
+    rollup: LogRollup,
+    detector: TrendDetector,
+    events_file: str,
+    cutoff_day: str,
+    project_root: str | None,
+) -> tuple[int, str]:
+    """Roll up the window's closed days from events.snapshot; returns (rows used, last day seen).
+
+    Used on a full scan when the snapshot reaches past the seek position.
+    Like seek_window_start() it relies on timestamp order: the window starts
+    at a bisection of the ts column. rollup.offset moves to the end of the
+    snapshot, and the lines after it are read from the log as usual.
+    """
+    last_day = cutoff_day
+    snapshot = event_snapshot.load(events_file)
+    if snapshot is None:
+        return 0, last_day
+    with snapshot:
+        if snapshot.offset <= rollup.offset:
+            return 0, last_day
+        ts = snapshot.column("ts")
+        duration = snapshot.column("duration_ms")
+        columns = [
+            (name, snapshot.column(name), snapshot.dictionary(name)) for name in event_snapshot.STRING_COLUMNS
+        ]
+        cutoff_seconds = event_snapshot.wall_seconds(cutoff_day)
+        start = bisect.bisect_left(ts, cutoff_seconds)
+        malformed = Counter(row for row in snapshot.malformed_before if row >= start)
+        days: dict[int, str] = {}
+        for row in range(start, snapshot.rows):
+            if row in malformed:
+                rollup.day(last_day).malformed += malformed[row]
+            seconds = ts[row]
+            if seconds < cutoff_seconds:
+                continue
+            day = days.get(seconds // 86400)
+            if day is None:
+                day = days[seconds // 86400] = event_snapshot.day_of(seconds)
+            last_day = day
+            event: dict[str, Any] = {name: dictionary[codes[row]] for name, codes, dictionary in columns}
+            event["duration_ms"] = duration[row]
+            edit_key = rollup.day(day).add(event, project_root)
+            detector.observe(seconds, event["decision"], event["reason"], edit_key)
+        if snapshot.rows in malformed:
+            rollup.day(last_day).malformed += malformed[snapshot.rows]
+        rollup.offset = snapshot.offset
+        return snapshot.rows - start, last_day
+
+
 def analyze_events(
     result: dict[str, Any],
     project_id: str,
@@ -327,75 +1128,78 @@ def analyze_events(
     cutoff: str,
     options: AnalyzerOptions,
     state: RunState,
-) -> set[str]:
+    checkpoint: LearnCheckpoint,
+) -> SessionSketch:
     events_file = result["events_file"]
-    project_sessions: set[str] = set()
+    project_sessions = SessionSketch()
     if not os.path.exists(events_file):
         return project_sessions
 
-    warn_reasons: Counter[str] = Counter()
-    warn_sessions: defaultdict[str, set[str]] = defaultdict(set)
-    block_reasons: Counter[str] = Counter()
-    block_sessions: defaultdict[str, set[str]] = defaultdict(set)
-    edit_files: Counter[str] = Counter()
-    edit_sessions: defaultdict[str, set[str]] = defaultdict(set)
-    edit_paths: dict[str, str] = {}
-    edit_relations: dict[str, str] = {}
-    external_edit_files: Counter[str] = Counter()
-    external_edit_sessions: defaultdict[str, set[str]] = defaultdict(set)
-    malformed_events = 0
-    slow_count = 0
-    slow_sessions: set[str] = set()
-
-    for line in iter_text_lines_lossy(events_file):
+    cutoff_day = cutoff[:10]
+    rollup = checkpoint.rollup("events.jsonl", EventDay)
+    resumed = rollup.resume(events_file, cutoff_day, project_root or "", seek=True)
+    result["events_checkpoint"] = "resumed" if resumed else "full_scan"
+    detector = checkpoint.trend_detector(resumed)
+    last_day = max(rollup.days, default=cutoff_day)
+    if not resumed and options.use_snapshots:
+        result["events_snapshot_rows"], last_day = fold_snapshot(
+            rollup, detector, events_file, cutoff_day, project_root
+        )
+    since = cutoff_day.encode()
+    for line, end in rollup.iter_new_lines():
         if state.budget_exceeded():
             break
         if options.max_events is not None and result["events_read"] >= options.max_events:
             state.mark_partial("max_events")
             break
         result["events_read"] += 1
-        line = line.strip()
-        if not line:
+        text = line.strip()
+        # Lines dated before the window are dropped before decoding; see jsonl_reader.ts_before().
+        if not text or (line.endswith(b"\n") and ts_before(text, since)):
+            rollup.offset = end
             continue
         try:
-            event = json.loads(line)
+            event = loads(text, "replace")
         except json.JSONDecodeError:
-            malformed_events += 1
+            if not line.endswith(b"\n"):
+                break  # an append still in progress; read it next run
+            rollup.day(last_day).malformed += 1
+            rollup.offset = end
             continue
-        timestamp = event.get("ts", "")
-        if timestamp[:10] < cutoff[:10]:
+        rollup.offset = end
+        day = event.get("ts", "")[:10]
+        if day < cutoff_day:
             continue
-        result["has_recent_activity"] = True
-        session = event.get("session", "")
-        project_sessions.add(session)
-        decision = event.get("decision", "")
-        reason = event.get("reason", "")
-        if decision == "warn" and reason:
-            warn_reasons[reason] += 1
-            warn_sessions[reason].add(session)
-        elif decision == "block" and reason:
-            block_reasons[reason] += 1
-            block_sessions[reason].add(session)
-        if event.get("tool") == "Edit":
-            raw_path = event_edit_path(event)
-            relation, normalized, display = classify_project_path(raw_path, project_root)
-            if relation == "in_project":
-                edit_files[display] += 1
-                edit_sessions[display].add(session)
-                edit_paths[display] = normalized
-                edit_relations[display] = relation
-            elif relation == "external":
-                external_edit_files[normalized] += 1
-                external_edit_sessions[normalized].add(session)
-            elif raw_path:
-                key = display or normalized or raw_path
-                edit_files[key] += 1
-                edit_sessions[key].add(session)
-                edit_paths[key] = normalized or raw_path
-                edit_relations[key] = "unknown"
-        if event.get("duration_ms", 0) > 5000:
-            slow_count += 1
-            slow_sessions.add(session)
+        last_day = day
+        edit_key = rollup.day(day).add(event, project_root)
+        detector.observe(
+            event_snapshot.wall_seconds(event.get("ts")), event.get("decision", ""), event.get("reason", ""), edit_key
+        )
+
+    warn_reasons: Counter[str] = Counter()
+    warn_sessions: defaultdict[str, SessionSketch] = defaultdict(SessionSketch)
+    block_reasons: Counter[str] = Counter()
+    block_sessions: defaultdict[str, SessionSketch] = defaultdict(SessionSketch)
+    edit_files: Counter[str] = Counter()
+    edit_sessions: defaultdict[str, SessionSketch] = defaultdict(SessionSketch)
+    edit_paths: dict[str, list[str]] = {}
+    external_edit_files: Counter[str] = Counter()
+    external_edit_sessions: defaultdict[str, SessionSketch] = defaultdict(SessionSketch)
+    slow_count: Counter[str] = Counter()
+    slow_sessions: defaultdict[str, SessionSketch] = defaultdict(SessionSketch)
+    malformed_events = 0
+
+    for bucket in rollup.window():
+        if bucket.events:
+            result["has_recent_activity"] = True
+        project_sessions.update(bucket.sessions)
+        merge_tally(bucket.warn, warn_reasons, warn_sessions)
+        merge_tally(bucket.block, block_reasons, block_sessions)
+        merge_tally(bucket.edit, edit_files, edit_sessions)
+        merge_tally(bucket.external_edit, external_edit_files, external_edit_sessions)
+        merge_tally(bucket.slow, slow_count, slow_sessions)
+        edit_paths.update(bucket.edit_paths)
+        malformed_events += bucket.malformed
 
     for reason, count in warn_reasons.most_common(5):
         if count >= 10:
@@ -434,8 +1238,8 @@ def analyze_events(
                         "type": "hot_files",
                         "source": "events",
                         "file": filepath,
-                        "path": edit_paths[filepath],
-                        "path_relation": edit_relations.get(filepath, "unknown"),
+                        "path": edit_paths[filepath][0],
+                        "path_relation": edit_paths[filepath][1],
                         "edits": count,
                     },
                     edit_sessions[filepath],
@@ -449,19 +1253,19 @@ def analyze_events(
                 "path_relation": "external",
                 "classification": "noise",
                 "events": count,
-                "affected_sessions": session_count(external_edit_sessions[filepath]),
+                **session_fields(external_edit_sessions[filepath]),
             }
         )
-    if slow_count >= 10:
+    if slow_count[""] >= 10:
         result["signals"].append(
             make_signal(
                 project_id,
                 {
                     "type": "slow_sessions",
                     "source": "events",
-                    "count": slow_count,
+                    "count": slow_count[""],
                 },
-                slow_sessions,
+                slow_sessions[""],
             )
         )
     if malformed_events:
@@ -481,40 +1285,56 @@ def analyze_metrics(
     now: datetime,
     learning_window_days: int,
     state: RunState,
+    checkpoint: LearnCheckpoint,
 ) -> None:
     metrics_file = os.path.join(result["project_dir"], "session-metrics.jsonl")
     if not os.path.exists(metrics_file) or state.budget_exceeded():
         return
 
-    cutoff = recent_prefix(now, learning_window_days)
-    mid = (now - timedelta(days=learning_window_days / 2)).strftime("%Y-%m-%dT")
-    early_warns = 0
-    late_warns = 0
-    escalation_sessions: set[str] = set()
-    malformed_metrics = 0
-
-    for line in iter_text_lines_lossy(metrics_file):
+    cutoff_day = recent_prefix(now, learning_window_days)[:10]
+    mid_day = (now - timedelta(days=learning_window_days / 2)).strftime("%Y-%m-%d")
+    # Session end times are not strictly ordered, so a full scan reads the whole file.
+    rollup = checkpoint.rollup("session-metrics.jsonl", MetricsDay)
+    rollup.resume(metrics_file, cutoff_day, "", seek=False)
+    last_day = max(rollup.days, default=cutoff_day)
+    since = cutoff_day.encode()
+    for line, end in rollup.iter_new_lines():
         if state.budget_exceeded():
             break
-        line = line.strip()
-        if not line:
+        text = line.strip()
+        # Lines dated before the window are dropped before decoding; see jsonl_reader.ts_before().
+        if not text or (line.endswith(b"\n") and ts_before(text, since)):
+            rollup.offset = end
             continue
         try:
-            metric = json.loads(line)
+            metric = loads(text, "replace")
         except json.JSONDecodeError:
-            malformed_metrics += 1
+            if not line.endswith(b"\n"):
+                break
+            rollup.day(last_day).malformed += 1
+            rollup.offset = end
             continue
-        timestamp = metric.get("ts", "")
-        if timestamp[:10] < cutoff[:10]:
+        rollup.offset = end
+        day = metric.get("ts", "")[:10]
+        if day < cutoff_day:
             continue
-        result["has_recent_activity"] = True
-        warns = metric.get("decisions", {}).get("warn", 0)
-        if warns:
-            escalation_sessions.add(metric.get("session", ""))
-        if timestamp < mid:
-            early_warns += warns
+        last_day = day
+        rollup.day(day).add(metric)
+
+    early_warns = 0
+    late_warns = 0
+    escalation_sessions = SessionSketch()
+    malformed_metrics = 0
+    for day in sorted(rollup.days):
+        bucket = rollup.days[day]
+        if bucket.records:
+            result["has_recent_activity"] = True
+        escalation_sessions.update(bucket.warn_sessions)
+        if day < mid_day:
+            early_warns += bucket.warns
         else:
-            late_warns += warns
+            late_warns += bucket.warns
+        malformed_metrics += bucket.malformed
 
     if early_warns > 0 and late_warns > early_warns * 1.5:
         result["signals"].append(
@@ -540,30 +1360,74 @@ def analyze_metrics(
         )
 
 
+def guard_share_seconds(state: RunState, options: AnalyzerOptions, guard_count: int, guard_slots: float) -> float:
+    """Each guard's timeout when guard_slots of guard_count guards run at a time."""
+    remaining_ms = state.remaining_ms()
+    if remaining_ms is None:
+        return options.guard_timeout_seconds
+    share_seconds = project_share_ms(remaining_ms, guard_count, guard_slots) / 1000
+    return max(min(options.guard_timeout_seconds, share_seconds), 0.001)
+
+
 def analyze_code_scan(
     result: dict[str, Any],
     project_id: str,
-    project_sessions: set[str],
+    project_sessions: SessionSketch,
     vibeguard_dir: str,
     options: AnalyzerOptions,
     state: RunState,
+    guard_cache: GuardResultCache | None = None,
+    guard_pool: ThreadPoolExecutor | None = None,
+    guard_slots: float | None = None,
 ) -> None:
+    """Run the project's guards, in guard_pool when projects share one.
+
+    guard_slots is this project's share of the pool's workers; it defaults to
+    options.guard_jobs, which is the whole pool when the project has its own.
+    """
     project_root = result.get("project_root")
     if not (
         options.code_scan
         and (result["has_recent_activity"] or not options.skip_stale_code_scan)
         and project_root
         and os.path.isdir(project_root)
-        and not state.budget_exceeded()
     ):
         return
 
-    for guard_script, _prefix in detect_guards(project_root, vibeguard_dir):
-        if state.budget_exceeded():
-            break
-        timeout_seconds = state.remaining_seconds(options.guard_timeout_seconds)
-        violation_count, examples, diagnostic_error = run_guard(guard_script, project_root, timeout_seconds)
-        guard_name = os.path.basename(guard_script).replace("check_", "").replace(".sh", "")
+    # Cached results for an unchanged tree are used even once the budget is spent.
+    fingerprint = tree_fingerprint(project_root) if guard_cache is not None else None
+    guards = detect_guards(project_root, vibeguard_dir)
+    outcomes: list[tuple[int, list[str], str | None] | None] = [None] * len(guards)
+    pending: list[tuple[int, str, str | None]] = []
+    for index, (guard_script, _prefix) in enumerate(guards):
+        cache_key = guard_cache.key(guard_script, project_root, fingerprint) if fingerprint else None
+        outcomes[index] = guard_cache.get(cache_key) if cache_key else None
+        if outcomes[index] is None:
+            pending.append((index, guard_script, cache_key))
+
+    if pending and not state.budget_exceeded():
+        slots = options.guard_jobs if guard_slots is None else guard_slots
+        timeout_seconds = guard_share_seconds(state, options, len(pending), slots)
+        if guard_pool is None:
+            pool_context = ThreadPoolExecutor(max_workers=min(options.guard_jobs, len(pending)))
+        else:
+            pool_context = nullcontext(guard_pool)
+        with pool_context as pool:
+            runs = [
+                (index, cache_key, pool.submit(run_guard, guard_script, project_root, timeout_seconds))
+                for index, guard_script, cache_key in pending
+            ]
+            for index, cache_key, run in runs:
+                outcomes[index] = run.result()
+                violation_count, examples, diagnostic_error = outcomes[index]
+                if cache_key and diagnostic_error is None:
+                    guard_cache.put(cache_key, violation_count, examples)
+
+    for (guard_script, _prefix), outcome in zip(guards, outcomes):
+        if outcome is None:
+            continue  # not started: the budget ran out first
+        violation_count, examples, diagnostic_error = outcome
+        guard_name = os.path.splitext(os.path.basename(guard_script))[0].replace("check_", "")
         if diagnostic_error:
             if diagnostic_error == "timeout":
                 state.mark_partial(f"guard_timeout:{guard_name}")
@@ -576,7 +1440,6 @@ def analyze_code_scan(
                     **({"examples": examples} if examples else {}),
                 }
             )
-            if diagnostic_error == "timeout": break
         if violation_count >= 5:
             result["signals"].append(
                 make_signal(
@@ -593,35 +1456,85 @@ def analyze_code_scan(
             )
 
 
-def analyze_project(
-    project: dict[str, Any],
-    now: datetime,
-    learning_window_days: int,
-    vibeguard_dir: str,
-    options: AnalyzerOptions,
-    state: RunState,
-) -> dict[str, Any]:
-    project_id = project["project"]
+def new_project_result(project: dict[str, Any]) -> dict[str, Any]:
     project_dir = project["project_dir"]
-    project_root = project.get("project_root")
-    result: dict[str, Any] = {
-        "project": project_id,
+    return {
+        "project": project["project"],
         "project_dir": project_dir,
-        "project_root": project_root,
+        "project_root": project.get("project_root"),
         "events_file": os.path.join(project_dir, "events.jsonl"),
         "signals": [],
         "diagnostics": [],
+        "trends": [],
         "events_read": 0,
+        "events_snapshot_rows": 0,
         "has_recent_activity": False,
+        "partial": False,
+        "truncated_reason": None,
     }
 
+
+def analyze_project_logs(
+    result: dict[str, Any],
+    now: datetime,
+    learning_window_days: int,
+    options: AnalyzerOptions,
+    state: RunState,
+) -> SessionSketch:
+    """Event and metrics signals for one project; returns the sessions seen in the window."""
+    project_id = result["project"]
     cutoff = recent_prefix(now, learning_window_days)
-    project_sessions = analyze_events(result, project_id, project_root, cutoff, options, state)
-    analyze_metrics(result, project_id, now, learning_window_days, state)
-    analyze_code_scan(result, project_id, project_sessions, vibeguard_dir, options, state)
+    checkpoint = LearnCheckpoint(result["project_dir"], options.resume_checkpoints)
+    project_sessions = analyze_events(result, project_id, result["project_root"], cutoff, options, state, checkpoint)
+    analyze_metrics(result, project_id, now, learning_window_days, state, checkpoint)
+    if checkpoint.trends is not None:
+        result["trends"] = checkpoint.trends.trends(now.timestamp())
+    if options.save_checkpoints:
+        checkpoint.save()
+    return project_sessions
+
+
+def finish_project(result: dict[str, Any], project_state: RunState, state: RunState) -> dict[str, Any]:
+    result["partial"] = project_state.partial
+    result["truncated_reason"] = project_state.truncated_reason
+    if project_state.partial:
+        state.mark_partial(project_state.truncated_reason or "")
     return result
 
 
+def analyze_project(
+    project: dict[str, Any],
+    now: datetime,
+    learning_window_days: int,
+    vibeguard_dir: str,
+    options: AnalyzerOptions,
+    state: RunState,
+    guard_cache: GuardResultCache | None = None,
+) -> dict[str, Any]:
+    result = new_project_result(project)
+    project_sessions = analyze_project_logs(result, now, learning_window_days, options, state)
+    analyze_code_scan(result, result["project"], project_sessions, vibeguard_dir, options, state, guard_cache)
+    return result
+
+
+def project_logs_task(
+    task: tuple[dict[str, Any], datetime, int, AnalyzerOptions, float | None],
+) -> tuple[dict[str, Any], SessionSketch, str | None, float]:
+    """Process-pool worker: (result, sessions, truncated_reason, elapsed_ms) for one project's logs."""
+    project, now, learning_window_days, options, share_ms = task
+    project_state = RunState(share_ms)
+    result = new_project_result(project)
+    project_sessions = analyze_project_logs(result, now, learning_window_days, options, project_state)
+    return result, project_sessions, project_state.truncated_reason, project_state.elapsed_ms()
+
+
+def project_share_ms(budget_ms: float | None, project_count: int, jobs: float) -> float | None:
+    """One project's slice of the run budget when `jobs` projects are analysed at a time."""
+    if budget_ms is None or project_count == 0:
+        return None
+    return budget_ms * min(jobs, project_count) / project_count
+
+
 def analyze_projects(
     projects: list[dict[str, Any]],
     now: datetime,
@@ -629,15 +1542,80 @@ def analyze_projects(
     vibeguard_dir: str,
     options: AnalyzerOptions,
     state: RunState,
+    jobs: int = 1,
+    guard_cache: GuardResultCache | None = None,
 ) -> list[dict[str, Any]]:
+    if jobs > 1 and len(projects) > 1:
+        return analyze_projects_parallel(
+            projects, now, learning_window_days, vibeguard_dir, options, state, jobs, guard_cache
+        )
     results = []
     for project in projects:
         if state.budget_exceeded():
             break
-        results.append(analyze_project(project, now, learning_window_days, vibeguard_dir, options, state))
+        project_state = state.project_state()
+        result = analyze_project(project, now, learning_window_days, vibeguard_dir, options, project_state, guard_cache)
+        results.append(finish_project(result, project_state, state))
     return results
 
 
+def analyze_projects_parallel(
+    projects: list[dict[str, Any]],
+    now: datetime,
+    learning_window_days: int,
+    vibeguard_dir: str,
+    options: AnalyzerOptions,
+    state: RunState,
+    jobs: int,
+    guard_cache: GuardResultCache | None = None,
+) -> list[dict[str, Any]]:
+    """Analyse projects `jobs` at a time, each within a fair share of the budget.
+
+    Log parsing runs in a process pool. Guard subprocesses run in one
+    thread pool shared by every project, so at most options.guard_jobs run
+    at once however many projects are scanned together. A slow project only
+    exhausts its own share, is marked partial on its own, and results keep
+    the input order whatever finishes first.
+    """
+    share_ms = project_share_ms(state.remaining_ms(), len(projects), jobs)
+    tasks = [(project, now, learning_window_days, options, share_ms) for project in projects]
+    workers = min(jobs, len(projects))
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            logs = list(pool.map(project_logs_task, tasks))
+    except (BrokenProcessPool, OSError):
+        # Sandboxes without working semaphores or fork: parse logs serially.
+        logs = [project_logs_task(task) for task in tasks]
+
+    project_states = []
+    for _result, _sessions, truncated_reason, elapsed_ms in logs:
+        project_state = RunState(None if share_ms is None else max(share_ms - elapsed_ms, 0))
+        if truncated_reason:
+            project_state.mark_partial(truncated_reason)
+        project_states.append(project_state)
+
+    guard_slots = options.guard_jobs / workers
+    with ThreadPoolExecutor(max_workers=options.guard_jobs) as guard_pool, ThreadPoolExecutor(workers) as pool:
+        scans = [
+            pool.submit(
+                analyze_code_scan,
+                result,
+                result["project"],
+                sessions,
+                vibeguard_dir,
+                options,
+                project_state,
+                guard_cache,
+                guard_pool,
+                guard_slots,
+            )
+            for (result, sessions, _reason, _elapsed), project_state in zip(logs, project_states)
+        ]
+        for scan in scans:
+            scan.result()
+    return [finish_project(result, project_state, state) for (result, *_), project_state in zip(logs, project_states)]
+
+
 def flattened(results: list[dict[str, Any]], key: str) -> list[dict[str, Any]]:
     items = []
     for result in results:
@@ -684,6 +1662,8 @@ def digest_entries(report: dict[str, Any]) -> list[dict[str, Any]]:
         }
         if project.get("project_root"):
             entry["project_root"] = project["project_root"]
+        if project.get("trends"):
+            entry["trends"] = project["trends"]
         entries.append(entry)
     return entries
 
@@ -709,6 +1689,13 @@ def render_text(report: dict[str, Any]) -> str:
                 detail = signal.get("reason", signal.get("file", ""))
                 count = signal.get("count", signal.get("edits", ""))
                 lines.append(f' - [Event Log] {signal["type"]}: {detail} ({count})')
+    for project in report["projects"]:
+        for trend in project.get("trends", []):
+            detail = trend.get("reason", trend.get("file", "warns"))
+            lines.append(
+                f' - [Trend] project {project["project"]} {trend["type"]}: {detail} '
+                f'({trend["recent_per_hour"]}/h, baseline {trend["baseline_per_hour"]}/h)'
+            )
     if signals_found == 0:
         lines.append("No need to learn signals")
     elif report["mode"] == "scheduled" and report.get("wrote_output"):
@@ -739,6 +1726,13 @@ def positive_int(value: str) -> int:
     return parsed
 
 
+def job_count(value: str) -> int:
+    parsed = int(value)
+    if parsed < 1:
+        raise argparse.ArgumentTypeError("value must be >= 1")
+    return parsed
+
+
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Preview or generate VibeGuard learning signals.")
     parser.add_argument("--scope", choices=["current", "global"], default="current")
@@ -751,8 +1745,28 @@ def build_parser() -> argparse.ArgumentParser:
     parser.add_argument("--max-events", type=positive_int, help="Maximum number of events to read per project.")
     parser.add_argument("--budget-ms", type=positive_int, help="Wall-clock analysis budget in milliseconds.")
     parser.add_argument("--guard-timeout", type=float, default=DEFAULT_GUARD_TIMEOUT_SECONDS)
+    parser.add_argument(
+        "--guard-jobs",
+        type=job_count,
+        default=DEFAULT_GUARD_JOBS,
+        help=f"Guard scripts run at once across all projects (default: {DEFAULT_GUARD_JOBS}).",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=job_count,
+        help="Projects analysed at once (default: CPU count for --scope global, 1 for current).",
+    )
     parser.add_argument("--code-scan", action="store_true", help="Enable guard/code scanning for preview.")
     parser.add_argument("--no-code-scan", action="store_true", help="Disable guard/code scanning.")
+    parser.add_argument(
+        "--no-guard-cache", action="store_true", help="Run every guard even when the project tree is unchanged."
+    )
+    parser.add_argument(
+        "--no-checkpoint", action="store_true", help="Ignore learn checkpoints and rescan the learning window."
+    )
+    parser.add_argument(
+        "--no-snapshot", action="store_true", help="Read closed days from events.jsonl instead of events.snapshot."
+    )
     parser.add_argument("--scheduled", action="store_true", help=argparse.SUPPRESS)
     parser.add_argument(
         "--learning-window-days",
@@ -777,14 +1791,31 @@ def main(argv: list[str] | None = None) -> int:
         guard_timeout_seconds=args.guard_timeout,
         max_events=args.max_events,
         skip_stale_code_scan=args.scheduled or args.scope == "global",
+        resume_checkpoints=not args.no_checkpoint,
+        save_checkpoints=args.scheduled and not args.dry_run,
+        use_snapshots=not args.no_snapshot,
+        guard_jobs=args.guard_jobs,
     )
 
     if args.scope == "current":
-        projects = [resolve_current_project(log_dir, args.project_root, args.project_hash)]
+        projects = [resolve_current_project(log_dir, args.project_root, args.project_hash, options.save_checkpoints)]
     else:
+        mtime_ns = projects_mtime_ns(os.path.join(log_dir, "projects"))
         projects = resolve_global_projects(log_dir, args.max_projects, state)
-
-    results = analyze_projects(projects, now, args.learning_window_days, vibeguard_dir, options, state)
+        if options.save_checkpoints and projects:
+            save_project_index(log_dir, projects, None if state.partial else mtime_ns)
+
+    jobs = args.jobs or ((os.cpu_count() or 1) if args.scope == "global" else 1)
+    guard_cache = (
+        GuardResultCache(os.path.join(log_dir, GUARD_CACHE_FILE), GUARD_CACHE_TTL_SECONDS, GUARD_CACHE_MAX_ENTRIES)
+        if code_scan and not args.no_guard_cache
+        else None
+    )
+    results = analyze_projects(
+        projects, now, args.learning_window_days, vibeguard_dir, options, state, jobs, guard_cache
+    )
+    if guard_cache is not None and options.save_checkpoints:
+        guard_cache.save()
     report = build_report(args, now, projects, results, state)
     if args.output and (not args.scheduled or not args.dry_run):
         write_output(args.output, report, args.format, args.scheduled)
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""Exponentially decayed counters that spot Learn trends as events arrive.
+
+A DecayedCounter keeps two numbers per key, one losing half its weight every
+hour and one every day. Adding an event costs O(1), and together the two
+give the recent and baseline rate without keeping any event. TrendDetector
+keeps one counter for all warns, plus one per block reason and per edited
+file, and reports:
+
+- warn_escalation: the last hour's warn rate is at least 1.5x the day's;
+- chronic_block: a block reason is still firing in the last hour;
+- hot_files: a file is still being edited heavily in the last hour.
+
+The analyzer feeds the detector from the same loop that builds its daily
+rollups and keeps its state in learn-checkpoint.json. `trends.py EVENTS_FILE
+--follow` feeds it from a live log and prints each trend as it starts.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+FAST_HALF_LIFE_SECONDS = 3600.0
+SLOW_HALF_LIFE_SECONDS = 86400.0
+ESCALATION_RATIO = 1.5
+# Thresholds on the fast (one-hour half-life) level, roughly "events in the last ~1.4h".
+ESCALATION_MIN_LEVEL = 5.0
+CHRONIC_BLOCK_LEVEL = 5.0
+HOT_FILE_LEVEL = 10.0
+# Keys whose day-level count has decayed below this are dropped when saved.
+PRUNE_LEVEL = 0.05
+TRENDS_PER_TYPE = 5
+
+
+class DecayedCounter:
+    """Event counts with a one-hour and a one-day half-life, as of `updated` (epoch seconds)."""
+
+    __slots__ = ("fast", "slow", "updated")
+
+    def __init__(self, fast: float = 0.0, slow: float = 0.0, updated: float = 0.0) -> None:
+        self.fast = fast
+        self.slow = slow
+        self.updated = updated
+
+    def levels(self, now: float) -> tuple[float, float]:
+        """(fast, slow) counts decayed to now; an earlier now leaves them as they are."""
+        elapsed = max(now - self.updated, 0.0)
+        return (
+            self.fast * 0.5 ** (elapsed / FAST_HALF_LIFE_SECONDS),
+            self.slow * 0.5 ** (elapsed / SLOW_HALF_LIFE_SECONDS),
+        )
+
+    def add(self, now: float, weight: float = 1.0) -> None:
+        fast, slow = self.levels(now)
+        self.fast = fast + weight
+        self.slow = slow + weight
+        self.updated = max(now, self.updated)
+
+    def rates_per_hour(self, now: float) -> tuple[float, float]:
+        """(recent, baseline) events per hour; a steady rate r settles at r * half_life / ln 2."""
+        fast, slow = self.levels(now)
+        return (
+            fast * math.log(2) / FAST_HALF_LIFE_SECONDS * 3600,
+            slow * math.log(2) / SLOW_HALF_LIFE_SECONDS * 3600,
+        )
+
+    def to_json(self) -> list[float]:
+        return [round(self.fast, 6), round(self.slow, 6), self.updated]
+
+    @classmethod
+    def from_json(cls, data: list[float]) -> DecayedCounter:
+        fast, slow, updated = data
+        return cls(float(fast), float(slow), float(updated))
+
+
+class TrendDetector:
+    """Streaming warn_escalation, chronic_block and hot_files detection."""
+
+    def __init__(self) -> None:
+        self.warns = DecayedCounter()
+        self.blocks: dict[str, DecayedCounter] = {}
+        self.edits: dict[str, DecayedCounter] = {}
+
+    def observe(self, now: float, decision: str, reason: str, edit_key: str | None) -> None:
+        """Count one event at epoch seconds now (events without a usable ts are skipped)."""
+        if now < 0:
+            return
+        if decision == "warn":
+            self.warns.add(now)
+        elif decision == "block" and reason:
+            counter = self.blocks.get(reason)
+            if counter is None:
+                counter = self.blocks[reason] = DecayedCounter()
+            counter.add(now)
+        if edit_key:
+            counter = self.edits.get(edit_key)
+            if counter is None:
+                counter = self.edits[edit_key] = DecayedCounter()
+            counter.add(now)
+
+    def trends(self, now: float) -> list[dict[str, Any]]:
+        found: list[dict[str, Any]] = []
+        recent, baseline = self.warns.rates_per_hour(now)
+        if self.warns.levels(now)[0] >= ESCALATION_MIN_LEVEL and recent >= baseline * ESCALATION_RATIO:
+            found.append(
+                {
+                    "type": "warn_escalation",
+                    "recent_per_hour": round(recent, 2),
+                    "baseline_per_hour": round(baseline, 2),
+                    "ratio": round(recent / baseline, 2) if baseline else None,
+                }
+            )
+        for trend_type, field, counters, level in (
+            ("chronic_block", "reason", self.blocks, CHRONIC_BLOCK_LEVEL),
+            ("hot_files", "file", self.edits, HOT_FILE_LEVEL),
+        ):
+            firing = [(key, counter) for key, counter in counters.items() if counter.levels(now)[0] >= level]
+            firing.sort(key=lambda item: (-item[1].levels(now)[0], item[0]))
+            for key, counter in firing[:TRENDS_PER_TYPE]:
+                recent, baseline = counter.rates_per_hour(now)
+                found.append(
+                    {
+                        "type": trend_type,
+                        field: key,
+                        "recent_per_hour": round(recent, 2),
+                        "baseline_per_hour": round(baseline, 2),
+                    }
+                )
+        return found
+
+    def to_json(self) -> dict[str, Any]:
+        latest = max([self.warns.updated, *(c.updated for c in [*self.blocks.values(), *self.edits.values()])])
+
+        def live(counters: dict[str, DecayedCounter]) -> dict[str, list[float]]:
+            return {
+                key: counter.to_json() for key, counter in counters.items() if counter.levels(latest)[1] >= PRUNE_LEVEL
+            }
+
+        return {"warns": self.warns.to_json(), "blocks": live(self.blocks), "edits": live(self.edits)}
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any]) -> TrendDetector:
+        detector = cls()
+        detector.warns = DecayedCounter.from_json(data["warns"])
+        detector.blocks = {str(key): DecayedCounter.from_json(value) for key, value in data["blocks"].items()}
+        detector.edits = {str(key): DecayedCounter.from_json(value) for key, value in data["edits"].items()}
+        return detector
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Print decayed Learn trends for an events.jsonl log.")
+    parser.add_argument("events_file", type=Path)
+    parser.add_argument("--project-root", help="Project root for classifying edited paths.")
+    parser.add_argument("--follow", action="store_true", help="Keep reading appended events and print new trends.")
+    parser.add_argument("--interval", type=float, default=2.0, help="Seconds between polls with --follow.")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    sys.path.insert(0, str(Path(__file__).resolve().parent))
+    # analyze imports this module, so the CLI loads it (and the shared readers) only when run.
+    import analyze
+    from event_snapshot import wall_seconds
+    from jsonl_reader import loads
+
+    if not args.events_file.is_file():
+        print(f"event log does not exist: {args.events_file}", file=sys.stderr)
+        return 2
+    detector = TrendDetector()
+    offset = 0
+    reported: set[tuple[str, str]] = set()
+    while True:
+        with open(args.events_file, "rb") as handle:
+            handle.seek(offset)
+            for raw in handle:
+                if not raw.endswith(b"\n"):
+                    break
+                offset += len(raw)
+                try:
+                    event = loads(raw, "replace")
+                except ValueError:
+                    continue
+                if isinstance(event, dict):
+                    detector.observe(
+                        wall_seconds(event.get("ts")),
+                        event.get("decision", ""),
+                        event.get("reason", ""),
+                        analyze.trend_edit_key(event, args.project_root),
+                    )
+        # Each trend is printed when it starts; one that stops and starts again is printed again.
+        current = {
+            (trend["type"], trend.get("reason") or trend.get("file") or ""): trend for trend in detector.trends(time.time())
+        }
+        for key, trend in current.items():
+            if key not in reported:
+                sys.stdout.write(json.dumps(trend, sort_keys=True) + "\n")
+        sys.stdout.flush()
+        reported = set(current)
+        if not args.follow:
+            return 0
+        time.sleep(args.interval)
+        if os.path.getsize(args.events_file) < offset:
+            offset = 0  # rotated or truncated: start over on the new file
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""Columnar snapshots of the closed days of an events.jsonl log.
+
+events.jsonl stays the source of truth. A snapshot (events.snapshot next to
+the log) holds the same events for every day before the one it was built on,
+one column per field:
+
+- ts: int64 seconds since the epoch of the timestamp's wall-clock time (any
+  UTC offset is dropped, so day boundaries match the "ts" string's date);
+  -1 when the event has no usable string "ts".
+- duration_ms: float64, 0 when absent or not a number.
+- decision, reason, tool, session, path, detail: uint32 codes into a
+  per-column string dictionary. detail is kept for Edit rows only, where it
+  names the edited file; other rows store "".
+
+The file is a small JSON header followed by the raw column buffers, so load()
+maps it with mmap and every column is a zero-copy memoryview. The header
+records the log's inode, the byte offset covered and a hash of the bytes
+before that offset; a rotated, truncated or rewritten log makes the snapshot
+stale, and refresh() rebuilds it from the log.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+import time
+from array import array
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from jsonl_reader import loads
+
+SNAPSHOT_FILE = "events.snapshot"
+SNAPSHOT_VERSION = 1
+MAGIC = b"VGSNAP1\n"
+# Bytes before the covered offset that must be unchanged for the snapshot to match the log.
+TAIL_BYTES = 256
+NUMERIC_COLUMNS = {"ts": "q", "duration_ms": "d"}
+STRING_COLUMNS = ("decision", "reason", "tool", "session", "path", "detail")
+_EPOCH = datetime(1970, 1, 1)
+
+
+def snapshot_path(events_path: str | Path) -> Path:
+    return Path(events_path).with_name(SNAPSHOT_FILE)
+
+
+def wall_seconds(ts: Any) -> int:
+    """Seconds since the epoch of ts's wall-clock time, or -1 when ts is not a timestamp."""
+    if not isinstance(ts, str):
+        return -1
+    try:
+        moment = datetime.fromisoformat(ts[:19])
+    except ValueError:
+        return -1
+    return int((moment.replace(tzinfo=None) - _EPOCH).total_seconds())
+
+
+def day_of(seconds: int) -> str:
+    return time.strftime("%Y-%m-%d", time.gmtime(seconds)) if seconds >= 0 else ""
+
+
+def tail_digest(path: str | Path, offset: int) -> str:
+    start = max(offset - TAIL_BYTES, 0)
+    with open(path, "rb") as handle:
+        handle.seek(start)
+        return hashlib.sha256(handle.read(offset - start)).hexdigest()[:16]
+
+
+class EventSnapshot:
+    """A loaded snapshot: numeric columns as memoryviews, string columns as (codes, dictionary)."""
+
+    def __init__(self, path: Path, header: dict[str, Any], data_start: int, buffer: mmap.mmap) -> None:
+        self.path = path
+        self.header = header
+        self._data_start = data_start
+        self.rows: int = header["rows"]
+        self.offset: int = header["source"]["offset"]
+        self.closed_before: str = header["closed_before"]
+        # Row indexes a malformed line sat just before, in log order.
+        self.malformed_before: list[int] = header["malformed_before"]
+        self._buffer = buffer
+        self._views: dict[str, memoryview] = {}
+
+    def column(self, name: str) -> memoryview:
+        """Numeric column, or the codes of a string column."""
+        view = self._views.get(name)
+        if view is None:
+            spec = self.header["columns"][name]
+            start = self._data_start + spec["offset"]
+            size = array(spec["type"]).itemsize * self.rows
+            view = self._views[name] = memoryview(self._buffer)[start : start + size].cast(spec["type"])
+        return view
+
+    def dictionary(self, name: str) -> list[str]:
+        return self.header["columns"][name]["dictionary"]
+
+    def close(self) -> None:
+        for view in self._views.values():
+            view.release()
+        self._views.clear()
+        self._buffer.close()
+
+    def __enter__(self) -> EventSnapshot:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+def _read_header(buffer: mmap.mmap) -> tuple[dict[str, Any], int] | None:
+    """(header, offset of the column data), or None for another format or byte order."""
+    if buffer[: len(MAGIC)] != MAGIC:
+        return None
+    (length,) = struct.unpack_from("<Q", buffer, len(MAGIC))
+    start = len(MAGIC) + 8
+    try:
+        header = json.loads(buffer[start : start + length])
+    except ValueError:
+        return None
+    if not isinstance(header, dict) or header.get("version") != SNAPSHOT_VERSION:
+        return None
+    if header.get("byteorder") != sys.byteorder:
+        return None
+    return header, start + length
+
+
+def load(events_path: str | Path) -> EventSnapshot | None:
+    """The snapshot of events_path, or None when it is missing or no longer matches the log."""
+    path = snapshot_path(events_path)
+    try:
+        st = os.stat(events_path)
+        with open(path, "rb") as handle:
+            buffer = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+    try:
+        parsed = _read_header(buffer)
+        header, data_start = parsed if parsed else ({}, 0)
+        source = header.get("source")
+        if (
+            source is None
+            or source["inode"] != st.st_ino
+            or source["offset"] > st.st_size
+            or source["tail"] != tail_digest(events_path, source["offset"])
+        ):
+            buffer.close()
+            return None
+        return EventSnapshot(path, header, data_start, buffer)
+    except (KeyError, TypeError, struct.error, OSError):
+        buffer.close()
+        return None
+
+
+def build(events_path: str | Path, today: str | None = None) -> dict[str, Any]:
+    """Write the snapshot of every line dated before today (UTC); returns its header.
+
+    Lines are taken in log order up to the first one dated today or later,
+    or an unterminated last line. Malformed and undated lines on the way are
+    covered too: undated events become rows with ts -1, and malformed lines
+    are only counted.
+    """
+    today = today or datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    numeric = {name: array(typecode) for name, typecode in NUMERIC_COLUMNS.items()}
+    codes = {name: array("I") for name in STRING_COLUMNS}
+    dictionaries: dict[str, dict[str, int]] = {name: {"": 0} for name in STRING_COLUMNS}
+    malformed_before: list[int] = []
+    offset = 0
+    st = os.stat(events_path)
+    with open(events_path, "rb") as handle:
+        for raw in handle:
+            if not raw.endswith(b"\n"):
+                break
+            line = raw.strip()
+            if not line:
+                offset += len(raw)
+                continue
+            try:
+                event = loads(line, "replace")
+            except ValueError:
+                event = None
+            if not isinstance(event, dict):
+                malformed_before.append(len(numeric["ts"]))
+                offset += len(raw)
+                continue
+            seconds = wall_seconds(event.get("ts"))
+            if seconds >= 0 and day_of(seconds) >= today:
+                break
+            offset += len(raw)
+            numeric["ts"].append(seconds)
+            duration = event.get("duration_ms", 0)
+            numeric["duration_ms"].append(
+                float(duration) if isinstance(duration, (int, float)) and not isinstance(duration, bool) else 0.0
+            )
+            edit = event.get("tool") == "Edit"
+            for name in STRING_COLUMNS:
+                value = event.get(name, "") if name != "detail" or edit else ""
+                if not isinstance(value, str):
+                    value = ""
+                dictionary = dictionaries[name]
+                code = dictionary.get(value)
+                if code is None:
+                    code = dictionary[value] = len(dictionary)
+                codes[name].append(code)
+
+    rows = len(numeric["ts"])
+    columns: dict[str, dict[str, Any]] = {}
+    buffers: list[bytes] = []
+    position = 0
+    for name, values in [*numeric.items(), *codes.items()]:
+        data = values.tobytes()
+        # Offsets are relative to the column data, which follows the header.
+        columns[name] = {"type": values.typecode, "offset": position}
+        if name in dictionaries:
+            columns[name]["dictionary"] = list(dictionaries[name])
+        padded = data + b"\0" * (-len(data) % 8)
+        buffers.append(padded)
+        position += len(padded)
+
+    header: dict[str, Any] = {
+        "version": SNAPSHOT_VERSION,
+        "byteorder": sys.byteorder,
+        "closed_before": today,
+        "rows": rows,
+        "malformed_before": malformed_before,
+        "source": {"inode": st.st_ino, "offset": offset, "tail": tail_digest(events_path, offset)},
+        "columns": columns,
+    }
+    encoded = json.dumps(header, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    encoded += b" " * (-(len(MAGIC) + 8 + len(encoded)) % 8)  # columns start 8-byte aligned
+
+    target = snapshot_path(events_path)
+    tmp = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+    with open(tmp, "wb") as handle:
+        handle.write(MAGIC)
+        handle.write(struct.pack("<Q", len(encoded)))
+        handle.write(encoded)
+        for data in buffers:
+            handle.write(data)
+    os.replace(tmp, target)
+    return header
+
+
+def refresh(events_path: str | Path, today: str | None = None) -> bool:
+    """Rebuild the snapshot when it is stale or a day has closed since; True when rebuilt."""
+    today = today or datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    snapshot = load(events_path)
+    if snapshot is not None:
+        with snapshot:
+            if snapshot.closed_before >= today:
+                return False
+    build(events_path, today)
+    return True
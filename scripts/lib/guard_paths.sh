@@ -2,18 +2,14 @@
 # VibeGuard — guard script path detection (shared function)
 # Sourced by compliance_check.sh and metrics_collector.sh
 
-# Find guard scripts: VIBEGUARD_DIR/guards/ first, fallback project local
-# Usage: path=$(find_guard "python/check_duplicates.py" "$PROJECT_DIR")
+# Find guard scripts under VIBEGUARD_DIR/guards/. Guards load shared helpers
+# from guards/_lib, so a copy outside the VibeGuard tree cannot run.
+# Usage: path=$(find_guard "python/check_duplicates.py")
 find_guard() {
-  local relative_path="$1"
-  local project_dir="${2:-.}"
-  local vg_path="${VIBEGUARD_DIR}/guards/${relative_path}"
-  local local_path="${project_dir}/scripts/$(basename "${relative_path}")"
+  local vg_path="${VIBEGUARD_DIR}/guards/$1"
 
   if [[ -f "${vg_path}" ]]; then
     echo "${vg_path}"
-  elif [[ -f "${local_path}" ]]; then
-    echo "${local_path}"
   fi
 }
 
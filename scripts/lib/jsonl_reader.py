@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""Shared JSONL reading for the learn, health and triage scripts.
+
+Event and metrics logs are read a line at a time, and most lines are thrown
+away on "ts" right after decoding. iter_jsonl() drops those lines before
+decoding, with a byte-level check for a minimum "ts" prefix (since=). Lines
+that pass are decoded with orjson when it is importable and the stdlib json
+module otherwise. Results are the same either way: anything orjson rejects
+(NaN, huge integers, lone surrogates, invalid UTF-8) is decoded again by
+json.loads, which returns what the stdlib path would or raises its error.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any, Iterator
+
+try:
+    import orjson
+except ImportError:  # optional accelerator
+    orjson = None
+
+_TS_KEY = b'"ts"'
+_TS_COLON = b'"ts":'
+# orjson turns integers beyond 64 bits into floats; json keeps them exact.
+_DIGITS_TO_ZERO = bytes.maketrans(b"123456789", b"000000000")
+_LONG_INTEGER = b"0" * 19
+
+
+def loads(line: bytes, errors: str = "strict") -> Any:
+    """Decode one JSON document; same result as json.loads(line.decode("utf-8", errors))."""
+    if orjson is not None and _LONG_INTEGER not in line.translate(_DIGITS_TO_ZERO):
+        try:
+            return orjson.loads(line)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(line.decode("utf-8", errors))
+
+
+def ts_before(line: bytes, since: bytes) -> bool:
+    """True when no "ts" key in the raw line can hold a value at or after since.
+
+    Every "ts" key counts, nested ones included, and the line is ruled out
+    only when all of them are plain strings whose first len(since) bytes
+    sort before since. A line with no "ts" key, or with a non-string or
+    escaped value, is left to the decoder and the caller's own check.
+    """
+    # The common shapes, "ts":"..." (serde_json) and "ts": "..." (json.dumps), as the only ts key.
+    at = line.find(_TS_COLON)
+    if at > 0 and line[at - 1] != 0x5C:
+        start = at + len(_TS_COLON)
+        if line[start : start + 1] == b" ":
+            start += 1
+        if line[start : start + 1] == b'"':
+            prefix = line[start + 1 : start + 1 + len(since)]
+            if line.count(_TS_KEY) == 1 and b"\\" not in prefix:
+                # A closing quote inside prefix only shortens it, which keeps the order.
+                return prefix < since
+
+    found = False
+    at = line.find(_TS_KEY)
+    while at >= 0:
+        end = at + len(_TS_KEY)
+        # \"ts" is the tail of a longer string, and "ts" not followed by ":" is a value.
+        if at == 0 or line[at - 1] != 0x5C:
+            rest = line[end:].lstrip()
+            if rest[:1] == b":":
+                rest = rest[1:].lstrip()
+                if rest[:1] != b'"':
+                    return False
+                prefix = rest[1 : 1 + len(since)]
+                quote = prefix.find(b'"')
+                if quote >= 0:
+                    prefix = prefix[:quote]
+                if b"\\" in prefix or prefix >= since:
+                    return False
+                found = True
+        at = line.find(_TS_KEY, end)
+    return found
+
+
+def iter_jsonl(
+    path: str | Path,
+    *,
+    since: str | None = None,
+    comments: bool = False,
+    errors: str = "strict",
+) -> Iterator[tuple[int, Any, json.JSONDecodeError | None]]:
+    """Yield (line_number, record, error) for each non-blank line of a JSONL file.
+
+    since drops lines whose "ts" sorts before it (see ts_before()), the
+    same as a caller skipping record["ts"][:len(since)] < since. comments
+    skips lines starting with "#". A line that fails to decode yields (n, None, error).
+    """
+    since_bytes = since.encode("utf-8") if since else None
+    with open(path, "rb") as handle:
+        for lineno, raw in enumerate(handle, 1):
+            line = raw.strip()
+            if not line or (comments and line.startswith(b"#")):
+                continue
+            if since_bytes is not None and ts_before(line, since_bytes):
+                continue
+            try:
+                record = loads(line, errors)
+            except json.JSONDecodeError as exc:
+                yield lineno, None, exc
+                continue
+            yield lineno, record, None
@@ -8,7 +8,7 @@ set -euo pipefail
 #   bash vibeguard/scripts/metrics_collector.sh [project_dir]
 
 PROJECT_DIR="${1:-.}"
-VIBEGUARD_DIR="${VIBEGUARD_DIR:-$(cd "$(dirname "$0")/.." && pwd)}"
+VIBEGUARD_DIR="${VIBEGUARD_DIR:-$(cd "$(dirname "$0")/../.." && pwd)}"
 source "$(dirname "$0")/../lib/guard_paths.sh"
 TODAY=$(date '+%Y-%m-%d')
 
@@ -22,7 +22,7 @@ echo
 # --- M3: Duplicate code rate ---
 echo "--- M3: Duplicate Definitions ---"
 
-DUP_CHECK=$(find_guard "python/check_duplicates.py" "$PROJECT_DIR")
+DUP_CHECK=$(find_guard "python/check_duplicates.py")
 if [[ -n "${DUP_CHECK}" ]]; then
   dup_output=$(cd "${PROJECT_DIR}" && python3 "${DUP_CHECK}" 2>&1 || true)
   dup_count=$(python3 -c "
@@ -50,7 +50,7 @@ echo
 # --- M4: Naming violation rate ---
 echo "--- M4: Naming Violations ---"
 
-NAMING_CHECK=$(find_guard "python/check_naming_convention.py" "$PROJECT_DIR")
+NAMING_CHECK=$(find_guard "python/check_naming_convention.py")
 if [[ -n "${NAMING_CHECK}" ]]; then
   naming_output=$(cd "${PROJECT_DIR}" && python3 "${NAMING_CHECK}" 2>&1 || true)
   naming_count=$(python3 -c "
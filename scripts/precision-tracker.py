@@ -20,6 +20,10 @@ Lifecycle thresholds (borrowing from Semgrep Pro / Clippy categories):
   WARN         → ERROR  : precision ≥ 90%  AND samples ≥ 50  AND 30 days no FP
   WARN/ERROR   → DEMOTED: precision < 80%  (after ≥ 20 samples)
   DEMOTED      → DISABLED: manual only
+
+The saved scorecard records the triage.jsonl offset its counters cover
+(_triage_source), so --update-scorecard and --record read only the lines
+appended since; a rotated or rewritten triage file is recomputed in full.
 """
 
 from __future__ import annotations
@@ -34,6 +38,10 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Generator
 
+sys.path.insert(0, str(Path(__file__).resolve().parent / "lib"))
+from event_snapshot import tail_digest  # noqa: E402
+from jsonl_reader import loads  # noqa: E402
+
 # ---------------------------------------------------------------------------
 # Paths (relative to repo root, resolved from script location)
 # ---------------------------------------------------------------------------
@@ -42,6 +50,8 @@ REPO_DIR = SCRIPT_DIR.parent
 TRIAGE_FILE = REPO_DIR / "data" / "triage.jsonl"
 SCORECARD_FILE = REPO_DIR / "data" / "rule-scorecard.json"
 SCORECARD_SEED_FILE = REPO_DIR / "data" / "rule-scorecard.seed.json"
+# Scorecard key recording how much of triage.jsonl its counters already include.
+TRIAGE_SOURCE_KEY = "_triage_source"
 
 # ---------------------------------------------------------------------------
 # Lifecycle thresholds
@@ -162,24 +172,57 @@ def _validate_triage_record(rec: Any, lineno: int) -> bool:
 # Triage loading
 # ---------------------------------------------------------------------------
 
-def load_triage(path: Path) -> tuple[list[dict[str, Any]], int]:
-    """Load triage.jsonl; skip comment/blank lines and reject malformed records.
+def load_triage_since(
+    path: Path, source: Any
+) -> tuple[list[dict[str, Any]], int, dict[str, Any] | None, bool]:
+    """Load the triage records a scorecard computed from source does not include yet.
+
+    source is the scorecard's TRIAGE_SOURCE_KEY entry: the inode, byte offset
+    and line count of triage.jsonl it was computed from, plus a hash of the
+    bytes before that offset. When the file still matches, only the lines
+    appended since are read; otherwise (rotated, rewritten, no source) every
+    line is. A "pending" record is one --record counted before appending it,
+    and is skipped once; if it never reached the file, every line is read.
 
-    Returns (records, error_count). error_count > 0 means some lines were
-    unreadable; callers must treat the resulting record list as incomplete.
+    Returns (records, error_count, source for the lines read, incremental).
+    The new source is None when the file ends in an unterminated line.
     """
+    if not path.exists():
+        return [], 0, None, False
+    st = path.stat()
+    offset, lineno, pending = 0, 0, None
+    incremental = (
+        isinstance(source, dict)
+        and source.get("inode") == st.st_ino
+        and isinstance(source.get("offset"), int)
+        and isinstance(source.get("lines"), int)
+        and source["offset"] <= st.st_size
+        and source.get("tail") == tail_digest(path, source["offset"])
+    )
+    if incremental:
+        offset, lineno = source["offset"], source["lines"]
+        pending = source["pending"].encode("utf-8") if isinstance(source.get("pending"), str) else None
+
     records: list[dict[str, Any]] = []
     errors = 0
-    if not path.exists():
-        return records, errors
-    with path.open(encoding="utf-8") as fh:
-        for lineno, line in enumerate(fh, 1):
-            line = line.strip()
-            if not line or line.startswith("#"):
+    complete = True
+    with path.open("rb") as fh:
+        fh.seek(offset)
+        for raw in fh:
+            lineno += 1
+            if raw.endswith(b"\n"):
+                offset += len(raw)
+            else:
+                complete = False
+            line = raw.strip()
+            if not line or line.startswith(b"#"):
+                continue
+            if pending is not None and line == pending:
+                pending = None
                 continue
             try:
-                rec = json.loads(line)
-            except json.JSONDecodeError as exc:
+                rec = loads(line)
+            except ValueError as exc:
                 print(f"[ERROR] triage.jsonl line {lineno}: {exc}", file=sys.stderr)
                 errors += 1
                 continue
@@ -187,7 +230,14 @@ def load_triage(path: Path) -> tuple[list[dict[str, Any]], int]:
                 errors += 1
                 continue
             records.append(rec)
-    return records, errors
+    if pending is not None:
+        return load_triage_since(path, None)
+    new_source = (
+        {"inode": st.st_ino, "offset": offset, "lines": lineno, "tail": tail_digest(path, offset)}
+        if complete
+        else None
+    )
+    return records, errors, new_source, incremental
 
 
 # ---------------------------------------------------------------------------
@@ -204,6 +254,14 @@ def load_scorecard(path: Path) -> dict[str, Any]:
         return json.load(fh)
 
 
+def set_triage_source(scorecard: dict[str, Any], source: dict[str, Any] | None, pending: str | None = None) -> None:
+    """Record the triage lines the scorecard's counters include; None forces a full recompute."""
+    if source is None:
+        scorecard.pop(TRIAGE_SOURCE_KEY, None)
+        return
+    scorecard[TRIAGE_SOURCE_KEY] = dict(source, pending=pending) if pending is not None else source
+
+
 def save_scorecard(scorecard: dict[str, Any], path: Path) -> None:
     """Write scorecard atomically: temp file in same dir + os.replace()."""
     scorecard["_updated_ts"] = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
@@ -228,11 +286,27 @@ def save_scorecard(scorecard: dict[str, Any], path: Path) -> None:
 # Stats computation
 # ---------------------------------------------------------------------------
 
+def _parse_ts(ts: str) -> datetime:
+    dt = datetime.fromisoformat(ts.replace("Z", "+00:00"))
+    return dt if dt.tzinfo is not None else dt.replace(tzinfo=timezone.utc)
+
+
 def compute_rule_stats(
     triage_records: list[dict[str, Any]],
+    base: dict[str, dict[str, Any]] | None = None,
 ) -> dict[str, dict[str, Any]]:
-    """Aggregate triage records into per-rule stats."""
-    stats: dict[str, dict[str, Any]] = {}
+    """Aggregate triage records into per-rule stats, added on top of base when given."""
+    stats: dict[str, dict[str, Any]] = {
+        rule: {
+            "tp": s.get("tp", 0),
+            "fp": s.get("fp", 0),
+            "acceptable": s.get("acceptable", 0),
+            "last_fp_ts": s.get("last_fp_ts"),
+        }
+        for rule, s in (base or {}).items()
+    }
+    # Parsed last_fp_ts per rule, so each timestamp is parsed once.
+    last_fp_dt: dict[str, datetime | None] = {}
 
     for rec in triage_records:
         rule = rec.get("rule", "UNKNOWN")
@@ -248,18 +322,14 @@ def compute_rule_stats(
             stats[rule]["fp"] += 1
             if ts:
                 try:
-                    ts_dt = datetime.fromisoformat(ts.replace("Z", "+00:00"))
-                    if ts_dt.tzinfo is None:
-                        ts_dt = ts_dt.replace(tzinfo=timezone.utc)
-                    last_fp_ts = stats[rule]["last_fp_ts"]
-                    if last_fp_ts is None:
+                    ts_dt = _parse_ts(ts)
+                    if rule not in last_fp_dt:
+                        last_fp_ts = stats[rule]["last_fp_ts"]
+                        last_fp_dt[rule] = _parse_ts(last_fp_ts) if last_fp_ts else None
+                    last_dt = last_fp_dt[rule]
+                    if last_dt is None or ts_dt > last_dt:
                         stats[rule]["last_fp_ts"] = ts
-                    else:
-                        last_dt = datetime.fromisoformat(last_fp_ts.replace("Z", "+00:00"))
-                        if last_dt.tzinfo is None:
-                            last_dt = last_dt.replace(tzinfo=timezone.utc)
-                        if ts_dt > last_dt:
-                            stats[rule]["last_fp_ts"] = ts
+                        last_fp_dt[rule] = ts_dt
                 except ValueError:
                     pass  # ts already validated; should not reach here
         elif verdict == "acceptable":
@@ -339,10 +409,14 @@ def update_scorecard(
     scorecard: dict[str, Any],
     triage_records: list[dict[str, Any]],
     triage_errors: int = 0,
+    incremental: bool = False,
 ) -> tuple[dict[str, Any], list[str]]:
     """
     Recompute stats from triage records, apply lifecycle transitions.
 
+    With incremental=True the records are the ones appended since the
+    scorecard was computed, and are added to its current counters.
+
     Rules present in scorecard but absent from triage have their counters
     reset to zero so that the scorecard stays consistent with triage truth
     (e.g. after a triage window rotation or manual cleanup).
@@ -354,10 +428,9 @@ def update_scorecard(
 
     Returns (updated_scorecard, list of transition messages).
     """
-    stats = compute_rule_stats(triage_records)
-    transitions: list[str] = []
-
     rules = scorecard.setdefault("rules", {})
+    stats = compute_rule_stats(triage_records, rules if incremental else None)
+    transitions: list[str] = []
 
     # Update stats for rules present in triage
     for rule, s in stats.items():
@@ -597,7 +670,10 @@ def main(argv: list[str] | None = None) -> int:
         if session:
             new_rec["session"] = session
         with _scorecard_write_lock(scorecard_path):
-            triage, triage_errors = load_triage(triage_path)
+            scorecard = load_scorecard(scorecard_path)
+            triage, triage_errors, source, incremental = load_triage_since(
+                triage_path, scorecard.get(TRIAGE_SOURCE_KEY)
+            )
             if triage_errors:
                 # Do NOT write new_rec here: writing before returning exit code 1
                 # creates a non-idempotent path — retrying after fixing bad lines
@@ -610,16 +686,18 @@ def main(argv: list[str] | None = None) -> int:
                     file=sys.stderr,
                 )
                 return 1
-            scorecard = load_scorecard(scorecard_path)
             # Include new_rec in memory so scorecard and triage stay consistent.
             # Scorecard is written first (atomic); triage append follows.
             # If scorecard write fails nothing is persisted — safe to retry.
-            # If triage append fails after scorecard write, --update-scorecard
-            # will recompute the correct scorecard from triage on next run.
-            scorecard, transitions = update_scorecard(scorecard, triage + [new_rec], triage_errors)
+            # new_rec is saved as the pending record: the next run skips it
+            # when it finds it appended, and recomputes the scorecard from the
+            # whole triage file when the append failed.
+            new_line = json.dumps(new_rec, ensure_ascii=False)
+            scorecard, transitions = update_scorecard(scorecard, triage + [new_rec], triage_errors, incremental)
+            set_triage_source(scorecard, source, pending=new_line)
             save_scorecard(scorecard, scorecard_path)
             with triage_path.open("a", encoding="utf-8") as fh:
-                fh.write(json.dumps(new_rec, ensure_ascii=False) + "\n")
+                fh.write(new_line + "\n")
         print(f"Recorded {verdict} for {rule} at {ts}")
         if transitions:
             print("Lifecycle transitions:")
@@ -630,7 +708,10 @@ def main(argv: list[str] | None = None) -> int:
     # --update-scorecard
     if args.update_scorecard:
         with _scorecard_write_lock(scorecard_path):
-            triage, triage_errors = load_triage(triage_path)
+            scorecard = load_scorecard(scorecard_path)
+            triage, triage_errors, source, incremental = load_triage_since(
+                triage_path, scorecard.get(TRIAGE_SOURCE_KEY)
+            )
             if triage_errors:
                 print(
                     f"[ERROR] {triage_errors} invalid line(s) in triage.jsonl — "
@@ -638,8 +719,9 @@ def main(argv: list[str] | None = None) -> int:
                     "(lifecycle transitions and counter resets suppressed).",
                     file=sys.stderr,
                 )
-            scorecard = load_scorecard(scorecard_path)
-            scorecard, transitions = update_scorecard(scorecard, triage, triage_errors)
+            scorecard, transitions = update_scorecard(scorecard, triage, triage_errors, incremental)
+            # Counters built around invalid lines are not triage truth: recompute them next time.
+            set_triage_source(scorecard, None if triage_errors else source)
             save_scorecard(scorecard, scorecard_path)
         if transitions:
             print("Lifecycle transitions:")
@@ -5,6 +5,7 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 import re
 import subprocess
 import sys
@@ -13,6 +14,10 @@ from typing import Any
 
 
 SCRIPT_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(SCRIPT_DIR / "lib"))
+from event_snapshot import tail_digest  # noqa: E402
+from jsonl_reader import loads  # noqa: E402
+
 PRECISION_TRACKER = SCRIPT_DIR / "precision-tracker.py"
 TRIAGE_VERDICTS = ("fp", "tp", "acceptable")
 TRIAGE_RULE_ID_RE = re.compile(r"[A-Za-z][A-Za-z0-9]*(?:-[A-Za-z0-9]+)*")
@@ -34,6 +39,12 @@ RULE_ID_PATTERN = re.compile(
     r"\[(L[1-7]|SEC-\d+|RS-\d+|GO-\d+|TS-\d+|PY-\d+|U-\d+|W-\d+|TASTE-[A-Za-z0-9-]+)\]"
 )
 IDENTIFIER_TOKEN_CHARS = "A-Za-z0-9_-"
+# Fields whose whole value identifies an event; the sidecar index covers these
+# and the bracketed rule ids in reason/detail, not free text.
+EVENT_KEY_FIELDS = ("event_id", "code", "rule_id")
+EVENT_INDEX_SUFFIX = ".ids.json"
+EVENT_INDEX_VERSION = 2
+REVERSE_SCAN_BLOCK = 1 << 20
 
 
 def redact(text: str) -> str:
@@ -50,30 +61,145 @@ def _redact_match(match: re.Match[str]) -> str:
 
 
 def load_event(path: Path, event_id: str) -> dict[str, Any] | None:
+    """The last event in path that matches event_id.
+
+    Ids an event carries as a key (event_id, code, rule_id or a bracketed
+    rule id) are looked up in the sidecar index, built on first use and
+    extended with the lines appended since. A later line can still mention
+    the id in its reason or detail text, so the reverse scan only reads back
+    to the indexed line. Ids that are not keys, or a log whose index cannot
+    be saved, use a reverse scan of the whole log.
+    """
     if not path.is_file():
         raise SystemExit(f"event log does not exist: {path}")
 
-    selected: dict[str, Any] | None = None
-    with path.open("r", encoding="utf-8", errors="replace") as handle:
-        for raw_line in handle:
-            raw_line = raw_line.strip()
-            if not raw_line:
-                continue
+    ids = load_event_index(path)
+    if ids is not None and event_id in ids:
+        row = scan_event_reverse(path, event_id, stop=ids[event_id])
+        if row is not None:
+            return row
+    return scan_event_reverse(path, event_id)
+
+
+def event_index_path(path: Path) -> Path:
+    return path.with_name(f"{path.name}{EVENT_INDEX_SUFFIX}")
+
+
+def event_index_keys(row: dict[str, Any]) -> set[str]:
+    """The ids row is keyed by: its key fields and the bracketed rule ids in reason/detail."""
+    keys = {value for value in (row.get(field) for field in EVENT_KEY_FIELDS) if isinstance(value, str) and value}
+    for field in ("reason", "detail"):
+        keys.update(RULE_ID_PATTERN.findall(str(row.get(field, ""))))
+    return keys
+
+
+def load_event_index(path: Path) -> dict[str, int] | None:
+    """id -> byte offset of the last line keyed by it, or None when the index cannot be saved.
+
+    A saved index whose log was rotated, truncated or rewritten before its
+    offset, or that holds anything but offsets inside the log, is rebuilt
+    from the start.
+    """
+    index_path = event_index_path(path)
+    st = path.stat()
+    ids: dict[str, int] = {}
+    offset = 0
+    loaded = False
+    try:
+        saved = json.loads(index_path.read_text(encoding="utf-8"))
+        source = saved["source"]
+        if (
+            saved["version"] == EVENT_INDEX_VERSION
+            and source["inode"] == st.st_ino
+            and _is_offset(source["offset"], st.st_size)
+            and source["tail"] == tail_digest(path, source["offset"])
+            and isinstance(saved["ids"], dict)
+            and all(_is_offset(value, source["offset"]) for value in saved["ids"].values())
+        ):
+            ids = saved["ids"]
+            offset = source["offset"]
+            loaded = True
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    if loaded and offset == st.st_size:
+        return ids
+    with path.open("rb") as handle:
+        handle.seek(offset)
+        for raw in handle:
+            if not raw.endswith(b"\n"):
+                break
+            line_offset = offset
+            offset += len(raw)
             try:
-                row = json.loads(raw_line)
-            except json.JSONDecodeError:
-                continue
-            if not isinstance(row, dict):
+                row = loads(raw, "replace")
+            except ValueError:
                 continue
-            if event_matches(row, event_id):
-                selected = row
-    return selected
+            if isinstance(row, dict):
+                for key in event_index_keys(row):
+                    ids[key] = line_offset
+
+    tmp_path = index_path.with_name(f"{index_path.name}.tmp.{os.getpid()}")
+    try:
+        tmp_path.write_text(
+            json.dumps(
+                {
+                    "version": EVENT_INDEX_VERSION,
+                    "source": {"inode": st.st_ino, "offset": offset, "tail": tail_digest(path, offset)},
+                    "ids": ids,
+                },
+                separators=(",", ":"),
+            ),
+            encoding="utf-8",
+        )
+        tmp_path.replace(index_path)
+    except OSError:
+        return None
+    # An unterminated last line is not indexed yet, so only a fully indexed log answers alone.
+    return ids if offset == path.stat().st_size else None
+
+
+def _is_offset(value: Any, limit: int) -> bool:
+    return type(value) is int and 0 <= value <= limit
+
+
+def scan_event_reverse(path: Path, event_id: str, stop: int = 0) -> dict[str, Any] | None:
+    """Read path backwards from the end to the line starting at stop; return the first matching event."""
+    # A matching line holds the id verbatim unless JSON escaping could change it.
+    needle = b""
+    if event_id.isascii() and "/" not in event_id and json.dumps(event_id)[1:-1] == event_id:
+        needle = event_id.encode("ascii")
+    with path.open("rb") as handle:
+        position = handle.seek(0, 2)
+        partial = b""
+        while position > stop:
+            size = min(REVERSE_SCAN_BLOCK, position - stop)
+            position -= size
+            handle.seek(position)
+            lines = (handle.read(size) + partial).split(b"\n")
+            # The first piece may be the tail of a line that starts in an earlier block.
+            partial = lines.pop(0) if position > stop else b""
+            for line in reversed(lines):
+                row = _match_line(line, needle, event_id)
+                if row is not None:
+                    return row
+        return None
+
+
+def _match_line(line: bytes, needle: bytes, event_id: str) -> dict[str, Any] | None:
+    if not line.strip() or (needle and needle not in line):
+        return None
+    try:
+        row = loads(line.strip(), "replace")
+    except ValueError:
+        return None
+    return row if isinstance(row, dict) and event_matches(row, event_id) else None
 
 
 def event_matches(row: dict[str, Any], event_id: str) -> bool:
     return any(
         row.get(field) == event_id
-        for field in ("event_id", "code", "rule_id")
+        for field in EVENT_KEY_FIELDS
     ) or text_contains_identifier(
         str(row.get("reason", "")), event_id
     ) or text_contains_identifier(str(row.get("detail", "")), event_id)
@@ -103,11 +103,11 @@ fi
 if [[ "${LANGUAGE_SCOPE_VALID}" == "true" ]] && language_selected "python"; then
   echo "--- Layer 1: Anti-Duplication ---"
 
-  dup_guard=$(find_guard "python/check_duplicates.py" "$PROJECT_DIR")
+  dup_guard=$(find_guard "python/check_duplicates.py")
   if [[ -n "$dup_guard" ]]; then
     check_pass "check_duplicates.py available (${dup_guard})"
   else
-    check_warn "check_duplicates.py not found (install vibeguard or copy guards/python/)"
+    check_warn "check_duplicates.py not found (install vibeguard or set VIBEGUARD_DIR to a VibeGuard checkout)"
   fi
 fi
 
@@ -115,11 +115,11 @@ fi
 if [[ "${LANGUAGE_SCOPE_VALID}" == "true" ]] && language_selected "python"; then
   echo "--- Layer 2: Naming Convention ---"
 
-  naming_guard=$(find_guard "python/check_naming_convention.py" "$PROJECT_DIR")
+  naming_guard=$(find_guard "python/check_naming_convention.py")
   if [[ -n "$naming_guard" ]]; then
     check_pass "check_naming_convention.py available (${naming_guard})"
   else
-    check_warn "check_naming_convention.py not found (install vibeguard or copy guards/python/)"
+    check_warn "check_naming_convention.py not found (install vibeguard or set VIBEGUARD_DIR to a VibeGuard checkout)"
   fi
 fi
 
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""Benchmark for scripts/lib/jsonl_reader.py.
+
+Writes a synthetic events.jsonl (1M lines by default, a small share of them
+inside the learning window, with a few malformed and edge-case lines), then
+reads it three ways: the stdlib loop the scripts used (text mode,
+json.loads, then skip on "ts"), iter_jsonl() without a prefilter, and
+iter_jsonl(since=...). Checks all three keep identical records and prints
+timings.
+
+Usage:
+    python3 tests/bench_jsonl_reader.py              # human-readable output
+    python3 tests/bench_jsonl_reader.py --json       # JSON output for CI
+    python3 tests/bench_jsonl_reader.py --lines=1000000 --recent=0.05
+    python3 tests/bench_jsonl_reader.py --no-orjson  # stdlib decoder only
+
+Exit code 1 means the readers disagreed.
+"""
+
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts" / "lib"))
+import jsonl_reader  # noqa: E402
+from jsonl_reader import iter_jsonl  # noqa: E402
+
+SINCE = "2026-03-01"
+# Lines the prefilter must not misjudge: ts nested or inside strings, odd spacing, escapes, bad JSON.
+EDGE_LINES = [
+    '{"ts": "2026-03-02T00:00:00Z", "decision": "warn", "detail": {"ts": "2020-01-01"}}',
+    '{"detail": {"ts": "2020-01-01"}, "ts":"2026-03-05T00:00:00Z", "decision": "pass"}',
+    '{"reason": "\\"ts\\": \\"2099-01-01\\"", "ts": "2020-01-01T00:00:00Z"}',
+    '{"ts" :  "2026-03-01T00:00:00Z", "decision": "block"}',
+    '{"ts": "2026\\u002d03-09T00:00:00Z", "decision": "warn"}',
+    '{"ts": 20260301, "decision": "warn"}',
+    '{"ts": "2026-03-04T00:00:00Z", "duration_ms": NaN}',
+    '{"ts": "2026-03-04T00:00:00Z", "big": 123456789012345678901234567890}',
+    '{"ts": "2026-03-04T00:00:00Z", "truncated',
+    '["ts", "2026-03-04"]',
+    "",
+]
+
+
+def synthetic_log(path: str, lines: int, recent: float, seed: int = 11) -> None:
+    rng = random.Random(seed)
+    reasons = [f"rule-{n}" for n in range(40)]
+    decisions = ["pass", "pass", "pass", "warn", "block"]
+    with open(path, "w", encoding="utf-8") as handle:
+        for n in range(lines):
+            if n % 50000 == 0:
+                handle.write("\n".join(EDGE_LINES) + "\n")
+            month = "03" if rng.random() < recent else "02"
+            day = f"2026-{month}-{rng.randrange(1, 29):02d}"
+            event = {
+                "ts": f"{day}T{rng.randrange(24):02d}:{rng.randrange(60):02d}:00Z",
+                "session": f"s-{rng.randrange(5000):04x}",
+                "hook": "post-edit-guard",
+                "tool": rng.choice(["Edit", "Write", "Bash"]),
+                "decision": rng.choice(decisions),
+                "reason": rng.choice(reasons),
+                "detail": f"src/module_{rng.randrange(300)}.py",
+                "duration_ms": rng.randrange(12000),
+            }
+            handle.write(json.dumps(event) + "\n")
+
+
+def read_stdlib(path: str):
+    kept = []
+    with open(path, encoding="utf-8") as handle:
+        for line in handle:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                kept.append(("malformed",))
+                continue
+            ts = record.get("ts", "") if isinstance(record, dict) else ""
+            if isinstance(ts, str) and ts[: len(SINCE)] < SINCE:
+                continue
+            kept.append(record)
+    return kept
+
+
+def read_shared(path: str, since: str | None):
+    kept = []
+    for _lineno, record, error in iter_jsonl(path, since=since):
+        if error is not None:
+            kept.append(("malformed",))
+            continue
+        ts = record.get("ts", "") if isinstance(record, dict) else ""
+        if isinstance(ts, str) and ts[: len(SINCE)] < SINCE:
+            continue
+        kept.append(record)
+    return kept
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    out = fn(*args)
+    return out, (time.perf_counter() - start) * 1000
+
+
+def same(left, right) -> bool:
+    # NaN != NaN, so compare the JSON text of the kept records.
+    return json.dumps(left, sort_keys=True) == json.dumps(right, sort_keys=True)
+
+
+def main() -> int:
+    opts = {"lines": 1_000_000, "recent": 0.05}
+    as_json = False
+    for arg in sys.argv[1:]:
+        if arg == "--json":
+            as_json = True
+        elif arg == "--no-orjson":
+            jsonl_reader.orjson = None
+        elif arg.startswith("--") and "=" in arg:
+            key, value = arg[2:].split("=", 1)
+            if key in opts:
+                opts[key] = type(opts[key])(value)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "events.jsonl")
+        synthetic_log(path, opts["lines"], opts["recent"])
+        size_mb = os.path.getsize(path) / 1_000_000
+        expected, stdlib_ms = timed(read_stdlib, path)
+        decoded, decoder_ms = timed(read_shared, path, None)
+        filtered, prefilter_ms = timed(read_shared, path, SINCE)
+
+    identical = same(expected, decoded) and same(expected, filtered)
+    result = {
+        "lines": opts["lines"],
+        "size_mb": round(size_mb, 1),
+        "kept": len(expected),
+        "decoder": "orjson" if jsonl_reader.orjson is not None else "json",
+        "stdlib_ms": round(stdlib_ms, 1),
+        "shared_reader_ms": round(decoder_ms, 1),
+        "prefilter_ms": round(prefilter_ms, 1),
+        "speedup": round(stdlib_ms / prefilter_ms, 1) if prefilter_ms else None,
+        "identical": identical,
+    }
+    if as_json:
+        print(json.dumps(result, indent=2))
+    else:
+        print(f"Log: {result['lines']} lines, {result['size_mb']} MB, {result['kept']} kept (since {SINCE})")
+        print(f"stdlib json.loads loop:      {result['stdlib_ms']} ms")
+        print(f"iter_jsonl ({result['decoder']}):{' ' * (17 - len(result['decoder']))}{result['shared_reader_ms']} ms")
+        print(f"iter_jsonl + ts prefilter:   {result['prefilter_ms']} ms")
+        print(f"Speedup: {result['speedup']}x")
+        print(f"Identical results: {'yes' if identical else 'NO'}")
+    return 0 if identical else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
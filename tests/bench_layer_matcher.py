@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""Microbenchmark for check_dependency_layers.LayerMatcher.
+
+Builds a synthetic 50-layer architecture config, resolves every file and
+import of a synthetic tree with the per-pattern reference loops and with the
+compiled LayerMatcher, checks both give identical answers, and prints timings.
+
+Usage:
+    python3 tests/bench_layer_matcher.py              # human-readable output
+    python3 tests/bench_layer_matcher.py --json       # JSON output for CI
+    python3 tests/bench_layer_matcher.py --layers=50 --files=4000 --imports=12
+
+Exit code 1 means the two implementations disagreed.
+"""
+
+import json
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "guards" / "universal"))
+from check_dependency_layers import LayerMatcher  # noqa: E402
+
+
+def reference_resolve_layer(file_path: str, layers: list[dict]) -> str | None:
+    normalized = file_path.replace("\\", "/")
+    for layer in layers:
+        for pattern in layer.get("paths", []):
+            pattern_clean = pattern.rstrip("/")
+            if f"/{pattern_clean}/" in f"/{normalized}" or normalized.startswith(pattern_clean):
+                return layer["name"]
+    return None
+
+
+def reference_import_to_layer(import_path: str, file_path: str, layers: list[dict]) -> str | None:
+    if import_path.startswith("."):
+        dir_path = os.path.dirname(file_path)
+        resolved = os.path.normpath(os.path.join(dir_path, import_path))
+        return reference_resolve_layer(resolved, layers)
+    for layer in layers:
+        for pattern in layer.get("paths", []):
+            pattern_clean = pattern.rstrip("/").replace("/", ".")
+            dir_name = pattern.rstrip("/").split("/")[-1]
+            if import_path.startswith(dir_name) or import_path.startswith(pattern_clean):
+                return layer["name"]
+    return None
+
+
+def synthetic_config(layer_count: int) -> list[dict]:
+    layers = []
+    for i in range(layer_count):
+        layers.append(
+            {
+                "name": f"layer{i:02d}",
+                "paths": [f"src/layer{i:02d}/", f"services/svc{i:02d}/core/", f"lib{i:02d}"],
+                "allowed_deps": [f"layer{j:02d}" for j in range(i)],
+            }
+        )
+    return layers
+
+
+def synthetic_tree(layer_count: int, file_count: int, imports_per_file: int, seed: int = 7):
+    rng = random.Random(seed)
+    roots = ["src/layer{:02d}", "services/svc{:02d}/core", "lib{:02d}", "misc/unmapped{:02d}"]
+    files = []
+    for n in range(file_count):
+        root = rng.choice(roots).format(rng.randrange(layer_count))
+        depth = "/".join(f"pkg{rng.randrange(5)}" for _ in range(rng.randrange(3)))
+        path = f"{root}/{depth}/mod{n}.py" if depth else f"{root}/mod{n}.py"
+        imports = []
+        for _ in range(imports_per_file):
+            target = rng.randrange(layer_count)
+            imports.append(
+                rng.choice(
+                    [
+                        f"src.layer{target:02d}.models",
+                        f"layer{target:02d}.api",
+                        f"services.svc{target:02d}.core.handlers",
+                        f"lib{target:02d}.util",
+                        f"../../lib{target:02d}/x",
+                        "os.path",
+                        "typing",
+                    ]
+                )
+            )
+        files.append((path, imports))
+    return files
+
+
+def run_reference(files, layers):
+    results = []
+    for path, imports in files:
+        results.append(reference_resolve_layer(path, layers))
+        results.extend(reference_import_to_layer(imp, path, layers) for imp in imports)
+    return results
+
+
+def run_compiled(files, layers):
+    matcher = LayerMatcher(layers)
+    results = []
+    for path, imports in files:
+        results.append(matcher.resolve(path))
+        results.extend(matcher.import_layer(imp, path) for imp in imports)
+    return results
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    out = fn(*args)
+    return out, (time.perf_counter() - start) * 1000
+
+
+def main() -> int:
+    opts = {"layers": 50, "files": 4000, "imports": 12}
+    as_json = False
+    for arg in sys.argv[1:]:
+        if arg == "--json":
+            as_json = True
+        elif arg.startswith("--") and "=" in arg:
+            key, value = arg[2:].split("=", 1)
+            if key in opts:
+                opts[key] = int(value)
+
+    layers = synthetic_config(opts["layers"])
+    files = synthetic_tree(opts["layers"], opts["files"], opts["imports"])
+    lookups = sum(1 + len(imports) for _, imports in files)
+
+    expected, reference_ms = timed(run_reference, files, layers)
+    actual, compiled_ms = timed(run_compiled, files, layers)
+    matches = expected == actual
+
+    result = {
+        "layers": opts["layers"],
+        "patterns": sum(len(layer["paths"]) for layer in layers),
+        "files": opts["files"],
+        "lookups": lookups,
+        "reference_ms": round(reference_ms, 2),
+        "compiled_ms": round(compiled_ms, 2),
+        "speedup": round(reference_ms / compiled_ms, 1) if compiled_ms else None,
+        "identical": matches,
+    }
+    if as_json:
+        print(json.dumps(result, indent=2))
+    else:
+        print(f"Layers: {result['layers']} ({result['patterns']} path patterns)")
+        print(f"Lookups: {lookups} ({opts['files']} files x {opts['imports']} imports)")
+        print(f"Per-pattern loops: {result['reference_ms']} ms")
+        print(f"LayerMatcher:      {result['compiled_ms']} ms")
+        print(f"Speedup: {result['speedup']}x")
+        print(f"Identical results: {'yes' if matches else 'NO'}")
+    return 0 if matches else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -388,6 +388,381 @@ assert data["partial"] is True, data
 assert data["truncated_reason"] == "budget_ms", data
 PY
 
+seek_root="${TMP_ROOT}/seek-project"
+seek_hash="$(python3 -c 'import hashlib, sys; print(hashlib.sha256(sys.argv[1].encode("utf-8")).hexdigest()[:8])' "$seek_root")"
+seek_project_dir="${preview_log_dir}/projects/${seek_hash}"
+mkdir -p "$seek_root" "$seek_project_dir"
+printf '%s\n' "$seek_root" > "${seek_project_dir}/.project-root"
+python3 - "${seek_project_dir}/events.jsonl" "$today" <<'PY'
+import json
+import sys
+from pathlib import Path
+
+today = sys.argv[2]
+with Path(sys.argv[1]).open("w", encoding="utf-8") as f:
+    for index in range(30000):
+        f.write(json.dumps({
+            "ts": "2020-01-01T00:00:00Z",
+            "session": f"old-{index % 7}",
+            "decision": "warn",
+            "reason": "stale-warning",
+        }) + "\n")
+    for index in range(12):
+        f.write(json.dumps({
+            "ts": today,
+            "session": f"new-{index % 3}",
+            "decision": "warn",
+            "reason": "recent-warning",
+        }) + "\n")
+PY
+seek_json="${TMP_ROOT}/learn-preview-seek.json"
+VIBEGUARD_LOG_DIR="$preview_log_dir" python3 scripts/gc/learn_digest.py \
+  --scope current \
+  --project-root "$seek_root" \
+  --format json \
+  --output "$seek_json" \
+  --max-events 100 \
+  --no-code-scan
+assert_cmd "current preview seeks past events older than the learning window" python3 - "$seek_json" <<'PY'
+import json
+import sys
+from pathlib import Path
+
+data = json.loads(Path(sys.argv[1]).read_text(encoding="utf-8"))
+project = data["projects"][0]
+assert project["events_read"] <= 100, project
+warn = next(signal for signal in project["signals"] if signal["type"] == "repeated_warn")
+assert warn["reason"] == "recent-warning", warn
+assert warn["count"] == 12, warn
+PY
+
+checkpoint_root="${TMP_ROOT}/checkpoint-project"
+checkpoint_hash="$(python3 -c 'import hashlib, sys; print(hashlib.sha256(sys.argv[1].encode("utf-8")).hexdigest()[:8])' "$checkpoint_root")"
+checkpoint_project_dir="${preview_log_dir}/projects/${checkpoint_hash}"
+mkdir -p "$checkpoint_root" "$checkpoint_project_dir"
+printf '%s\n' "$checkpoint_root" > "${checkpoint_project_dir}/.project-root"
+write_checkpoint_events() {
+  python3 - "${checkpoint_project_dir}/events.jsonl" "$today" "$1" "$2" <<'PY'
+import json
+import sys
+from pathlib import Path
+
+with Path(sys.argv[1]).open(sys.argv[4], encoding="utf-8") as f:
+    for index in range(int(sys.argv[3])):
+        f.write(json.dumps({
+            "ts": sys.argv[2],
+            "session": f"checkpoint-{index % 3}",
+            "decision": "warn",
+            "reason": "checkpoint-warning",
+        }) + "\n")
+PY
+}
+run_checkpoint_learn() {
+  VIBEGUARD_LOG_DIR="$preview_log_dir" python3 scripts/gc/learn_digest.py \
+    --scope current \
+    --project-root "$checkpoint_root" \
+    --format json \
+    --no-code-scan \
+    "$@"
+}
+write_checkpoint_events 10 w
+run_checkpoint_learn --output "${TMP_ROOT}/learn-preview-checkpoint.json" >/dev/null
+assert_cmd "current preview does not write learn checkpoints" test ! -e "${checkpoint_project_dir}/learn-checkpoint.json"
+run_checkpoint_learn --scheduled --output "${TMP_ROOT}/learn-checkpoint-digest.jsonl" >/dev/null
+assert_cmd "scheduled learn writes a per-project checkpoint" test -f "${checkpoint_project_dir}/learn-checkpoint.json"
+write_checkpoint_events 4 a
+checkpoint_resumed_json="$(run_checkpoint_learn --scheduled --output "${TMP_ROOT}/learn-checkpoint-digest.jsonl")"
+assert_cmd "scheduled learn reads only appended events and merges daily rollups" python3 - "$checkpoint_resumed_json" <<'PY'
+import json
+import sys
+
+project = json.loads(sys.argv[1])["projects"][0]
+assert project["events_checkpoint"] == "resumed", project
+assert project["events_read"] == 4, project
+warn = next(signal for signal in project["signals"] if signal["type"] == "repeated_warn")
+assert warn["count"] == 14, warn
+assert warn["affected_sessions"] == 3, warn
+PY
+write_checkpoint_events 11 w
+checkpoint_rewritten_json="$(run_checkpoint_learn --scheduled --output "${TMP_ROOT}/learn-checkpoint-digest.jsonl")"
+assert_cmd "rewritten event log falls back to a full rescan" python3 - "$checkpoint_rewritten_json" <<'PY'
+import json
+import sys
+
+project = json.loads(sys.argv[1])["projects"][0]
+assert project["events_checkpoint"] == "full_scan", project
+warn = next(signal for signal in project["signals"] if signal["type"] == "repeated_warn")
+assert warn["count"] == 11, warn
+PY
+write_sketch_events() {
+  python3 - "${checkpoint_project_dir}/events.jsonl" "$today" "$1" "$2" "$3" <<'PY'
+import json
+import sys
+from pathlib import Path
+
+with Path(sys.argv[1]).open(sys.argv[5], encoding="utf-8") as f:
+    for index in range(int(sys.argv[3]), int(sys.argv[4])):
+        f.write(json.dumps({
+            "ts": sys.argv[2],
+            "session": f"sketch-{index}",
+            "decision": "warn",
+            "reason": "checkpoint-warning",
+        }) + "\n")
+PY
+}
+write_sketch_events 0 2000 w
+run_checkpoint_learn --scheduled --output "${TMP_ROOT}/learn-checkpoint-digest.jsonl" >/dev/null
+write_sketch_events 2000 2500 a
+checkpoint_sketch_json="$(run_checkpoint_learn --scheduled --output "${TMP_ROOT}/learn-checkpoint-digest.jsonl")"
+assert_cmd "many sessions are estimated with a stated error across checkpoints" python3 - "$checkpoint_sketch_json" <<'PY'
+import json
+import sys
+
+project = json.loads(sys.argv[1])["projects"][0]
+assert project["events_checkpoint"] == "resumed", project
+warn = next(signal for signal in project["signals"] if signal["type"] == "repeated_warn")
+assert warn["count"] == 2500, warn
+assert abs(warn["affected_sessions"] - 2500) <= 2500 * 0.1, warn
+assert warn["affected_sessions_error"] == 0.0325, warn
+PY
+
+snapshot_root="${TMP_ROOT}/snapshot-project"
+snapshot_hash="$(python3 -c 'import hashlib, sys; print(hashlib.sha256(sys.argv[1].encode("utf-8")).hexdigest()[:8])' "$snapshot_root")"
+snapshot_project_dir="${preview_log_dir}/projects/${snapshot_hash}"
+mkdir -p "$snapshot_root" "$snapshot_project_dir"
+printf '%s\n' "$snapshot_root" > "${snapshot_project_dir}/.project-root"
+python3 - "${snapshot_project_dir}/events.jsonl" "$snapshot_root" <<'PY'
+import json
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+now = datetime.now(timezone.utc)
+with Path(sys.argv[1]).open("w", encoding="utf-8") as f:
+    for days_ago in (20, 3, 2, 1, 0):
+        ts = (now - timedelta(days=days_ago)).strftime("%Y-%m-%dT00:00:00Z")
+        for index in range(6):
+            f.write(json.dumps({
+                "ts": ts,
+                "session": f"snapshot-{index % 4}",
+                "decision": "block" if index % 2 else "warn",
+                "reason": "snapshot-rule",
+                "tool": "Edit",
+                "detail": f"{sys.argv[2]}/src/hot.py",
+                "duration_ms": 6000,
+            }) + "\n")
+        f.write("{not json\n")
+PY
+run_snapshot_learn() {
+  VIBEGUARD_LOG_DIR="$preview_log_dir" python3 scripts/gc/learn_digest.py \
+    --scope current \
+    --project-root "$snapshot_root" \
+    --format json \
+    --no-code-scan \
+    --output "${TMP_ROOT}/learn-preview-snapshot.json" \
+    "$@"
+}
+snapshot_raw_json="$(run_snapshot_learn --no-snapshot)"
+_GC_LOG_DIR="$preview_log_dir" python3 scripts/gc/compact_events.py >/dev/null
+assert_cmd "event compaction writes a columnar snapshot of closed days" test -f "${snapshot_project_dir}/events.snapshot"
+snapshot_json="$(run_snapshot_learn)"
+assert_cmd "learn reads closed days from the snapshot with identical signals" python3 - "$snapshot_raw_json" "$snapshot_json" <<'PY'
+import json
+import sys
+
+raw = json.loads(sys.argv[1])["projects"][0]
+snap = json.loads(sys.argv[2])["projects"][0]
+assert raw["events_snapshot_rows"] == 0, raw
+assert snap["events_snapshot_rows"] == 18, snap
+assert snap["events_read"] == 7, snap
+assert raw["signals"] == snap["signals"], (raw["signals"], snap["signals"])
+assert raw["diagnostics"] == snap["diagnostics"], (raw["diagnostics"], snap["diagnostics"])
+PY
+printf '%s\n' '{"ts": "2020-01-01T00:00:00Z", "decision": "pass"}' > "${snapshot_project_dir}/events.jsonl"
+stale_snapshot_json="$(run_snapshot_learn)"
+assert_cmd "a rewritten event log ignores its stale snapshot" python3 - "$stale_snapshot_json" <<'PY'
+import json
+import sys
+
+project = json.loads(sys.argv[1])["projects"][0]
+assert project["events_snapshot_rows"] == 0, project
+assert project["signals"] == [], project
+PY
+
+trend_root="${TMP_ROOT}/trend-project"
+trend_hash="$(python3 -c 'import hashlib, sys; print(hashlib.sha256(sys.argv[1].encode("utf-8")).hexdigest()[:8])' "$trend_root")"
+trend_project_dir="${preview_log_dir}/projects/${trend_hash}"
+mkdir -p "$trend_root" "$trend_project_dir"
+printf '%s\n' "$trend_root" > "${trend_project_dir}/.project-root"
+python3 - "${trend_project_dir}/events.jsonl" <<'PY'
+import json
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+now = datetime.now(timezone.utc)
+with Path(sys.argv[1]).open("w", encoding="utf-8") as f:
+    # One warn an hour for two days, then a burst of warns and blocks in the last half hour.
+    for hours_ago in range(48, 1, -1):
+        ts = (now - timedelta(hours=hours_ago)).strftime("%Y-%m-%dT%H:%M:%SZ")
+        f.write(json.dumps({"ts": ts, "session": "trend-a", "decision": "warn", "reason": "steady"}) + "\n")
+    for minutes_ago in range(30, 0, -2):
+        ts = (now - timedelta(minutes=minutes_ago)).strftime("%Y-%m-%dT%H:%M:%SZ")
+        f.write(json.dumps({"ts": ts, "session": "trend-b", "decision": "warn", "reason": "burst"}) + "\n")
+        f.write(json.dumps({"ts": ts, "session": "trend-b", "decision": "block", "reason": "burst-block"}) + "\n")
+PY
+trend_json="$(VIBEGUARD_LOG_DIR="$preview_log_dir" python3 scripts/gc/learn_digest.py \
+  --scope current \
+  --project-root "$trend_root" \
+  --format json \
+  --no-code-scan \
+  --output "${TMP_ROOT}/learn-preview-trends.json")"
+assert_cmd "decayed counters report the last hour's trends" python3 - "$trend_json" <<'PY'
+import json
+import sys
+
+project = json.loads(sys.argv[1])["projects"][0]
+trends = {trend["type"]: trend for trend in project["trends"]}
+assert trends["warn_escalation"]["recent_per_hour"] > trends["warn_escalation"]["baseline_per_hour"] * 1.5, trends
+assert trends["chronic_block"]["reason"] == "burst-block", trends
+assert "hot_files" not in trends, trends
+PY
+assert_contains "$(python3 scripts/learn/trends.py "${trend_project_dir}/events.jsonl")" '"reason": "burst-block"' \
+  "trends.py prints trends for a log without the analyzer"
+
+parallel_log_dir="${TMP_ROOT}/parallel-logs"
+parallel_guard_dir="${TMP_ROOT}/parallel-guard-vibeguard"
+mkdir -p "${parallel_guard_dir}/guards/universal"
+cat > "${parallel_guard_dir}/guards/universal/check_code_slop.sh" <<'SH'
+#!/usr/bin/env bash
+case "$1" in
+  *slow*) exec sleep 30 ;;
+esac
+for i in 1 2 3 4 5; do
+  echo "[SLOP] finding ${i}"
+done
+SH
+for name in a-slow b-fast; do
+  mkdir -p "${parallel_log_dir}/projects/${name}" "${TMP_ROOT}/parallel-${name}"
+  printf '%s\n' "${TMP_ROOT}/parallel-${name}" > "${parallel_log_dir}/projects/${name}/.project-root"
+  printf '{"ts":"%s","session":"parallel","decision":"warn","reason":"parallel-warning"}\n' "$today" \
+    > "${parallel_log_dir}/projects/${name}/events.jsonl"
+done
+parallel_json="${TMP_ROOT}/learn-global-parallel.json"
+VIBEGUARD_LOG_DIR="$parallel_log_dir" VIBEGUARD_REPO_DIR="$parallel_guard_dir" python3 scripts/gc/learn_digest.py \
+  --scope global \
+  --format json \
+  --output "$parallel_json" \
+  --code-scan \
+  --jobs 2 \
+  --budget-ms 3000 >/dev/null
+assert_cmd "parallel global learn keeps a slow project from starving the others" python3 - "$parallel_json" <<'PY'
+import json
+import sys
+from pathlib import Path
+
+data = json.loads(Path(sys.argv[1]).read_text(encoding="utf-8"))
+slow, fast = data["projects"]
+assert (slow["project"], fast["project"]) == ("a-slow", "b-fast"), data["projects"]
+assert slow["partial"] is True, slow
+assert fast["partial"] is False, fast
+assert [signal["type"] for signal in fast["signals"]] == ["linter_violations"], fast
+assert data["partial"] is True, data
+PY
+
+shared_log_dir="${TMP_ROOT}/shared-guard-logs"
+shared_guard_dir="${TMP_ROOT}/shared-guard-vibeguard"
+shared_overlaps="${TMP_ROOT}/shared-guard-overlaps"
+shared_runs="${TMP_ROOT}/shared-guard-runs"
+mkdir -p "${shared_guard_dir}/guards/universal"
+cat > "${shared_guard_dir}/guards/universal/check_code_slop.sh" <<SH
+#!/usr/bin/env bash
+mkdir "${TMP_ROOT}/shared-guard-running" 2>/dev/null || echo overlap >> "${shared_overlaps}"
+sleep 0.3
+rmdir "${TMP_ROOT}/shared-guard-running" 2>/dev/null
+echo run >> "${shared_runs}"
+SH
+for name in one two three; do
+  mkdir -p "${shared_log_dir}/projects/${name}" "${TMP_ROOT}/shared-${name}"
+  printf '%s\n' "${TMP_ROOT}/shared-${name}" > "${shared_log_dir}/projects/${name}/.project-root"
+  printf '{"ts":"%s","session":"shared","decision":"warn","reason":"shared-warning"}\n' "$today" \
+    > "${shared_log_dir}/projects/${name}/events.jsonl"
+done
+VIBEGUARD_LOG_DIR="$shared_log_dir" VIBEGUARD_REPO_DIR="$shared_guard_dir" python3 scripts/gc/learn_digest.py \
+  --scope global \
+  --format json \
+  --output "${TMP_ROOT}/learn-global-shared-guards.json" \
+  --code-scan \
+  --jobs 3 \
+  --guard-jobs 1 >/dev/null
+assert_cmd "every parallel project runs its guard" test "$(wc -l < "$shared_runs")" -eq 3
+assert_cmd "--guard-jobs caps guard subprocesses across parallel projects" test ! -e "$shared_overlaps"
+
+cache_log_dir="${TMP_ROOT}/guard-cache-logs"
+cache_guard_dir="${TMP_ROOT}/guard-cache-vibeguard"
+cache_root="${TMP_ROOT}/guard-cache-project"
+cache_runs="${TMP_ROOT}/guard-cache-runs"
+mkdir -p "${cache_guard_dir}/guards/universal" "${cache_guard_dir}/guards/_lib" "${cache_log_dir}/projects/cached" "$cache_root"
+printf 'LIMIT = 5\n' > "${cache_guard_dir}/guards/_lib/helper.py"
+cat > "${cache_guard_dir}/guards/universal/check_code_slop.sh" <<SH
+#!/usr/bin/env bash
+echo run >> "${cache_runs}"
+for i in 1 2 3 4 5; do
+  echo "[SLOP] finding \${i}"
+done
+SH
+printf 'print("cached")\n' > "${cache_root}/app.py"
+printf '%s\n' "$cache_root" > "${cache_log_dir}/projects/cached/.project-root"
+printf '{"ts":"%s","session":"cached","decision":"warn","reason":"cache-warning"}\n' "$today" \
+  > "${cache_log_dir}/projects/cached/events.jsonl"
+run_cached_learn() {
+  VIBEGUARD_LOG_DIR="$cache_log_dir" VIBEGUARD_REPO_DIR="$cache_guard_dir" python3 scripts/gc/learn_digest.py \
+    --scope global \
+    --scheduled \
+    --format json \
+    --output "${TMP_ROOT}/guard-cache-digest.jsonl" \
+    "$@"
+}
+run_cached_learn >/dev/null
+cached_json="$(run_cached_learn)"
+assert_cmd "unchanged project tree reuses cached guard results" test "$(wc -l < "$cache_runs")" -eq 1
+assert_contains "$cached_json" '"type": "linter_violations"' "cached guard results still produce signals"
+printf 'print("edited")\n' >> "${cache_root}/app.py"
+run_cached_learn >/dev/null
+assert_cmd "changed project tree reruns guards" test "$(wc -l < "$cache_runs")" -eq 2
+printf 'LIMIT = 6\n' > "${cache_guard_dir}/guards/_lib/helper.py"
+run_cached_learn >/dev/null
+assert_cmd "changed guard helper reruns guards" test "$(wc -l < "$cache_runs")" -eq 3
+run_cached_learn --no-guard-cache >/dev/null
+assert_cmd "--no-guard-cache always runs guards" test "$(wc -l < "$cache_runs")" -eq 4
+
+cache_index="${cache_log_dir}/learn-project-index.json"
+assert_contains "$(cat "$cache_index" 2>/dev/null)" '"cached"' "scheduled learn indexes project roots"
+# A later directory with the same root is only found through the index; a scan would pick the first name.
+mkdir -p "${cache_log_dir}/projects/aaaa0000"
+printf '%s\n' "$cache_root" > "${cache_log_dir}/projects/aaaa0000/.project-root"
+resolve_cached_project() {
+  VIBEGUARD_LOG_DIR="$cache_log_dir" python3 scripts/gc/learn_digest.py \
+    --scope current \
+    --project-root "$cache_root" \
+    --format json \
+    --no-code-scan \
+    --output "${TMP_ROOT}/guard-cache-preview.json" \
+    | python3 -c 'import json, sys; print(json.load(sys.stdin)["projects"][0]["project"])'
+}
+assert_contains "$(resolve_cached_project)" "cached" "current preview resolves the project root through the index"
+python3 - "$cache_index" "$cache_root" <<'PY'
+import json
+import sys
+from pathlib import Path
+
+path = Path(sys.argv[1])
+index = json.loads(path.read_text(encoding="utf-8"))
+index["roots"][str(Path(sys.argv[2]).resolve())] = "ffffffff"
+path.write_text(json.dumps(index), encoding="utf-8")
+PY
+assert_contains "$(resolve_cached_project)" "aaaa0000" "a stale index entry falls back to scanning project roots"
+
 preview_guard_dir="${TMP_ROOT}/preview-guard-vibeguard"
 mkdir -p "${preview_guard_dir}/guards/universal"
 cat > "${preview_guard_dir}/guards/universal/check_code_slop.sh" <<'SH'
@@ -470,6 +845,82 @@ assert runtime["error"] == "guard_exit:2", runtime
 assert runtime["examples"] == ["guard crashed"], runtime
 PY
 
+python_scan_root="${TMP_ROOT}/python-code-scan"
+mkdir -p "${python_scan_root}/pkg"
+printf '[project]\nname = "demo"\n' > "${python_scan_root}/pyproject.toml"
+for i in 1 2 3 4 5; do
+  printf '"""Compatibility shim."""\nfrom pkg.core import thing%s\n__all__ = ["thing%s"]\n' "$i" "$i" \
+    > "${python_scan_root}/pkg/shim${i}.py"
+done
+printf 'def thing1():\n    return 1\n' > "${python_scan_root}/pkg/core.py"
+python_scan_guard_dir="${TMP_ROOT}/python-guard-vibeguard"
+mkdir -p "${python_scan_guard_dir}/guards/python"
+cp -R guards/_lib "${python_scan_guard_dir}/guards/_lib"
+cp guards/python/check_dead_shims.py "${python_scan_guard_dir}/guards/python/"
+python_scan_json="${TMP_ROOT}/learn-preview-python-code-scan.json"
+VIBEGUARD_LOG_DIR="$preview_log_dir" VIBEGUARD_REPO_DIR="$python_scan_guard_dir" python3 scripts/gc/learn_digest.py \
+  --scope current \
+  --project-root "$python_scan_root" \
+  --format json \
+  --output "$python_scan_json" \
+  --guard-timeout 5 \
+  --code-scan
+assert_cmd "code scan ingests JSON findings from Python guards" python3 - "$python_scan_json" <<'PY'
+import json
+import sys
+from pathlib import Path
+
+data = json.loads(Path(sys.argv[1]).read_text(encoding="utf-8"))
+project = data["projects"][0]
+signal = next(item for item in project["signals"] if item.get("source") == "code_scan")
+assert signal["guard"] == "dead_shims", signal
+assert signal["count"] == 5, signal
+assert signal["examples"][0].startswith("[PY-13] pkg/shim1.py"), signal
+PY
+
+concurrent_scan_root="${TMP_ROOT}/concurrent-code-scan"
+concurrent_guard_dir="${TMP_ROOT}/concurrent-guard-vibeguard"
+mkdir -p "$concurrent_scan_root" "${concurrent_guard_dir}/guards/universal" "${concurrent_guard_dir}/guards/rust"
+printf '[package]\nname = "demo"\n' > "${concurrent_scan_root}/Cargo.toml"
+for guard in universal/check_code_slop rust/check_fast; do
+  printf '#!/usr/bin/env bash\nfor i in 1 2 3 4 5; do echo "[RS-01] finding ${i}"; done\n' \
+    > "${concurrent_guard_dir}/guards/${guard}.sh"
+done
+for guard in check_slow_a check_slow_b; do
+  printf '#!/usr/bin/env bash\nexec sleep 30\n' > "${concurrent_guard_dir}/guards/rust/${guard}.sh"
+done
+concurrent_scan_json="${TMP_ROOT}/learn-preview-concurrent-code-scan.json"
+concurrent_start="$(date +%s)"
+VIBEGUARD_LOG_DIR="$preview_log_dir" VIBEGUARD_REPO_DIR="$concurrent_guard_dir" python3 scripts/gc/learn_digest.py \
+  --scope current \
+  --project-root "$concurrent_scan_root" \
+  --format json \
+  --output "$concurrent_scan_json" \
+  --budget-ms 20000 \
+  --guard-timeout 2 \
+  --guard-jobs 4 \
+  --code-scan
+concurrent_elapsed=$(($(date +%s) - concurrent_start))
+assert_cmd "guards run concurrently within one guard timeout" test "$concurrent_elapsed" -lt 10
+assert_cmd "guard timeouts keep the other guards' results" python3 - "$concurrent_scan_json" <<'PY'
+import json
+import sys
+from pathlib import Path
+
+project = json.loads(Path(sys.argv[1]).read_text(encoding="utf-8"))["projects"][0]
+guards = sorted(item["guard"] for item in project["signals"] if item.get("source") == "code_scan")
+assert guards == ["code_slop", "fast"], project["signals"]
+timeouts = sorted(item["guard"] for item in project["diagnostics"] if item.get("error") == "timeout")
+assert timeouts == ["slow_a", "slow_b"], project["diagnostics"]
+assert project["partial"] is True, project
+assert project["truncated_reason"].startswith("guard_timeout:slow_"), project
+PY
+for jobs_flag in --guard-jobs --jobs; do
+  jobs_err="$(python3 scripts/gc/learn_digest.py --scope current --project-root "$concurrent_scan_root" \
+    --format json --code-scan "$jobs_flag" 0 2>&1 || true)"
+  assert_contains "$jobs_err" "argument ${jobs_flag}: value must be >= 1" "learn preview rejects ${jobs_flag} 0"
+done
+
 header "gc-scheduled.sh catch-up mode"
 
 skip_log_before="$(wc -l < "${log_dir}/gc-cron.log" | tr -d ' ')"
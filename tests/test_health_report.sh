@@ -109,6 +109,11 @@ set -euo pipefail
 
 command_name="${2:-}"
 mode="${FAKE_BLOCK_MODE:-legacy}"
+# Like a runtime that predates `observe batch`.
+if [[ "$command_name" == "batch" ]]; then
+  echo "unknown observe command: batch" >&2
+  exit 1
+fi
 if [[ "$command_name" == "summary" ]]; then
   case "$mode" in
     legacy)
@@ -159,6 +164,7 @@ for key in schema_version window_days scope generated_ts data_sources overview \
            downgrade_candidates follow_up_actions; do
   assert_contains "$json_out" "\"${key}\"" "json schema has ${key}"
 done
+assert_contains "$json_out" '"observe": ' "json carries per-section timings"
 assert_contains "$json_out" "\"decision_distribution\"" "json overview carries decision distribution"
 assert_contains "$json_out" '"block_counts_status": "available"' "json marks block split available"
 assert_contains "$json_out" '"total_blocks": 1' "json overview carries total block count"
@@ -233,13 +239,101 @@ header "scope stays explicit (global)"
 global_out="$(run_report --scope global --days 30 --log-file "${EVENTS}" --triage-file "${TRIAGE_CLEAN}" --format markdown)"
 assert_contains "$global_out" "Scope: **global**" "global scope reported explicitly"
 
+header "global per-project fan-out"
+FANOUT_LOG_DIR="${TMP_DIR}/fanout-logs"
+mkdir -p "${FANOUT_LOG_DIR}/projects/aaaa1111" "${FANOUT_LOG_DIR}/projects/bbbb2222" "${FANOUT_LOG_DIR}/projects/cccc3333"
+cp "${EVENTS}" "${FANOUT_LOG_DIR}/projects/aaaa1111/events.jsonl"
+printf '/work/alpha\n' > "${FANOUT_LOG_DIR}/projects/aaaa1111/.project-root"
+cp "${EVENTS}" "${FANOUT_LOG_DIR}/projects/bbbb2222/events.jsonl"
+cp "${STALE_EVENTS}" "${FANOUT_LOG_DIR}/projects/cccc3333/events.jsonl"
+fanout_json="$(VIBEGUARD_LOG_DIR="${FANOUT_LOG_DIR}" run_report --scope global --per-project --jobs 2 --days 30 --triage-file "${TRIAGE_CLEAN}" --format json)"
+TOTAL=$((TOTAL + 1))
+if fanout_err="$(python3 - "$fanout_json" <<'PY' 2>&1
+import json
+import sys
+
+report = json.loads(sys.argv[1])
+assert report["per_project"] is True and report["scope"] == "global", report["scope"]
+sections = report["projects"]
+assert [s["project"] for s in sections] == ["aaaa1111", "bbbb2222", "cccc3333"], sections
+assert sections[0]["project_root"] == "/work/alpha", sections[0]["project_root"]
+assert sections[0]["data_sources"] == [{"name": "observe.summary", "status": "ok"}], sections[0]["data_sources"]
+assert sections[0]["overview"]["total_triggers"] == 3, sections[0]["overview"]
+assert sections[2]["overview"]["no_data"] is True, sections[2]["overview"]
+rollup = report["rollup"]
+assert rollup["projects"] == 3 and rollup["projects_with_data"] == 2, rollup
+assert rollup["total_triggers"] == 6, rollup
+assert rollup["decision_distribution"] == {"block": 2, "pass": 2, "warn": 2}, rollup
+assert rollup["block_counts"]["total_blocks"] == 2, rollup
+assert [r["rule"] for r in rollup["zero_trigger_rules"]] == ["RS-03"], rollup
+assert [r["rule"] for r in report["precision_risks"]] == ["RS-03"], report["precision_risks"]
+PY
+)"; then
+  green "per-project report has a section per project and a summed rollup"
+  PASS=$((PASS + 1))
+else
+  red "per-project report sections or rollup are wrong: ${fanout_err}"
+  FAIL=$((FAIL + 1))
+fi
+fanout_md="$(VIBEGUARD_LOG_DIR="${FANOUT_LOG_DIR}" run_report --scope global --per-project --days 30 --triage-file "${TRIAGE_CLEAN}" --format markdown)"
+assert_contains "$fanout_md" "| aaaa1111 | /work/alpha | 3 |" "per-project markdown lists each project"
+assert_contains "$fanout_md" "Projects: 3 (2 with data, 0 unreadable)" "per-project markdown renders the rollup"
+# The runtime does not trim VIBEGUARD_LOG_DIR, so neither does the project listing.
+SPACED_LOG_DIR="${FANOUT_LOG_DIR} "
+mkdir -p "${SPACED_LOG_DIR}/projects/dddd4444"
+cp "${EVENTS}" "${SPACED_LOG_DIR}/projects/dddd4444/events.jsonl"
+spaced_json="$(VIBEGUARD_LOG_DIR="${SPACED_LOG_DIR}" run_report --scope global --per-project --days 30 --triage-file "${TRIAGE_CLEAN}" --format json)"
+assert_contains "$spaced_json" '"project": "dddd4444"' "per-project report lists the log root exactly as given"
+assert_contains "$spaced_json" '"projects": 1,' "per-project report does not trim the log root"
+FLAKY_RUNTIME="${TMP_DIR}/flaky-runtime"
+cat > "${FLAKY_RUNTIME}" <<SH
+#!/usr/bin/env bash
+case "\$*" in
+  *bbbb2222*) echo "simulated read failure" >&2; exit 3 ;;
+esac
+exec "${RUNTIME}" "\$@"
+SH
+chmod +x "${FLAKY_RUNTIME}"
+TOTAL=$((TOTAL + 1))
+if flaky_json="$(VIBEGUARD_RUNTIME="${FLAKY_RUNTIME}" VIBEGUARD_LOG_DIR="${FANOUT_LOG_DIR}" run_report --scope global --per-project --days 30 --triage-file "${TRIAGE_CLEAN}" --format json)" \
+  && flaky_err="$(python3 - "$flaky_json" <<'PY' 2>&1
+import json
+import sys
+
+report = json.loads(sys.argv[1])
+failed = {s["project"]: s for s in report["projects"]}["bbbb2222"]
+statuses = {source["status"] for source in failed["data_sources"]}
+assert statuses == {"error"}, failed["data_sources"]
+assert "simulated read failure" in failed["data_sources"][0]["error"], failed["data_sources"]
+rollup = report["rollup"]
+assert rollup["projects"] == 3 and rollup["projects_with_data"] == 1, rollup
+assert rollup["projects_with_errors"] == 1 and rollup["total_triggers"] == 3, rollup
+assert rollup["zero_trigger_rules"] == [], rollup
+assert any("could not be read" in action for action in report["follow_up_actions"]), report
+PY
+)"; then
+  green "one unreadable project log does not lose the per-project report"
+  PASS=$((PASS + 1))
+else
+  red "per-project report did not isolate a failing project: ${flaky_err:-no report}"
+  FAIL=$((FAIL + 1))
+fi
+TOTAL=$((TOTAL + 1))
+if run_report --per-project --days 30 --triage-file "${TRIAGE_CLEAN}" >/dev/null 2>&1; then
+  red "--per-project without --scope global must exit non-zero"
+  FAIL=$((FAIL + 1))
+else
+  green "--per-project requires --scope global"
+  PASS=$((PASS + 1))
+fi
+
 header "read-only repeatability"
 before_hash="$(shasum -a 256 "${EVENTS}" | awk '{print $1}')"
 repeat_one="$(run_report --days 30 --log-file "${EVENTS}" --triage-file "${TRIAGE_CLEAN}" --format json)"
 repeat_two="$(run_report --days 30 --log-file "${EVENTS}" --triage-file "${TRIAGE_CLEAN}" --format json)"
 after_hash="$(shasum -a 256 "${EVENTS}" | awk '{print $1}')"
 TOTAL=$((TOTAL + 1))
-if python3 -c 'import json,sys; a=json.loads(sys.argv[1]); b=json.loads(sys.argv[2]); a.pop("generated_ts",None); b.pop("generated_ts",None); raise SystemExit(a != b)' "$repeat_one" "$repeat_two"; then
+if python3 -c 'import json,sys; a=json.loads(sys.argv[1]); b=json.loads(sys.argv[2]); [r.pop(k,None) for r in (a,b) for k in ("generated_ts","timings_ms")]; raise SystemExit(a != b)' "$repeat_one" "$repeat_two"; then
   green "repeated health reports are semantically deterministic"
   PASS=$((PASS + 1))
 else
@@ -1,5 +1,5 @@
 #!/usr/bin/env bash
-# Regression tests for vibeguard-runtime observe summary|health|session.
+# Regression tests for vibeguard-runtime observe summary|health|batch|session.
 
 set -uo pipefail
 
@@ -159,6 +159,57 @@ if summary["block_counts"] != health["block_counts"]:
     raise SystemExit(f"block count parity failed: {summary['block_counts']} != {health['block_counts']}")
 PY
 
+header "batch json"
+BATCH_JSON="${TMP_DIR}/batch.json"
+DEFAULT_HEALTH_JSON="${TMP_DIR}/default-health.json"
+"${RUNTIME}" observe batch --days all --log-file "${EVENT_LOG}" --slow-ms 2000 > "${BATCH_JSON}"
+"${RUNTIME}" observe health --json --log-file "${EVENT_LOG}" --slow-ms 2000 > "${DEFAULT_HEALTH_JSON}"
+assert_cmd "batch: one read returns the summary and default-window health output" python3 - <<'PY' "${BATCH_JSON}" "${SUMMARY_JSON}" "${DEFAULT_HEALTH_JSON}"
+import json
+import sys
+
+batch, summary, health = (json.load(open(path, encoding="utf-8")) for path in sys.argv[1:4])
+if batch["command"] != "batch":
+    raise SystemExit(f"unexpected command: {batch['command']}")
+if batch["summary"] != summary:
+    raise SystemExit("batch summary differs from observe summary")
+if batch["health"] != health:
+    raise SystemExit("batch health differs from observe health")
+PY
+
+# Recent events so each batch window selects a different, non-empty subset.
+RECENT_LOG="${TMP_DIR}/recent-events.jsonl"
+python3 - "${RECENT_LOG}" <<'PY'
+import json
+import sys
+from datetime import datetime, timedelta, timezone
+
+now = datetime.now(timezone.utc)
+with open(sys.argv[1], "w", encoding="utf-8") as handle:
+    for age, decision in ((timedelta(minutes=30), "block"), (timedelta(hours=5), "warn"), (timedelta(days=3), "pass")):
+        ts = (now - age).strftime("%Y-%m-%dT%H:%M:%SZ")
+        handle.write(json.dumps({"ts": ts, "session": "r1", "hook": "pre-bash-guard", "decision": decision, "reason": "", "duration_ms": 1}) + "\n")
+PY
+for window in "--hours 1" "--days 7"; do
+  # shellcheck disable=SC2086
+  "${RUNTIME}" observe batch ${window} --log-file "${RECENT_LOG}" > "${BATCH_JSON}"
+  # shellcheck disable=SC2086
+  "${RUNTIME}" observe summary --json ${window} --log-file "${RECENT_LOG}" > "${SUMMARY_JSON}.recent"
+  "${RUNTIME}" observe health --json --log-file "${RECENT_LOG}" > "${DEFAULT_HEALTH_JSON}"
+  assert_cmd "batch ${window}: nested windows match the separate commands" python3 - <<'PY' "${BATCH_JSON}" "${SUMMARY_JSON}.recent" "${DEFAULT_HEALTH_JSON}"
+import json
+import sys
+
+batch, summary, health = (json.load(open(path, encoding="utf-8")) for path in sys.argv[1:4])
+if batch["summary"] != summary:
+    raise SystemExit("batch summary differs from observe summary")
+if batch["health"] != health:
+    raise SystemExit("batch health differs from observe health")
+if health["event_count"] != 2:
+    raise SystemExit(f"expected 2 events in the 24h health window, got {health['event_count']}")
+PY
+done
+
 header "session json"
 "${RUNTIME}" observe session s1 --json --hours all --log-file "${EVENT_LOG}" --slow-ms 2000 > "${SESSION_JSON}"
 assert_cmd "session: output excludes other sessions" python3 - <<'PY' "${SESSION_JSON}"
@@ -748,6 +748,44 @@ else
   FAIL=$((FAIL + 1))
 fi
 
+header "incremental scorecard folds only appended triage lines"
+TRIAGE_INC="${TMPDIR_TEST}/triage_inc.jsonl"
+SCORECARD_INC="${TMPDIR_TEST}/scorecard_inc.json"
+inc_counts() {
+  python3 -c "
+import json, sys
+rule = json.load(open(sys.argv[1]))['rules']['RS-INC']
+print(rule['tp'], rule['fp'], rule['last_fp_ts'])
+" "$SCORECARD_INC"
+}
+{
+  printf '{"ts":"2026-03-01T00:00:00Z","rule":"RS-INC","verdict":"tp"}\n'
+  printf '{"ts":"2026-03-05T00:00:00Z","rule":"RS-INC","verdict":"fp"}\n'
+} > "$TRIAGE_INC"
+python3 "$TRACKER" --triage-file "$TRIAGE_INC" --scorecard-file "$SCORECARD_INC" --update-scorecard >/dev/null 2>&1
+assert_contains "$(cat "$SCORECARD_INC")" '"_triage_source"' "scorecard records the triage offset it covers"
+printf '{"ts":"2026-03-02T00:00:00Z","rule":"RS-INC","verdict":"fp"}\n' >> "$TRIAGE_INC"
+python3 "$TRACKER" --triage-file "$TRIAGE_INC" --scorecard-file "$SCORECARD_INC" --record tp RS-INC >/dev/null 2>&1
+assert_contains "$(inc_counts)" "2 2 2026-03-05T00:00:00Z" "--record folds appended lines into the saved counters"
+python3 "$TRACKER" --triage-file "$TRIAGE_INC" --scorecard-file "$SCORECARD_INC" --update-scorecard >/dev/null 2>&1
+assert_contains "$(inc_counts)" "2 2 2026-03-05T00:00:00Z" "the recorded verdict is not counted twice"
+python3 - "$SCORECARD_INC" <<'PY'
+import json
+import sys
+
+# A --record whose triage append failed: counted in the scorecard, missing from triage.jsonl.
+path = sys.argv[1]
+scorecard = json.load(open(path))
+scorecard["rules"]["RS-INC"]["tp"] += 1
+scorecard["_triage_source"]["pending"] = '{"ts": "2026-03-09T00:00:00Z", "rule": "RS-INC", "verdict": "tp"}'
+json.dump(scorecard, open(path, "w"))
+PY
+python3 "$TRACKER" --triage-file "$TRIAGE_INC" --scorecard-file "$SCORECARD_INC" --update-scorecard >/dev/null 2>&1
+assert_contains "$(inc_counts)" "2 2 2026-03-05T00:00:00Z" "a pending verdict missing from triage forces a full recompute"
+printf '{"ts":"2026-03-01T00:00:00Z","rule":"RS-INC","verdict":"tp"}\n' > "$TRIAGE_INC"
+python3 "$TRACKER" --triage-file "$TRIAGE_INC" --scorecard-file "$SCORECARD_INC" --update-scorecard >/dev/null 2>&1
+assert_contains "$(inc_counts)" "1 0 None" "a rewritten triage file is recomputed from the start"
+
 # =========================================================
 echo
 echo "=============================="
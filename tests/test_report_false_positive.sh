@@ -122,6 +122,46 @@ TOTAL=$((TOTAL + 1))
 assert_contains "$missing_event_out" "event id not found in event log: VG-MISSING-EVENT" "missing event reports absent id"
 assert_not_contains "$missing_event_out" '"hook": "unknown"' "missing event does not emit unknown report"
 
+INDEX_EVENT_LOG="${TMP_DIR}/index-events.jsonl"
+index_event() {
+  printf '{"ts":"2026-06-19T00:00:0%s","event_id":"%s","hook":"post-edit-guard","path":"%s","reason":"VIBEGUARD [RS-03] unwrap"}\n' "$1" "$2" "$3"
+}
+{ index_event 0 evt-first src/first.rs; index_event 1 evt-second src/second.rs; } > "$INDEX_EVENT_LOG"
+index_first_out="$(python3 "$SCRIPT" RS-03 --event-log "$INDEX_EVENT_LOG" --format json)"
+assert_contains "$index_first_out" '"path": "src/second.rs"' "indexed lookup returns the last matching event"
+assert_contains "$(cat "${INDEX_EVENT_LOG}.ids.json")" '"RS-03"' "first lookup writes the event id index"
+index_event 2 evt-third src/third.rs >> "$INDEX_EVENT_LOG"
+assert_contains "$(python3 "$SCRIPT" RS-03 --event-log "$INDEX_EVENT_LOG" --format json)" '"path": "src/third.rs"' \
+  "index picks up appended events"
+{ index_event 0 evt-first src/rewritten.rs; index_event 1 evt-other src/other.rs; } > "${INDEX_EVENT_LOG}.new"
+cat "${INDEX_EVENT_LOG}.new" > "$INDEX_EVENT_LOG"
+assert_contains "$(python3 "$SCRIPT" evt-first --event-log "$INDEX_EVENT_LOG" --format json)" '"path": "src/rewritten.rs"' \
+  "rewritten log rebuilds the event id index"
+assert_not_contains "$(cat "${INDEX_EVENT_LOG}.ids.json")" '"unwrap"' "free-text tokens stay out of the event id index"
+REVERSE_EVENT_LOG="${TMP_DIR}/reverse-events.jsonl"
+{ index_event 0 evt-old src/old.rs; index_event 1 evt-new src/new.rs; } > "$REVERSE_EVENT_LOG"
+assert_contains "$(python3 "$SCRIPT" unwrap --event-log "$REVERSE_EVENT_LOG" --format json)" '"path": "src/new.rs"' \
+  "free-text ids are found by a reverse scan"
+{
+  index_event 0 evt-keyed src/keyed.rs
+  printf '{"ts":"2026-06-19T00:00:01","hook":"post-edit-guard","path":"src/mention.rs","reason":"retry of evt-keyed"}\n'
+} > "$REVERSE_EVENT_LOG"
+assert_contains "$(python3 "$SCRIPT" evt-keyed --event-log "$REVERSE_EVENT_LOG" --format json)" '"path": "src/mention.rs"' \
+  "a later free-text mention still wins over the indexed event"
+python3 - "${INDEX_EVENT_LOG}.ids.json" <<'PY'
+import json
+import sys
+
+with open(sys.argv[1], encoding="utf-8") as handle:
+    index = json.load(handle)
+index["ids"]["evt-other"] = "not-an-offset"
+with open(sys.argv[1], "w", encoding="utf-8") as handle:
+    json.dump(index, handle)
+PY
+assert_contains "$(python3 "$SCRIPT" evt-other --event-log "$INDEX_EVENT_LOG" --format json 2>&1)" '"path": "src/other.rs"' \
+  "a corrupt index offset is treated as a cache miss"
+assert_not_contains "$(cat "${INDEX_EVENT_LOG}.ids.json")" "not-an-offset" "a corrupt event id index is rebuilt"
+
 # GH-675: recording the triage verdict must happen in the same call that
 # produces the report, instead of printing an instruction nobody runs.
 triage_dir="$(mktemp -d)"
@@ -137,6 +137,8 @@ UNSUPPORTED_LANGUAGE_PROJECT="${TMP_DIR}/unsupported language project"
 FIXTURE_HOME="${TMP_DIR}/home"
 OUTSIDE_CWD="${TMP_DIR}/outside cwd"
 OVERRIDE_ROOT="${TMP_DIR}/explicit root"
+EMPTY_GUARD_ROOT="${TMP_DIR}/empty guard root"
+LOCAL_COPY_PROJECT="${TMP_DIR}/local copy project"
 MISSING_MAPPING_ROOT="${TMP_DIR}/missing mapping distribution"
 INVALID_PATHS_ROOT="${TMP_DIR}/invalid paths distribution"
 CONTROL_PATH_ROOT="${TMP_DIR}/control path distribution"
@@ -146,10 +148,12 @@ mkdir -p \
   "${FIXTURE_HOME}/.claude/skills/vibeguard" \
   "${FIXTURE_HOME}/.claude/rules/vibeguard" \
   "${OUTSIDE_CWD}" \
-  "${OVERRIDE_ROOT}/guards/python"
+  "${OVERRIDE_ROOT}/guards/python" \
+  "${EMPTY_GUARD_ROOT}"
 
 for project in \
   "${PROJECT_DIR}" \
+  "${LOCAL_COPY_PROJECT}" \
   "${RUST_PROJECT}" \
   "${GO_PROJECT}" \
   "${JS_PROJECT}" \
@@ -166,6 +170,7 @@ for project in \
 done
 
 printf '%s\n' '{"languages":["python"]}' > "${PROJECT_DIR}/.vibeguard.json"
+printf '%s\n' '{"languages":["python"]}' > "${LOCAL_COPY_PROJECT}/.vibeguard.json"
 printf '%s\n' '{"languages":["rust"]}' > "${RUST_PROJECT}/.vibeguard.json"
 printf '%s\n' '{"languages":["go"]}' > "${GO_PROJECT}/.vibeguard.json"
 printf '%s\n' '{"languages":["javascript"]}' > "${JS_PROJECT}/.vibeguard.json"
@@ -230,6 +235,24 @@ assert_not_contains \
   "${override_output}" \
   "check_naming_convention.py available (${REPO_DIR}/guards/python/check_naming_convention.py)"
 
+mkdir -p "${LOCAL_COPY_PROJECT}/scripts"
+cp "${REPO_DIR}/guards/python/check_duplicates.py" "${LOCAL_COPY_PROJECT}/scripts/"
+cp "${REPO_DIR}/guards/python/check_naming_convention.py" "${LOCAL_COPY_PROJECT}/scripts/"
+run_checker "${CHECKER}" "${LOCAL_COPY_PROJECT}" "${EMPTY_GUARD_ROOT}"
+assert_eq "project-local guard copy preserves compliance exit contract" 0 "${LAST_STATUS}"
+assert_not_contains \
+  "project-local duplicate guard copy is not used" \
+  "${LAST_OUTPUT}" \
+  "check_duplicates.py available (${LOCAL_COPY_PROJECT}/scripts/check_duplicates.py)"
+assert_contains \
+  "missing VibeGuard duplicate guard points at VIBEGUARD_DIR" \
+  "${LAST_OUTPUT}" \
+  "check_duplicates.py not found (install vibeguard or set VIBEGUARD_DIR to a VibeGuard checkout)"
+assert_contains \
+  "missing VibeGuard naming guard points at VIBEGUARD_DIR" \
+  "${LAST_OUTPUT}" \
+  "check_naming_convention.py not found (install vibeguard or set VIBEGUARD_DIR to a VibeGuard checkout)"
+
 run_checker "${CHECKER}" "${RUST_PROJECT}"
 assert_eq "Rust project preserves compliance exit contract" 0 "${LAST_STATUS}"
 assert_contains "Rust project reports manifest guard module" "${LAST_OUTPUT}" "guard module guards-rust available"
@@ -0,0 +1,74 @@
+#!/usr/bin/env bash
+# Unit tests for guards/python/check_dead_shims.py
+set -euo pipefail
+
+REPO_DIR="$(cd "$(dirname "$0")/../.." && pwd)"
+GUARD="${REPO_DIR}/guards/python/check_dead_shims.py"
+
+PASS=0; FAIL=0; TOTAL=0
+
+green() { printf '\033[32m  PASS: %s\033[0m\n' "$1"; }
+red()   { printf '\033[31m  FAIL: %s\033[0m\n' "$1"; }
+
+assert_ok() {
+  local desc="$1"; shift; TOTAL=$((TOTAL+1))
+  if "$@" >/dev/null 2>&1; then green "$desc"; PASS=$((PASS+1))
+  else red "$desc (expected exit 0)"; FAIL=$((FAIL+1)); fi
+}
+
+assert_fail() {
+  local desc="$1"; shift; TOTAL=$((TOTAL+1))
+  if "$@" >/dev/null 2>&1; then red "$desc (expected non-zero)"; FAIL=$((FAIL+1))
+  else green "$desc"; PASS=$((PASS+1)); fi
+}
+
+assert_output_contains() {
+  local desc="$1" expected="$2"; shift 2; TOTAL=$((TOTAL+1))
+  local out; out=$("$@" 2>&1 || true)
+  if echo "$out" | grep -qF -- "$expected"; then green "$desc"; PASS=$((PASS+1))
+  else red "$desc (missing: $expected)"; FAIL=$((FAIL+1)); fi
+}
+
+assert_output_not_contains() {
+  local desc="$1" unexpected="$2"; shift 2; TOTAL=$((TOTAL+1))
+  local out; out=$("$@" 2>&1 || true)
+  if echo "$out" | grep -qF -- "$unexpected"; then red "$desc (unexpected: $unexpected)"; FAIL=$((FAIL+1))
+  else green "$desc"; PASS=$((PASS+1)); fi
+}
+
+tmpdir="$(mktemp -d)"
+trap 'rm -rf "$tmpdir"' EXIT
+
+printf '\n=== check_dead_shims ===\n'
+
+if ! command -v python3 >/dev/null 2>&1; then
+  printf '\033[33m  SKIP: python3 not available\033[0m\n'
+  exit 0
+fi
+
+# --- Shims and near misses ---
+proj="${tmpdir}/proj"
+mkdir -p "${proj}/pkg"
+printf '"""Compatibility shim."""\nfrom pkg.core import run\n\n__all__ = ["run"]\n' > "${proj}/pkg/shim.py"
+printf 'import os\n\n\ndef run():\n    return os.getcwd()\n' > "${proj}/pkg/core.py"
+printf 'import os; CWD = os.getcwd()\n' > "${proj}/pkg/inline.py"
+printf 'import os\nif os.name == "nt":\n    import ntpath\n' > "${proj}/pkg/conditional.py"
+printf '# nothing here\n' > "${proj}/pkg/empty.py"
+
+assert_output_contains "re-export-only file is a dead shim" "[PY-13] pkg/shim.py" python3 "$GUARD" "$proj"
+assert_output_contains "only the shim is reported" "Total: 1 dead shim(s)" python3 "$GUARD" "$proj"
+assert_output_not_contains "statement after ; is seen" "pkg/inline.py" python3 "$GUARD" "$proj"
+assert_output_not_contains "conditional import is not a shim" "pkg/conditional.py" python3 "$GUARD" "$proj"
+assert_output_not_contains "comment-only file is not a shim" "pkg/empty.py" python3 "$GUARD" "$proj"
+assert_ok "shims do not fail without --strict" python3 "$GUARD" "$proj"
+assert_fail "--strict fails on shims" python3 "$GUARD" "$proj" --strict
+
+# --- --format json ---
+python3 "$GUARD" "$proj" --format json > "${tmpdir}/shims.json" 2>/dev/null || true
+assert_ok "JSON report is valid JSON" python3 -m json.tool "${tmpdir}/shims.json"
+assert_output_contains "JSON report carries rule and path" '"path": "pkg/shim.py"' cat "${tmpdir}/shims.json"
+assert_fail "--strict JSON run still fails on shims" python3 "$GUARD" "$proj" --format json --strict
+
+echo
+printf 'Total: %d  Pass: \033[32m%d\033[0m  Fail: \033[31m%d\033[0m\n' "$TOTAL" "$PASS" "$FAIL"
+[[ $FAIL -gt 0 ]] && exit 1 || exit 0
@@ -0,0 +1,216 @@
+#!/usr/bin/env bash
+# Unit tests for guards/python/check_duplicates.py
+set -euo pipefail
+
+REPO_DIR="$(cd "$(dirname "$0")/../.." && pwd)"
+GUARD="${REPO_DIR}/guards/python/check_duplicates.py"
+
+PASS=0; FAIL=0; TOTAL=0
+
+green() { printf '\033[32m  PASS: %s\033[0m\n' "$1"; }
+red()   { printf '\033[31m  FAIL: %s\033[0m\n' "$1"; }
+
+assert_ok() {
+  local desc="$1"; shift; TOTAL=$((TOTAL+1))
+  if "$@" >/dev/null 2>&1; then green "$desc"; PASS=$((PASS+1))
+  else red "$desc (expected exit 0)"; FAIL=$((FAIL+1)); fi
+}
+
+assert_fail() {
+  local desc="$1"; shift; TOTAL=$((TOTAL+1))
+  if "$@" >/dev/null 2>&1; then red "$desc (expected non-zero)"; FAIL=$((FAIL+1))
+  else green "$desc"; PASS=$((PASS+1)); fi
+}
+
+assert_output_contains() {
+  local desc="$1" expected="$2"; shift 2; TOTAL=$((TOTAL+1))
+  local out; out=$("$@" 2>&1 || true)
+  if echo "$out" | grep -qF -- "$expected"; then green "$desc"; PASS=$((PASS+1))
+  else red "$desc (missing: $expected)"; FAIL=$((FAIL+1)); fi
+}
+
+assert_output_not_contains() {
+  local desc="$1" unexpected="$2"; shift 2; TOTAL=$((TOTAL+1))
+  local out; out=$("$@" 2>&1 || true)
+  if echo "$out" | grep -qF -- "$unexpected"; then red "$desc (unexpected: $unexpected)"; FAIL=$((FAIL+1))
+  else green "$desc"; PASS=$((PASS+1)); fi
+}
+
+tmpdir="$(mktemp -d)"
+trap 'rm -rf "$tmpdir"' EXIT
+
+printf '\n=== check_duplicates ===\n'
+
+if ! command -v python3 >/dev/null 2>&1; then
+  printf '\033[33m  SKIP: python3 not available\033[0m\n'
+  exit 0
+fi
+
+# --- PASS: distinct definitions ---
+proj_clean="${tmpdir}/clean"
+mkdir -p "${proj_clean}/pkg"
+printf 'def load():\n    return 1\n' > "${proj_clean}/pkg/a.py"
+printf 'def store():\n    return 2\n' > "${proj_clean}/pkg/b.py"
+assert_output_contains "distinct definitions report nothing" "No duplicate definitions found" \
+  python3 "$GUARD" "$proj_clean"
+
+# --- Decorated and async definitions are indexed ---
+proj_names="${tmpdir}/names"
+mkdir -p "${proj_names}/pkg"
+cat > "${proj_names}/pkg/a.py" <<'EOF'
+import functools
+
+@functools.cache
+def fetch_user(user_id):
+    return user_id
+
+async def sync_orders():
+    return None
+EOF
+cat > "${proj_names}/pkg/b.py" <<'EOF'
+@staticmethod
+def fetch_user(user_id, *, strict=False):
+    return None
+
+async def sync_orders(batch):
+    return batch
+EOF
+assert_output_contains "decorated function duplicates are found" "fetch_user:" python3 "$GUARD" "$proj_names"
+assert_output_contains "async function duplicates are found" "sync_orders:" python3 "$GUARD" "$proj_names"
+
+# --- Protocols, including generic ones, and --strict ---
+proj_proto="${tmpdir}/protocols"
+mkdir -p "${proj_proto}/pkg"
+printf 'from typing import Protocol\n\nclass Store(Protocol):\n    def get(self): ...\n' > "${proj_proto}/pkg/a.py"
+printf 'import typing\n\nclass Store(typing.Protocol[int]):\n    def put(self): ...\n' > "${proj_proto}/pkg/b.py"
+assert_output_contains "Protocol[T] counts as a Protocol" "=== Duplicate Protocol Definitions ===" \
+  python3 "$GUARD" "$proj_proto"
+assert_fail "--strict fails on duplicate Protocols" python3 "$GUARD" --strict "$proj_proto"
+
+# --- Structurally identical bodies under different names ---
+proj_bodies="${tmpdir}/bodies"
+mkdir -p "${proj_bodies}/pkg"
+cat > "${proj_bodies}/pkg/a.py" <<'EOF'
+def normalize_rows(rows):
+    """Strip and drop empty rows."""
+    cleaned = []
+    for row in rows:
+        value = row.strip()
+        if value:
+            cleaned.append(value)
+    return cleaned
+EOF
+cat > "${proj_bodies}/pkg/b.py" <<'EOF'
+def tidy_lines(rows):
+    cleaned = []
+    for row in rows:
+        value = row.strip()
+        if value:
+            cleaned.append(value)
+    return cleaned
+
+def tiny():
+    return None
+EOF
+printf 'def tiny_too():\n    return None\n' > "${proj_bodies}/pkg/c.py"
+assert_output_contains "identical bodies are grouped" "=== Structurally Identical Bodies ===" \
+  python3 "$GUARD" "$proj_bodies"
+assert_output_contains "renamed copy is reported with its line" "pkg/b.py:1 tidy_lines" \
+  python3 "$GUARD" "$proj_bodies"
+assert_output_not_contains "trivial bodies are not reported" "tiny_too" python3 "$GUARD" "$proj_bodies"
+assert_ok "identical bodies alone do not fail --strict" python3 "$GUARD" --strict "$proj_bodies"
+
+# --- Definition cache: warm runs parse only changed files ---
+proj_cache="${tmpdir}/cache"
+mkdir -p "${proj_cache}/pkg"
+printf 'def one():\n    return 1\n' > "${proj_cache}/pkg/a.py"
+printf 'def two():\n    return 2\n' > "${proj_cache}/pkg/b.py"
+assert_output_contains "cold run parses every file" "Definition cache: 0 hits, 2 misses" \
+  python3 "$GUARD" "$proj_cache"
+assert_output_contains "warm run parses nothing" "Definition cache: 2 hits, 0 misses" \
+  python3 "$GUARD" "$proj_cache"
+printf 'def one():\n    return 1\n\ndef two():\n    return 3\n' > "${proj_cache}/pkg/a.py"
+assert_output_contains "edited file is re-parsed" "Definition cache: 1 hits, 1 misses" \
+  python3 "$GUARD" "$proj_cache"
+assert_output_contains "cached run sees the new duplicate" "two:" python3 "$GUARD" "$proj_cache"
+assert_output_contains "--no-cache disables the cache" "Definition cache: disabled" \
+  python3 "$GUARD" --no-cache "$proj_cache"
+
+# --- Near-duplicate bodies: renamed copies with small edits ---
+proj_near="${tmpdir}/near"
+mkdir -p "${proj_near}/pkg"
+cat > "${proj_near}/pkg/a.py" <<'EOF'
+def summarize_orders(orders, limit):
+    totals = {}
+    for order in orders:
+        key = order.customer
+        if key not in totals:
+            totals[key] = 0
+        totals[key] += order.amount * order.quantity
+    ranked = sorted(totals.items(), key=lambda kv: kv[1], reverse=True)
+    return [name for name, _ in ranked[:limit]]
+EOF
+cat > "${proj_near}/pkg/b.py" <<'EOF'
+class Ledger:
+    def top_customers(self, purchases, n):
+        sums = {}
+        for p in purchases:
+            who = p.buyer
+            if who not in sums:
+                sums[who] = 1
+            sums[who] += p.price * p.count
+        ranked = sorted(sums.items(), key=lambda kv: kv[1], reverse=False)
+        return [name for name, _ in ranked[:n]]
+EOF
+cat > "${proj_near}/pkg/c.py" <<'EOF'
+def parse_config(text):
+    result = {}
+    for raw in text.splitlines():
+        line = raw.split("#", 1)[0].strip()
+        if not line or "=" not in line:
+            continue
+        key, value = line.split("=", 1)
+        result[key.strip()] = value.strip()
+    return result
+EOF
+assert_output_not_contains "near duplicates are opt-in" "Near-Duplicate Bodies" python3 "$GUARD" "$proj_near"
+assert_output_contains "method near-duplicate of a function is found" "pkg/b.py:2 Ledger.top_customers" \
+  python3 "$GUARD" --near-duplicates "$proj_near"
+assert_output_not_contains "unrelated function is not clustered" "parse_config" \
+  python3 "$GUARD" --near-duplicates "$proj_near"
+assert_output_contains "--threshold sets the reported bound" "Jaccard ≥ 0.90" \
+  python3 "$GUARD" --threshold 0.9 "$proj_near"
+assert_output_contains "--threshold rejects values outside (0, 1]" "--threshold expects a number" \
+  python3 "$GUARD" --threshold 1.5 "$proj_near"
+
+# --- JSON report feeds findings_to_plan.py ---
+python3 "$GUARD" --near-duplicates --format json "$proj_near" > "${tmpdir}/near.json" 2>/dev/null || true
+assert_output_contains "JSON report lists near-duplicate findings" '"category": "near-duplicate-body"' \
+  cat "${tmpdir}/near.json"
+assert_ok "JSON report is valid JSON" python3 -m json.tool "${tmpdir}/near.json"
+assert_ok "findings_to_plan accepts --findings-json alone" \
+  python3 "${REPO_DIR}/workflows/plan-flow/scripts/findings_to_plan.py" \
+  --findings-json "${tmpdir}/near.json" --output "${tmpdir}/plan.md"
+assert_output_contains "plan scores the finding as a duplicate body" "| duplicate-body |" cat "${tmpdir}/plan.md"
+assert_output_contains "plan step names both definitions" "Ledger.top_customers" cat "${tmpdir}/plan.md"
+
+# --- Changed-files mode: staged files against the persisted index ---
+proj_staged="${tmpdir}/staged"
+mkdir -p "${proj_staged}/pkg"
+printf 'def fetch():\n    return 1\n' > "${proj_staged}/pkg/a.py"
+printf 'def other():\n    return 1\n' > "${proj_staged}/pkg/b.py"
+printf 'def lone():\n    return 1\n' > "${proj_staged}/pkg/c.py"
+printf 'def lone():\n    return 2\n' > "${proj_staged}/pkg/d.py"
+python3 "$GUARD" "$proj_staged" >/dev/null 2>&1 || true
+printf 'def fetch():\n    return 3\n' > "${proj_staged}/pkg/b.py"
+printf '%s\n' "${proj_staged}/pkg/b.py" > "${tmpdir}/staged.list"
+assert_output_contains "only the staged file is re-parsed" "Definition cache: 3 hits, 1 misses" \
+  env VIBEGUARD_STAGED_FILES="${tmpdir}/staged.list" python3 "$GUARD" "$proj_staged"
+assert_output_contains "staged file is checked against unstaged ones" "fetch:" \
+  env VIBEGUARD_STAGED_FILES="${tmpdir}/staged.list" python3 "$GUARD" "$proj_staged"
+assert_output_not_contains "duplicates without a staged file are not reported" "lone:" \
+  env VIBEGUARD_STAGED_FILES="${tmpdir}/staged.list" python3 "$GUARD" "$proj_staged"
+
+echo
+printf 'Total: %d  Pass: \033[32m%d\033[0m  Fail: \033[31m%d\033[0m\n' "$TOTAL" "$PASS" "$FAIL"
+[[ $FAIL -gt 0 ]] && exit 1 || exit 0
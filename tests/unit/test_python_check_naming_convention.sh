@@ -0,0 +1,95 @@
+#!/usr/bin/env bash
+# Unit tests for guards/python/check_naming_convention.py
+set -euo pipefail
+
+REPO_DIR="$(cd "$(dirname "$0")/../.." && pwd)"
+GUARD="${REPO_DIR}/guards/python/check_naming_convention.py"
+
+PASS=0; FAIL=0; TOTAL=0
+
+green() { printf '\033[32m  PASS: %s\033[0m\n' "$1"; }
+red()   { printf '\033[31m  FAIL: %s\033[0m\n' "$1"; }
+
+assert_ok() {
+  local desc="$1"; shift; TOTAL=$((TOTAL+1))
+  if "$@" >/dev/null 2>&1; then green "$desc"; PASS=$((PASS+1))
+  else red "$desc (expected exit 0)"; FAIL=$((FAIL+1)); fi
+}
+
+assert_fail() {
+  local desc="$1"; shift; TOTAL=$((TOTAL+1))
+  if "$@" >/dev/null 2>&1; then red "$desc (expected non-zero)"; FAIL=$((FAIL+1))
+  else green "$desc"; PASS=$((PASS+1)); fi
+}
+
+assert_output_contains() {
+  local desc="$1" expected="$2"; shift 2; TOTAL=$((TOTAL+1))
+  local out; out=$("$@" 2>&1 || true)
+  if echo "$out" | grep -qF -- "$expected"; then green "$desc"; PASS=$((PASS+1))
+  else red "$desc (missing: $expected)"; FAIL=$((FAIL+1)); fi
+}
+
+tmpdir="$(mktemp -d)"
+trap 'rm -rf "$tmpdir"' EXIT
+
+printf '\n=== check_naming_convention ===\n'
+
+if ! command -v python3 >/dev/null 2>&1; then
+  printf '\033[33m  SKIP: python3 not available\033[0m\n'
+  exit 0
+fi
+
+# --- PASS: snake_case keys ---
+proj_clean="${tmpdir}/clean"
+mkdir -p "${proj_clean}/app"
+printf 'def load(d):\n    return d.get("user_id"), d["file_id"]\n' > "${proj_clean}/app/a.py"
+assert_output_contains "snake_case keys pass" "Naming convention check passed" python3 "$GUARD" "$proj_clean"
+
+# --- FAIL: every usage shape of a known camelCase key ---
+proj_camel="${tmpdir}/camel"
+mkdir -p "${proj_camel}/app"
+cat > "${proj_camel}/app/a.py" <<'EOF'
+def load(d):
+    uid = d.get( 'userId')
+    name = d["firstName"]
+    payload = {"createdAt": 1, "jobId": 2}
+    # d.get("lastName") in a comment is fine
+    label = "pageCount"
+    return uid, name, payload, label
+EOF
+assert_fail "camelCase keys fail" python3 "$GUARD" "$proj_camel"
+assert_output_contains ".get() usage is reported" "Line 2: 'userId' -> use 'user_id'" python3 "$GUARD" "$proj_camel"
+assert_output_contains "subscript usage is reported" "Line 3: 'firstName' -> use 'first_name'" \
+  python3 "$GUARD" "$proj_camel"
+assert_output_contains "every key on a dict literal line is reported" "Line 4: 'jobId' -> use 'job_id'" \
+  python3 "$GUARD" "$proj_camel"
+assert_output_contains "issues are counted per key" "Total: 4 issues" python3 "$GUARD" "$proj_camel"
+
+# --- PASS: allowed contexts, docstrings and allowed paths ---
+proj_allowed="${tmpdir}/allowed"
+mkdir -p "${proj_allowed}/app" "${proj_allowed}/scripts"
+cat > "${proj_allowed}/app/a.py" <<'EOF'
+"""
+Example payload: {"userId": 1}
+"""
+class User(BaseModel):
+    user_id: int = Field(0, alias="userId")
+
+def dump(u):
+    return {"userId": u.user_id}
+EOF
+printf 'MAPPING = {"userId": "user_id"}\n' > "${proj_allowed}/scripts/keys.py"
+assert_ok "allowed contexts, docstrings and scripts/ pass" python3 "$GUARD" "$proj_allowed"
+
+# --- PASS: a subdirectory scan honours .gitignore files above it ---
+proj_nested="${tmpdir}/nested"
+mkdir -p "${proj_nested}/.git" "${proj_nested}/app/generated"
+printf 'def load(d):\n    return d["userId"]\n' > "${proj_nested}/app/generated/client.py"
+assert_fail "ignored path is reported before the parent .gitignore exists" python3 "$GUARD" "${proj_nested}/app"
+printf 'app/generated/\n' > "${proj_nested}/.gitignore"
+assert_output_contains "parent .gitignore excludes files from a subdirectory scan" "Naming convention check passed" \
+  python3 "$GUARD" "${proj_nested}/app"
+
+echo
+printf 'Total: %d  Pass: \033[32m%d\033[0m  Fail: \033[31m%d\033[0m\n' "$TOTAL" "$PASS" "$FAIL"
+[[ $FAIL -gt 0 ]] && exit 1 || exit 0
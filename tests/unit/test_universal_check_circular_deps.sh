@@ -25,7 +25,7 @@ assert_fail() {
 assert_output_contains() {
   local desc="$1" expected="$2"; shift 2; TOTAL=$((TOTAL+1))
   local out; out=$("$@" 2>&1 || true)
-  if echo "$out" | grep -qF "$expected"; then green "$desc"; PASS=$((PASS+1))
+  if echo "$out" | grep -qF -- "$expected"; then green "$desc"; PASS=$((PASS+1))
   else red "$desc (missing: $expected)"; FAIL=$((FAIL+1)); fi
 }
 
@@ -114,6 +114,98 @@ export function fromC() { return fromA(); }
 EOF
 assert_fail "3-node circular dep A→B→C→A fails" python3 "$GUARD" "$proj_three"
 
+# --- Overlapping cycles share one SCC; every elementary cycle is listed ---
+proj_scc="${tmpdir}/fail_overlapping"
+mkdir -p "${proj_scc}/src/a" "${proj_scc}/src/b" "${proj_scc}/src/c"
+cat > "${proj_scc}/src/a/index.ts" <<'EOF'
+import { b1 } from "../b/index";
+import { b2 } from "../b/other";
+import { c1 } from "../c/index";
+EOF
+cat > "${proj_scc}/src/b/index.ts" <<'EOF'
+import { a1 } from "../a/index";
+import { c1 } from "../c/index";
+EOF
+cat > "${proj_scc}/src/c/index.ts" <<'EOF'
+import { b1 } from "../b/index";
+import { b2 } from "../b/other";
+EOF
+assert_output_contains "overlapping cycles grouped into one SCC" "SCC 1: a, b, c (3 modules, 5 edges)" \
+  python3 "$GUARD" "$proj_scc"
+assert_output_contains "cycle through a shared node is listed" "a → c → b → a" python3 "$GUARD" "$proj_scc"
+assert_output_contains "cycle not through the first module is listed" "b → c → b" python3 "$GUARD" "$proj_scc"
+assert_output_contains "weakest edge has fewest imports and breaks most cycles" \
+  "Weakest edge: b → a (1 import, in 2 of 3 listed cycles)" python3 "$GUARD" "$proj_scc"
+assert_output_contains "--max-cycles bounds the listing" "more cycles not listed (--max-cycles 1)" \
+  python3 "$GUARD" --max-cycles 1 "$proj_scc"
+
+# --- --granularity package: monorepo packages are separate nodes ---
+proj_mono="${tmpdir}/monorepo"
+mkdir -p "${proj_mono}/packages/ui/src" "${proj_mono}/packages/core/src"
+printf '{}\n' > "${proj_mono}/packages/ui/package.json"
+printf '{}\n' > "${proj_mono}/packages/core/package.json"
+printf 'import { util } from "../../core/src/util";\n' > "${proj_mono}/packages/ui/src/button.ts"
+printf 'import { Button } from "../../ui/src/button";\n' > "${proj_mono}/packages/core/src/util.ts"
+assert_ok "top granularity collapses packages/ into one module" python3 "$GUARD" "$proj_mono"
+assert_output_contains "package granularity finds the cross-package cycle" \
+  "packages/core → packages/ui → packages/core" python3 "$GUARD" --granularity package "$proj_mono"
+assert_output_contains "file granularity resolves TS paths to files" \
+  "packages/core/src/util.ts → packages/ui/src/button.ts → packages/core/src/util.ts" \
+  python3 "$GUARD" --granularity file "$proj_mono"
+
+# --- --granularity file: Python dotted and relative imports ---
+proj_pyfile="${tmpdir}/py_file"
+mkdir -p "${proj_pyfile}/lib/app/sub"
+printf '' > "${proj_pyfile}/lib/app/__init__.py"
+printf 'from .sub import helper\nimport os\n' > "${proj_pyfile}/lib/app/main.py"
+printf 'from app.main import run\n' > "${proj_pyfile}/lib/app/sub/__init__.py"
+assert_output_contains "Python dotted and relative imports resolve to files" \
+  "lib/app/main.py → lib/app/sub/__init__.py → lib/app/main.py" \
+  python3 "$GUARD" --granularity file "$proj_pyfile"
+
+# --- --granularity file: Rust crate:: paths and mod declarations ---
+proj_rs="${tmpdir}/rust_file"
+mkdir -p "${proj_rs}/src/net"
+printf '[package]\nname = "demo"\n' > "${proj_rs}/Cargo.toml"
+printf 'mod net;\nmod store;\n' > "${proj_rs}/src/lib.rs"
+printf 'use crate::store::Store;\n' > "${proj_rs}/src/net/mod.rs"
+printf 'use crate::net::Client;\n' > "${proj_rs}/src/store.rs"
+assert_output_contains "Rust crate:: paths resolve to files" \
+  "src/net/mod.rs → src/store.rs → src/net/mod.rs" python3 "$GUARD" --granularity file "$proj_rs"
+assert_output_contains "--granularity rejects unknown modes" "--granularity expects one of" \
+  python3 "$GUARD" --granularity module "$proj_rs"
+
+# --- --jobs: pooled extraction finds the same cycles ---
+proj_jobs="${tmpdir}/jobs"
+mkdir -p "${proj_jobs}/src/moduleA" "${proj_jobs}/src/moduleB"
+for i in $(seq 1 40); do
+  printf 'import { b } from "../moduleB/f%s";\n' "$i" > "${proj_jobs}/src/moduleA/f${i}.ts"
+  printf 'import { a } from "../moduleA/f%s";\n' "$i" > "${proj_jobs}/src/moduleB/f${i}.ts"
+done
+serial_out="$(python3 "$GUARD" --jobs 1 "$proj_jobs" 2>&1 || true)"
+pooled_out="$(python3 "$GUARD" --jobs 4 "$proj_jobs" 2>&1 || true)"
+TOTAL=$((TOTAL+1))
+if [[ "$serial_out" == *"cyclic dependencies"* && "$serial_out" == "$pooled_out" ]]; then
+  green "--jobs 4 output matches --jobs 1"; PASS=$((PASS+1))
+else
+  red "--jobs 4 output differs from --jobs 1"; FAIL=$((FAIL+1))
+fi
+
+# --- Changed-files mode: graph from the persisted cache, staged cycles only ---
+proj_staged="${tmpdir}/staged"
+mkdir -p "${proj_staged}/src/a" "${proj_staged}/src/b" "${proj_staged}/src/c" "${proj_staged}/src/d"
+printf 'import { b } from "../b/index";\n' > "${proj_staged}/src/a/index.ts"
+printf 'export const b = 1;\n' > "${proj_staged}/src/b/index.ts"
+printf 'import { d } from "../d/index";\n' > "${proj_staged}/src/c/index.ts"
+printf 'import { c } from "../c/index";\n' > "${proj_staged}/src/d/index.ts"
+python3 "$GUARD" "$proj_staged" >/dev/null 2>&1 || true
+printf 'import { a } from "../a/index";\n' > "${proj_staged}/src/b/index.ts"
+printf '%s\n' "${proj_staged}/src/b/index.ts" > "${tmpdir}/staged.list"
+assert_output_contains "staged edit closes a cycle with cached files" "a → b → a" \
+  env VIBEGUARD_STAGED_FILES="${tmpdir}/staged.list" python3 "$GUARD" "$proj_staged"
+assert_output_contains "cycles without a staged file are not reported" "Found 1 cyclic dependencies in 1" \
+  env VIBEGUARD_STAGED_FILES="${tmpdir}/staged.list" python3 "$GUARD" "$proj_staged"
+
 echo
 printf 'Total: %d  Pass: \033[32m%d\033[0m  Fail: \033[31m%d\033[0m\n' "$TOTAL" "$PASS" "$FAIL"
 [[ $FAIL -gt 0 ]] && exit 1 || exit 0
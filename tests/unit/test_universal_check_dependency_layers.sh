@@ -0,0 +1,131 @@
+#!/usr/bin/env bash
+# Unit tests for guards/universal/check_dependency_layers.py
+set -euo pipefail
+
+REPO_DIR="$(cd "$(dirname "$0")/../.." && pwd)"
+GUARD="${REPO_DIR}/guards/universal/check_dependency_layers.py"
+
+PASS=0; FAIL=0; TOTAL=0
+
+green() { printf '\033[32m  PASS: %s\033[0m\n' "$1"; }
+red()   { printf '\033[31m  FAIL: %s\033[0m\n' "$1"; }
+
+assert_ok() {
+  local desc="$1"; shift; TOTAL=$((TOTAL+1))
+  if "$@" >/dev/null 2>&1; then green "$desc"; PASS=$((PASS+1))
+  else red "$desc (expected exit 0)"; FAIL=$((FAIL+1)); fi
+}
+
+assert_fail() {
+  local desc="$1"; shift; TOTAL=$((TOTAL+1))
+  if "$@" >/dev/null 2>&1; then red "$desc (expected non-zero)"; FAIL=$((FAIL+1))
+  else green "$desc"; PASS=$((PASS+1)); fi
+}
+
+assert_output_contains() {
+  local desc="$1" expected="$2"; shift 2; TOTAL=$((TOTAL+1))
+  local out; out=$("$@" 2>&1 || true)
+  if echo "$out" | grep -qF -- "$expected"; then green "$desc"; PASS=$((PASS+1))
+  else red "$desc (missing: $expected)"; FAIL=$((FAIL+1)); fi
+}
+
+tmpdir="$(mktemp -d)"
+trap 'rm -rf "$tmpdir"' EXIT
+
+printf '\n=== check_dependency_layers ===\n'
+
+if ! command -v python3 >/dev/null 2>&1; then
+  printf '\033[33m  SKIP: python3 not available\033[0m\n'
+  exit 0
+fi
+
+write_layers() {
+  cat > "$1/.vibeguard-architecture.yaml" <<'EOF'
+layers:
+  - name: domain
+    paths: ["app/domain/"]
+    allowed_deps: []
+  - name: infra
+    paths: ["app/infra/"]
+    allowed_deps: ["domain"]
+EOF
+}
+
+# --- PASS: no architecture config ---
+proj_none="${tmpdir}/pass_no_config"
+mkdir -p "$proj_none"
+assert_ok "missing config exits 0" python3 "$GUARD" "$proj_none"
+
+# --- PASS: allowed direction infra → domain ---
+proj_ok="${tmpdir}/pass_allowed"
+mkdir -p "${proj_ok}/app/domain" "${proj_ok}/app/infra"
+write_layers "$proj_ok"
+printf 'VALUE = 1\n' > "${proj_ok}/app/domain/model.py"
+printf 'from app.domain import model\n' > "${proj_ok}/app/infra/db.py"
+assert_ok "allowed infra→domain import passes" python3 "$GUARD" "$proj_ok"
+
+# --- FAIL: forbidden direction domain → infra ---
+proj_bad="${tmpdir}/fail_violation"
+mkdir -p "${proj_bad}/app/domain" "${proj_bad}/app/infra"
+write_layers "$proj_bad"
+printf 'from app.infra import db\n' > "${proj_bad}/app/domain/model.py"
+printf 'x = (\n' > "${proj_bad}/app/domain/broken.py"
+printf 'import app.domain.model\n' > "${proj_bad}/app/infra/db.py"
+assert_fail "domain→infra import fails" python3 "$GUARD" "$proj_bad"
+assert_output_contains "violation names the import" "domain → infra (import app.infra)" \
+  python3 "$GUARD" "$proj_bad"
+
+# --- Import cache: warm runs parse nothing, edits re-parse one file ---
+proj_cache="${tmpdir}/cache"
+mkdir -p "${proj_cache}/app/domain" "${proj_cache}/app/infra"
+write_layers "$proj_cache"
+printf 'VALUE = 1\n' > "${proj_cache}/app/domain/model.py"
+printf 'from app.domain import model\n' > "${proj_cache}/app/infra/db.py"
+assert_output_contains "cold run misses every file" "Import cache: 0 hits, 2 misses" \
+  python3 "$GUARD" "$proj_cache"
+assert_output_contains "warm run hits every file" "Import cache: 2 hits, 0 misses" \
+  python3 "$GUARD" "$proj_cache"
+touch "${proj_cache}/app/infra/db.py"
+assert_output_contains "touched but unchanged file is still a hit" "Import cache: 2 hits, 0 misses" \
+  python3 "$GUARD" "$proj_cache"
+printf 'from app.infra import db\n' > "${proj_cache}/app/domain/model.py"
+assert_output_contains "edited file is re-parsed" "Import cache: 1 hits, 1 misses" \
+  python3 "$GUARD" "$proj_cache"
+assert_fail "cached run still reports the new violation" python3 "$GUARD" "$proj_cache"
+assert_output_contains "--no-cache disables the cache" "Import cache: disabled" \
+  python3 "$GUARD" --no-cache "$proj_cache"
+
+# --- --jobs: pooled extraction reports the same violations in the same order ---
+proj_jobs="${tmpdir}/jobs"
+mkdir -p "${proj_jobs}/app/domain" "${proj_jobs}/app/infra"
+write_layers "$proj_jobs"
+for i in $(seq 1 80); do
+  printf 'from app.infra import db%s\n' "$i" > "${proj_jobs}/app/domain/m${i}.py"
+  printf 'import app.domain.m%s\n' "$i" > "${proj_jobs}/app/infra/db${i}.py"
+done
+serial_out="$(python3 "$GUARD" --no-cache --jobs 1 "$proj_jobs" 2>&1 || true)"
+pooled_out="$(python3 "$GUARD" --no-cache --jobs 4 "$proj_jobs" 2>&1 || true)"
+TOTAL=$((TOTAL+1))
+if [[ -n "$serial_out" && "$serial_out" == "$pooled_out" ]]; then
+  green "--jobs 4 output matches --jobs 1"; PASS=$((PASS+1))
+else
+  red "--jobs 4 output differs from --jobs 1"; FAIL=$((FAIL+1))
+fi
+assert_output_contains "--jobs rejects non-numeric values" "--jobs expects a positive integer" \
+  python3 "$GUARD" --jobs x "$proj_jobs"
+
+# --- Changed-files mode: only staged files are checked ---
+proj_staged="${tmpdir}/staged"
+mkdir -p "${proj_staged}/app/domain" "${proj_staged}/app/infra"
+write_layers "$proj_staged"
+printf 'from app.infra import db\n' > "${proj_staged}/app/domain/model.py"
+printf 'VALUE = 1\n' > "${proj_staged}/app/domain/clean.py"
+printf '%s\n' "${proj_staged}/app/domain/clean.py" > "${tmpdir}/staged.list"
+assert_ok "unstaged violation does not fail a commit of clean files" \
+  env VIBEGUARD_STAGED_FILES="${tmpdir}/staged.list" python3 "$GUARD" "$proj_staged"
+printf '%s\n' "${proj_staged}/app/domain/model.py" > "${tmpdir}/staged.list"
+assert_fail "staged violation fails" env VIBEGUARD_STAGED_FILES="${tmpdir}/staged.list" python3 "$GUARD" "$proj_staged"
+
+echo
+printf 'Total: %d  Pass: \033[32m%d\033[0m  Fail: \033[31m%d\033[0m\n' "$TOTAL" "$PASS" "$FAIL"
+[[ $FAIL -gt 0 ]] && exit 1 || exit 0
@@ -24,7 +24,53 @@ pub fn run(args: &[String]) -> Result {
 
     let options = model::parse_observe_args(args)?;
     let mut log_events = read::read_log_events(&options)?;
-    let cutoff_secs = options.window.cutoff_secs(now_unix_secs());
+    let now_secs = now_unix_secs();
+    let output = match options.command {
+        model::ObserveCommand::Summary => {
+            let aggregate = select_events(&options, now_secs, &mut log_events);
+            render::render_summary(&options, &log_events, &aggregate)
+        }
+        model::ObserveCommand::Health => {
+            let aggregate = select_events(&options, now_secs, &mut log_events);
+            render::render_health(&options, &log_events, &aggregate)
+        }
+        model::ObserveCommand::Session => {
+            let aggregate = select_events(&options, now_secs, &mut log_events);
+            render::render_session(&options, &log_events, &aggregate)
+        }
+        model::ObserveCommand::Batch => {
+            // One read of the log serves both commands, each with its own window.
+            // Windows are "at or after a cutoff", so they nest: select the wider
+            // one, render it, then narrow the same events for the other.
+            let mut batch_options = [
+                options.for_batch_command(model::ObserveCommand::Summary),
+                options.for_batch_command(model::ObserveCommand::Health),
+            ];
+            batch_options.sort_by_key(|options| options.window.cutoff_secs(now_secs));
+            let mut sections = Vec::with_capacity(batch_options.len());
+            for section_options in &batch_options {
+                let aggregate = select_events(section_options, now_secs, &mut log_events);
+                sections.push(render::observe_batch_section(
+                    section_options,
+                    &log_events,
+                    &aggregate,
+                ));
+            }
+            render::render_batch(sections)
+        }
+    }?;
+    print!("{output}");
+    Ok(())
+}
+
+/// Narrows the events to the command's time window (and session) in
+/// timestamp order and returns their aggregate.
+fn select_events(
+    options: &model::ObserveOptions,
+    now_secs: u64,
+    log_events: &mut read::LogEvents,
+) -> aggregate::ObserveAggregate {
+    let cutoff_secs = options.window.cutoff_secs(now_secs);
     log_events
         .events
         .retain(|event| read::event_passes_time_window(event, cutoff_secs));
@@ -41,13 +87,5 @@ pub fn run(args: &[String]) -> Result {
                     .cmp(&aggregate::observe_string_field(right, field::HOOK))
             })
     });
-
-    let aggregate = aggregate::aggregate_events(&log_events.events, options.slow_ms);
-    let output = match options.command {
-        model::ObserveCommand::Summary => render::render_summary(&options, &log_events, &aggregate),
-        model::ObserveCommand::Health => render::render_health(&options, &log_events, &aggregate),
-        model::ObserveCommand::Session => render::render_session(&options, &log_events, &aggregate),
-    }?;
-    print!("{output}");
-    Ok(())
+    aggregate::aggregate_events(&log_events.events, options.slow_ms)
 }
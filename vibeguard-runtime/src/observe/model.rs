@@ -9,6 +9,7 @@ pub(super) enum ObserveCommand {
     Summary,
     Health,
     Session,
+    Batch,
 }
 
 #[derive(Clone, Copy, Debug)]
@@ -36,7 +37,7 @@ impl TimeWindow {
     }
 }
 
-#[derive(Debug)]
+#[derive(Clone, Debug)]
 pub(super) struct ObserveOptions {
     pub(super) command: ObserveCommand,
     pub(super) json: bool,
@@ -54,7 +55,7 @@ pub(super) struct ObserveOptions {
 impl ObserveOptions {
     fn new(command: ObserveCommand) -> Self {
         let window = match command {
-            ObserveCommand::Summary => TimeWindow::Days(7),
+            ObserveCommand::Summary | ObserveCommand::Batch => TimeWindow::Days(7),
             ObserveCommand::Health => TimeWindow::Hours(24),
             ObserveCommand::Session => TimeWindow::All,
         };
@@ -72,6 +73,18 @@ impl ObserveOptions {
             session: None,
         }
     }
+
+    /// JSON options for one command of `observe batch`. Summary keeps the
+    /// batch's `--days`/`--hours` window; the others use their own default.
+    pub(super) fn for_batch_command(&self, command: ObserveCommand) -> Self {
+        let mut options = self.clone();
+        options.command = command;
+        options.json = true;
+        if !matches!(command, ObserveCommand::Summary) {
+            options.window = Self::new(command).window;
+        }
+        options
+    }
 }
 
 pub(super) fn parse_observe_args(args: &[String]) -> Result<ObserveOptions> {
@@ -81,6 +94,7 @@ pub(super) fn parse_observe_args(args: &[String]) -> Result<ObserveOptions> {
     match command_name.as_str() {
         "summary" => parse_command(ObserveCommand::Summary, None, &args[1..]),
         "health" => parse_command(ObserveCommand::Health, None, &args[1..]),
+        "batch" => parse_command(ObserveCommand::Batch, None, &args[1..]),
         "session" => {
             let session = args
                 .get(1)
@@ -200,7 +214,7 @@ fn parse_hours_window(value: &str) -> Result<TimeWindow> {
 }
 
 fn usage() -> &'static str {
-    "Usage: vibeguard-runtime observe <summary|health|session|export prometheus> [--json] [--scope project|global] [--project PATH_OR_HASH] [--log-file PATH] [--days N|all] [--hours N|all] [--limit N|all] [--slow-ms MS] [--top N]"
+    "Usage: vibeguard-runtime observe <summary|health|batch|session|export prometheus> [--json] [--scope project|global] [--project PATH_OR_HASH] [--log-file PATH] [--days N|all] [--hours N|all] [--limit N|all] [--slow-ms MS] [--top N]"
 }
 
 #[cfg(test)]
@@ -223,6 +237,21 @@ mod tests {
         assert_eq!(options.window.label(), "last 7 days");
     }
 
+    #[test]
+    fn batch_keeps_summary_window_and_health_default() {
+        let options = match parse_observe_args(&args(&["batch", "--days", "30"])) {
+            Ok(options) => options,
+            Err(error) => panic!("batch options should parse: {error}"),
+        };
+
+        assert!(matches!(options.command, ObserveCommand::Batch));
+        let summary = options.for_batch_command(ObserveCommand::Summary);
+        let health = options.for_batch_command(ObserveCommand::Health);
+        assert!(summary.json && health.json);
+        assert_eq!(summary.window.label(), "last 30 days");
+        assert_eq!(health.window.label(), "last 24 hours");
+    }
+
     #[test]
     fn session_accepts_id_and_common_options() {
         let options = match parse_observe_args(&args(&[
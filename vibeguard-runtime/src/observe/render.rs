@@ -35,26 +35,62 @@ pub(super) fn render_health(
     log_events: &LogEvents,
     aggregate: &ObserveAggregate,
 ) -> Result<String> {
-    let attention_states = observe_recent_events_json(
+    if options.json {
+        return Ok(format!(
+            "{}\n",
+            serde_json::to_string_pretty(&observe_health_json(options, log_events, aggregate))?
+        ));
+    }
+    render_health_human(options, log_events, aggregate)
+}
+
+/// The batch section for one command: its name and its `--json` output.
+pub(super) fn observe_batch_section(
+    options: &ObserveOptions,
+    log_events: &LogEvents,
+    aggregate: &ObserveAggregate,
+) -> (&'static str, Value) {
+    let section = match options.command {
+        ObserveCommand::Health => observe_health_json(options, log_events, aggregate),
+        _ => observe_summary_json(options, log_events, aggregate),
+    };
+    (observe_command_name(options.command), section)
+}
+
+/// One JSON document with the summary and health output for the same log read.
+pub(super) fn render_batch(sections: Vec<(&'static str, Value)>) -> Result<String> {
+    let mut output = Map::new();
+    output.insert("schema_version".to_string(), json!(OBSERVE_SCHEMA_VERSION));
+    output.insert("command".to_string(), json!("batch"));
+    for (name, section) in sections {
+        output.insert(name.to_string(), section);
+    }
+    Ok(format!(
+        "{}\n",
+        serde_json::to_string_pretty(&Value::Object(output))?
+    ))
+}
+
+fn observe_health_json(
+    options: &ObserveOptions,
+    log_events: &LogEvents,
+    aggregate: &ObserveAggregate,
+) -> Value {
+    let mut output = observe_summary_json(options, log_events, aggregate);
+    output["command"] = json!("health");
+    output["attention_states"] = Value::Array(observe_recent_events_json(
         &log_events.events,
         options.top,
         observe_is_attention_state,
         options.slow_ms,
-    );
-    let diagnostics = observe_recent_events_json(
+    ));
+    output["diagnostics"] = Value::Array(observe_recent_events_json(
         &log_events.events,
         options.top,
         observe_is_diagnostic_event,
         options.slow_ms,
-    );
-    if options.json {
-        let mut output = observe_summary_json(options, log_events, aggregate);
-        output["command"] = json!("health");
-        output["attention_states"] = Value::Array(attention_states);
-        output["diagnostics"] = Value::Array(diagnostics);
-        return Ok(format!("{}\n", serde_json::to_string_pretty(&output)?));
-    }
-    render_health_human(options, log_events, aggregate)
+    ));
+    output
 }
 
 fn render_health_human(
@@ -328,6 +364,7 @@ fn observe_command_name(command: ObserveCommand) -> &'static str {
         ObserveCommand::Summary => "summary",
         ObserveCommand::Health => "health",
         ObserveCommand::Session => "session",
+        ObserveCommand::Batch => "batch",
     }
 }
 
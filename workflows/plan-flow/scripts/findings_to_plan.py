@@ -1,9 +1,14 @@
 #!/usr/bin/env python3
-"""Generate a docs/plan draft from redundancy scan findings."""
+"""Generate a docs/plan draft from redundancy scan findings.
+
+Findings come from the redundancy scan markdown report and/or the JSON report
+of `guards/python/check_duplicates.py --format json` (--findings-json).
+"""
 
 from __future__ import annotations
 
 import argparse
+import json
 import re
 import subprocess
 import sys
@@ -38,6 +43,7 @@ class Finding:
     priority_score: int
     phase: str
     canonical_hint: str
+    similarity: float | None = None
 
 
 def read_scan_report(
@@ -85,6 +91,62 @@ def parse_sections(report_text: str) -> tuple[List[str], List[str], List[str]]:
     return duplicate_lines, factory_lines, legacy_lines
 
 
+def read_findings_json(path: Path) -> List[Finding]:
+    """Findings from `check_duplicates.py --format json`."""
+    data = json.loads(path.read_text(encoding="utf-8"))
+    if not isinstance(data, dict) or not isinstance(data.get("findings"), list):
+        raise ValueError(f"Not a check_duplicates JSON report: {path}")
+
+    findings: List[Finding] = []
+    for item in data["findings"]:
+        locations = item.get("locations") or []
+        files: List[str] = []
+        evidence: List[str] = []
+        for location in locations:
+            path_text = location.get("path", "")
+            if path_text and path_text not in files:
+                files.append(path_text)
+            line = location.get("line")
+            where = f"{path_text}:{line}" if line else path_text
+            evidence.append(f"{where} `{location.get('name', '')}`")
+
+        symbol = item.get("symbol")
+        similarity = item.get("similarity")
+        if item.get("category") in ("identical-body", "near-duplicate-body"):
+            category = "duplicate-body"
+            names = ", ".join(f"`{location.get('name', '')}`" for location in locations[:3])
+            if item.get("category") == "identical-body":
+                title = f"Merge structurally identical bodies {names}"
+            else:
+                title = f"Merge near-duplicate bodies {names} (similarity {similarity:.2f})"
+            hint = "Extract one shared definition and parameterize the differences."
+        else:
+            category = "same-concept multi-def"
+            title = f"Convergence repetition type `{symbol}` definition"
+            hint = f"Select one canonical `{symbol}` owner and adapt callers."
+
+        findings.append(
+            Finding(
+                finding_id="",
+                step_id="",
+                category=category,
+                title=title,
+                symbol=symbol,
+                files=files,
+                evidence=evidence[:3],
+                impact="high" if len(locations) >= 3 else "medium",
+                effort=0,
+                risk="medium",
+                confidence=0,
+                priority_score=0,
+                phase="P2",
+                canonical_hint=hint,
+                similarity=similarity,
+            )
+        )
+    return findings
+
+
 def extract_files(evidence_lines: Sequence[str]) -> List[str]:
     files: List[str] = []
     for line in evidence_lines:
@@ -248,16 +310,24 @@ def estimate_effort(category: str, file_count: int) -> int:
         if file_count == 3:
             return 4
         return 5
+    if category == "duplicate-body":
+        return 2 if file_count <= 1 else 3
     if category == "parallel-implementation":
         return 2 if file_count <= 1 else 3
     return 1 if file_count <= 1 else 2
 
 
-def estimate_confidence(category: str, evidence_count: int, file_count: int) -> int:
+def estimate_confidence(
+    category: str, evidence_count: int, file_count: int, similarity: float | None = None
+) -> int:
     if category == "same-concept multi-def":
         if file_count >= 2 and evidence_count >= 2:
             return 5
         return 4
+    if category == "duplicate-body":
+        if similarity is None or similarity >= 0.95:
+            return 5
+        return 4 if similarity >= 0.85 else 3
     if category == "parallel-implementation":
         return 3 if evidence_count >= 1 else 2
     return 3 if evidence_count >= 1 else 2
@@ -269,7 +339,7 @@ def enrich_and_sort_findings(findings: List[Finding]) -> None:
         risk_score = label_score(finding.risk)
         finding.effort = estimate_effort(finding.category, len(finding.files))
         finding.confidence = estimate_confidence(
-            finding.category, len(finding.evidence), len(finding.files)
+            finding.category, len(finding.evidence), len(finding.files), finding.similarity
         )
         finding.priority_score = (impact_score * finding.confidence) - (
             finding.effort + risk_score
@@ -471,6 +541,11 @@ def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Generate a docs/plan draft from scan findings.")
     parser.add_argument("--scan-report", type=Path, help="Path to markdown scan report.")
     parser.add_argument("--target-dir", help="Target dir for running redundancy scan (e.g. src).")
+    parser.add_argument(
+        "--findings-json",
+        type=Path,
+        help="JSON report from `check_duplicates.py --format json` (with or without a scan report).",
+    )
     parser.add_argument("--output", type=Path, required=True, help="Output plan file path.")
     parser.add_argument("--task-name", default="Redundant design convergence", help="Plan title.")
     parser.add_argument("--repo-path", type=Path, default=Path.cwd(), help="Repository root path.")
@@ -481,8 +556,8 @@ def parse_args() -> argparse.Namespace:
 def main() -> int:
     args = parse_args()
 
-    if args.scan_report is None and args.target_dir is None:
-        print("[ERR] Provide either --scan-report or --target-dir.")
+    if args.scan_report is None and args.target_dir is None and args.findings_json is None:
+        print("[ERR] Provide --scan-report, --target-dir or --findings-json.")
         return 1
 
     repo_path = args.repo_path.resolve()
@@ -490,14 +565,27 @@ def main() -> int:
         print(f"[ERR] Scan report not found: {args.scan_report}")
         return 1
 
-    try:
-        report_text = read_scan_report(repo_path, args.scan_report, args.target_dir)
-    except (ValueError, FileNotFoundError, subprocess.CalledProcessError) as exc:
-        print(f"[ERR] Failed to get scan report: {exc}")
-        return 1
+    json_findings: List[Finding] = []
+    if args.findings_json is not None:
+        if not args.findings_json.exists():
+            print(f"[ERR] Findings JSON not found: {args.findings_json}")
+            return 1
+        try:
+            json_findings = read_findings_json(args.findings_json)
+        except (ValueError, KeyError, TypeError, AttributeError) as exc:
+            print(f"[ERR] Failed to read findings JSON: {exc}")
+            return 1
+
+    report_text = ""
+    if args.scan_report is not None or args.target_dir is not None:
+        try:
+            report_text = read_scan_report(repo_path, args.scan_report, args.target_dir)
+        except (ValueError, FileNotFoundError, subprocess.CalledProcessError) as exc:
+            print(f"[ERR] Failed to get scan report: {exc}")
+            return 1
 
     duplicate_lines, factory_lines, legacy_lines = parse_sections(report_text)
-    duplicate_findings = parse_duplicate_findings(duplicate_lines)
+    duplicate_findings = parse_duplicate_findings(duplicate_lines) + json_findings
     factory_findings = parse_single_line_findings(
         factory_lines,
         category="parallel-implementation",